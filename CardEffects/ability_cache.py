@@ -0,0 +1,202 @@
+import hashlib
+import json
+import os
+from enum import Enum
+from typing import Any, Dict, Iterable, List, Optional
+
+from CardEffects.ability import Ability, AbilityCost, Effect
+from CardEffects.ability_parser import PARSER_VERSION, parse_abilities
+from CardEffects.effects_Definitions import EffectType, TargetType, TriggerCondition
+
+'''
+Persistent, content-addressed cache of parse_abilities() results.
+
+Entries are keyed by a hash of (Body_Text, Abilities, PARSER_VERSION), so a card is only
+re-parsed when its text changes or the parser is bumped. The Ability/Effect/AbilityCost
+trees are stored as JSON with enums written by name.
+'''
+
+DEFAULT_CACHE_FILENAME = "ability_cache.json"
+
+_ENUMS = {cls.__name__: cls for cls in (TriggerCondition, EffectType, TargetType)}
+
+
+def ability_cache_key(body_text: Optional[str], abilities_text: Optional[str],
+                      parser_version: int = PARSER_VERSION) -> str:
+    """Returns the cache key for a card's rules text under the given parser version."""
+    payload = json.dumps([body_text, abilities_text, parser_version], ensure_ascii=False)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+
+# --- Serialization ---
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, Effect):
+        return {"__effect__": effect_to_dict(value)}
+    if isinstance(value, Enum):
+        return {"__enum__": f"{type(value).__name__}.{value.name}"}
+    if isinstance(value, list):
+        return [_encode_value(item) for item in value]
+    if isinstance(value, dict):
+        return {key: _encode_value(item) for key, item in value.items()}
+    return value
+
+
+def _decode_value(value: Any) -> Any:
+    if isinstance(value, dict):
+        if "__effect__" in value:
+            return effect_from_dict(value["__effect__"])
+        if "__enum__" in value:
+            enum_name, member = value["__enum__"].split(".", 1)
+            return _ENUMS[enum_name][member]
+        return {key: _decode_value(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_decode_value(item) for item in value]
+    return value
+
+
+def effect_to_dict(effect: Effect) -> Dict[str, Any]:
+    return {
+        "effect_type": effect.effect_type.name,
+        "target": effect.target.name,
+        "parameters": _encode_value(effect.parameters),
+        }
+
+
+def effect_from_dict(data: Dict[str, Any]) -> Effect:
+    return Effect(
+            effect_type=EffectType[data["effect_type"]],
+            target=TargetType[data["target"]],
+            parameters=_decode_value(data["parameters"]),
+            )
+
+
+def ability_to_dict(ability: Ability) -> Dict[str, Any]:
+    return {
+        "trigger": ability.trigger.name,
+        "effects": [effect_to_dict(effect) for effect in ability.effects],
+        "cost": vars(ability.cost).copy() if ability.cost else None,
+        "source_text": ability.source_text,
+        "is_dynamic": ability.is_dynamic,
+        }
+
+
+def ability_from_dict(data: Dict[str, Any]) -> Ability:
+    return Ability(
+            trigger=TriggerCondition[data["trigger"]],
+            effects=[effect_from_dict(effect) for effect in data["effects"]],
+            cost=AbilityCost(**data["cost"]) if data["cost"] else None,
+            source_text=data["source_text"],
+            is_dynamic=data["is_dynamic"],
+            )
+
+
+class AbilityCache:
+    """On-disk cache of parsed abilities, keyed by card text hash."""
+
+    def __init__(self, path: str = DEFAULT_CACHE_FILENAME):
+        """
+        Loads the cache file if it exists.
+
+        Args:
+            path: Location of the JSON cache file.
+        """
+        self.path = path
+        self.entries: Dict[str, List[Dict[str, Any]]] = {}
+        self.hits = 0
+        self.misses = 0
+        self._dirty = False
+        self._used_keys = set()
+
+        if os.path.exists(path):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                if data.get("parser_version") == PARSER_VERSION:
+                    self.entries = data.get("entries", {})
+                else:
+                    # Every key changes with the parser version, so old entries can never hit again
+                    print(f"Ability cache '{path}' was written by parser version "
+                          f"{data.get('parser_version')}. Re-parsing all cards.")
+                    self._dirty = True
+            except (json.JSONDecodeError, IOError, AttributeError) as e:
+                print(f"Error loading ability cache '{path}': {e}. Starting with an empty cache.")
+
+    def get_abilities(self, body_text: Optional[str], abilities_text: Optional[str]) -> List[Ability]:
+        """
+        Returns the parsed abilities for a card's text, parsing and storing them on a cache miss.
+
+        Args:
+            body_text: The card's Body_Text.
+            abilities_text: The card's Abilities field.
+        """
+        key = ability_cache_key(body_text, abilities_text)
+        self._used_keys.add(key)
+        cached = self.entries.get(key)
+        if cached is not None:
+            self.hits += 1
+            return [ability_from_dict(data) for data in cached]
+
+        self.misses += 1
+        abilities = parse_abilities(body_text, abilities_text)
+        self.entries[key] = [ability_to_dict(ability) for ability in abilities]
+        self._dirty = True
+        return abilities
+
+    def discard(self, body_text: Optional[str], abilities_text: Optional[str]) -> None:
+        """Drops the entry for a card's text (e.g. after the card was changed upstream)."""
+        if self.entries.pop(ability_cache_key(body_text, abilities_text), None) is not None:
+            self._dirty = True
+
+    def discard_card_data(self, card_data: Dict[str, Any]) -> None:
+        """Drops the entry for a raw card dictionary, normalising its text the same way Card does."""
+        raw_abilities = card_data.get("Abilities")
+        abilities_text = ", ".join(a.strip() for a in raw_abilities.split(',')) if raw_abilities else None
+        self.discard(card_data.get("Body_Text") or None, abilities_text)
+
+    def save(self, prune_unused: bool = False) -> None:
+        """
+        Writes the cache back to disk if anything changed.
+
+        Args:
+            prune_unused: Drop entries that were not requested since the cache was loaded
+                          (use after a full catalog load to forget cards whose text changed).
+        """
+        if prune_unused:
+            unused = set(self.entries) - self._used_keys
+            for key in unused:
+                del self.entries[key]
+            self._dirty = self._dirty or bool(unused)
+        if not self._dirty:
+            return
+
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({"parser_version": PARSER_VERSION, "entries": self.entries}, f,
+                          ensure_ascii=False, separators=(',', ':'))
+            os.replace(tmp_path, self.path)
+            self._dirty = False
+        except IOError as e:
+            print(f"Error saving ability cache '{self.path}': {e}")
+
+
+def attach_parsed_abilities(cards: Iterable, cache_path: str = DEFAULT_CACHE_FILENAME,
+                            prune_unused: bool = False) -> AbilityCache:
+    """
+    Sets card.parsed_abilities for every card, reusing cached parse results where the text is unchanged.
+
+    Args:
+        cards: Card objects (anything with body_text and abilities attributes).
+        cache_path: Location of the JSON cache file.
+        prune_unused: Forget cached entries not used by these cards (pass True for full catalog loads).
+
+    Returns:
+        The AbilityCache used (its hits/misses counters describe the load).
+    """
+    cache = AbilityCache(cache_path)
+    for card in cards:
+        abilities_text = ", ".join(card.abilities) if card.abilities else None
+        card.parsed_abilities = cache.get_abilities(card.body_text or None, abilities_text)
+    cache.save(prune_unused=prune_unused)
+    return cache
@@ -4,6 +4,10 @@ from typing import List, Optional, Dict, Any
 from CardEffects.ability import Ability, AbilityCost, Effect
 from CardEffects.effects_Definitions import EffectType, TargetType, TriggerCondition
 
+# Bump whenever a pattern or handler change alters parse_abilities() output,
+# so cached parse results (see ability_cache.py) are re-parsed.
+PARSER_VERSION = 1
+
 # --- Regex Patterns for parsing costs ---
 EXERT_COST_REGEX = re.compile(r"{e}", re.IGNORECASE)
 INK_COST_REGEX = re.compile(r"(?P<ink_cost>\d+)\s*{i}", re.IGNORECASE)
@@ -17,16 +21,18 @@ OPTIMIZED_PATTERNS = [
                 ),
         "trigger": TriggerCondition.ACTIVATED,
         "has_cost": True,
+        "leading_words": None,  # Any chunk containing '-' (see classify_chunk)
         },
     
     # All "When/Whenever" triggered abilities
     {
         "regex": re.compile(
-                r"^(When|Whenever) (you play this character|this character (quests|challenges another character|is challenged|is banished|moves to a location|sings a song)|one of your (other )?characters (is banished|sings a song)|you ready this character|one or more of your characters sings a song|an opponent plays a song|a character with \d+ strength or more challenge another character),?\s*(?P<effect_text>.*)",
+                r"^(When|Whenever) (?P<trigger_key>you play this character|this character (quests|challenges another character|is challenged|is banished|moves to a location|sings a song)|one of your (other )?characters (is banished|sings a song)|you ready this character|one or more of your characters sings a song|an opponent plays a song|a character with \d+ strength or more challenge another character),?\s*(?P<effect_text>.*)",
                 re.IGNORECASE | re.DOTALL,
                 ),
         "trigger": TriggerCondition.DYNAMIC_TRIGGER,
         "has_cost": False,
+        "leading_words": ("when",),
         "dynamic_mapping": {
             "you play this character": TriggerCondition.ON_PLAY,
             "this character quests": TriggerCondition.ON_QUEST,
@@ -47,11 +53,12 @@ OPTIMIZED_PATTERNS = [
     # Time-based triggers (start/end of turn)
     {
         "regex": re.compile(
-                r"^At the (start|end) of your turn,?\s*(?P<effect_text>.*)",
+                r"^At the (?P<trigger_key>start|end) of your turn,?\s*(?P<effect_text>.*)",
                 re.IGNORECASE | re.DOTALL,
                 ),
         "trigger": TriggerCondition.DYNAMIC_TURN_TRIGGER,
         "has_cost": False,
+        "leading_words": ("at",),
         "dynamic_mapping": {
             "start": TriggerCondition.START_OF_TURN,
             "end": TriggerCondition.END_OF_TURN,
@@ -61,11 +68,12 @@ OPTIMIZED_PATTERNS = [
     # Conditional phrases (During/While)
     {
         "regex": re.compile(
-                r"^(During|While) (your turn|an opponent's turn|this character is at a location|this character is exerted|this character (?P<condition>.*?)),?\s*(?P<effect_text>.*)",
+                r"^(During|While) (?P<trigger_key>your turn|an opponent's turn|this character is at a location|this character is exerted|this character (?P<condition>.*?)),?\s*(?P<effect_text>.*)",
                 re.IGNORECASE | re.DOTALL,
                 ),
         "trigger": TriggerCondition.DYNAMIC_CONDITION,
         "has_cost": False,
+        "leading_words": ("during", "while"),
         "dynamic_mapping": {
             "your turn": TriggerCondition.ON_YOUR_TURN,
             "an opponent's turn": TriggerCondition.DURING_TURN,
@@ -81,6 +89,7 @@ OPTIMIZED_PATTERNS = [
                 ),
         "trigger": TriggerCondition.ONCE_PER_TURN,
         "has_cost": False,
+        "leading_words": ("once",),
         },
     
     # Single and multiple keywords
@@ -91,6 +100,8 @@ OPTIMIZED_PATTERNS = [
                 ),
         "trigger": TriggerCondition.DYNAMIC_KEYWORD,
         "has_cost": False,
+        "leading_words": ("evasive", "bodyguard", "rush", "ward", "vanish", "support", "challenger", "resist",
+                          "sing", "shift", "reckless"),
         "dynamic_handler": "handle_keywords",
         },
     
@@ -102,6 +113,7 @@ OPTIMIZED_PATTERNS = [
                 ),
         "trigger": TriggerCondition.DYNAMIC_BONUS,
         "has_cost": False,
+        "leading_words": ("your", "this", "chosen"),
         "dynamic_handler": "handle_character_bonus",
         },
     
@@ -113,16 +125,18 @@ OPTIMIZED_PATTERNS = [
                 ),
         "trigger": TriggerCondition.CONDITIONAL_EFFECT,
         "has_cost": False,
+        "leading_words": ("if", "while"),
         },
     
     # Enters play and other similar effects
     {
         "regex": re.compile(
-                r"^This character (enters play|can't be challenged) (?P<effect_text>.*)?",
+                r"^This character (?P<trigger_key>enters play|can't be challenged) (?P<effect_text>.*)?",
                 re.IGNORECASE | re.DOTALL,
                 ),
         "trigger": TriggerCondition.DYNAMIC_CHARACTER_STATE,
         "has_cost": False,
+        "leading_words": ("this",),
         "dynamic_mapping": {
             "enters play": TriggerCondition.ENTERS_PLAY_EFFECT,
             "can't be challenged": TriggerCondition.PROTECTION_CHALLENGE,
@@ -137,6 +151,7 @@ OPTIMIZED_PATTERNS = [
                 ),
         "trigger": TriggerCondition.STATIC_COST_MODIFIER,
         "has_cost": False,
+        "leading_words": ("for", "sing"),
         "dynamic_mapping": {
             "For each": TriggerCondition.COST_REDUCTION,
             "Sing Together": TriggerCondition.SING_TOGETHER,
@@ -151,6 +166,7 @@ OPTIMIZED_PATTERNS = [
                 ),
         "trigger": TriggerCondition.SIMPLE_ACTION_EFFECT,
         "has_cost": False,
+        "leading_words": ("deal", "remove", "draw", "banish", "chosen", "discard", "put"),
         },
     
     # Named character effects
@@ -161,16 +177,18 @@ OPTIMIZED_PATTERNS = [
                 ),
         "trigger": TriggerCondition.NAMED_CHARACTER_EFFECT,
         "has_cost": False,
+        "leading_words": ("your",),
         },
     
     # Win condition modifier
     {
         "regex": re.compile(
-                r"^Opponents (need \d+ lore to win the game|can't play actions)\.",
+                r"^Opponents (?P<trigger_key>need \d+ lore to win the game|can't play actions)\.",
                 re.IGNORECASE | re.DOTALL
                 ),
         "trigger": TriggerCondition.DYNAMIC_PREVENTION,
         "has_cost": False,
+        "leading_words": ("opponents",),
         "dynamic_mapping": {
             "need": TriggerCondition.WIN_CONDITION_MODIFIER,
             "can't play actions": TriggerCondition.PREVENT_PLAY,
@@ -182,9 +200,65 @@ OPTIMIZED_PATTERNS = [
         "regex": re.compile(r"^(?P<effect_text>.*)", re.IGNORECASE | re.DOTALL),
         "trigger": TriggerCondition.CONTINUOUS,
         "has_cost": False,
+        "leading_words": None,  # Always a candidate
         },
     ]
 
+# --- Trigger classification ---
+# Every pattern after the activated one is anchored on literal leading words, so a chunk can
+# only match patterns whose leading word begins the chunk's first run of letters. classify_chunk
+# looks that run up once and returns just those patterns, in OPTIMIZED_PATTERNS order, so the
+# first match is the same one a scan of the whole list would find.
+_ACTIVATED_PATTERN = OPTIMIZED_PATTERNS[0]
+_CATCH_ALL_PATTERN = OPTIMIZED_PATTERNS[-1]
+_LEADING_RUN_REGEX = re.compile(r"[a-z]*")
+_CANDIDATES_BY_LEADING_RUN: Dict[str, tuple] = {}
+
+# Triggers resolved from the pattern's trigger_key group via its dynamic_mapping
+_MAPPED_TRIGGERS = frozenset((TriggerCondition.DYNAMIC_TRIGGER, TriggerCondition.DYNAMIC_TURN_TRIGGER,
+                              TriggerCondition.DYNAMIC_CONDITION, TriggerCondition.DYNAMIC_CHARACTER_STATE,
+                              TriggerCondition.DYNAMIC_PREVENTION))
+
+
+def _candidates_for_leading_run(leading_run: str) -> tuple:
+    """The patterns (after the activated one) a chunk starting with leading_run can match."""
+    candidates = _CANDIDATES_BY_LEADING_RUN.get(leading_run)
+    if candidates is None:
+        candidates = tuple(pattern for pattern in OPTIMIZED_PATTERNS[1:-1]
+                           if any(leading_run.startswith(word) for word in pattern['leading_words']))
+        candidates += (_CATCH_ALL_PATTERN,)
+        _CANDIDATES_BY_LEADING_RUN[leading_run] = candidates
+    return candidates
+
+
+def classify_chunk(chunk: str) -> tuple:
+    """
+    Returns the OPTIMIZED_PATTERNS entries worth trying on an ability chunk, in priority order.
+
+    Any chunk containing '-' matches the activated ability pattern first, so it is the only
+    candidate. Otherwise the candidates are picked by the chunk's leading word and always end
+    with the catch-all pattern.
+    """
+    if '-' in chunk:
+        return (_ACTIVATED_PATTERN,)
+    return _candidates_for_leading_run(_LEADING_RUN_REGEX.match(chunk.lower()).group())
+
+
+def map_dynamic_trigger(pattern: Dict[str, Any], match: re.Match) -> TriggerCondition:
+    """
+    Resolves a DYNAMIC_* trigger from the text its pattern matched in the trigger_key group.
+
+    Keys are looked up directly; keys that only start the phrase ("a character with",
+    "need") are tried as prefixes. Phrases without a mapping keep the pattern's trigger.
+    """
+    mapping = pattern['dynamic_mapping']
+    key_text = match.group('trigger_key').lower()
+    mapped = mapping.get(key_text)
+    if mapped is None:
+        mapped = next((trigger for key, trigger in mapping.items() if key_text.startswith(key)),
+                      pattern['trigger'])
+    return mapped
+
 # --- Effect Parsing Patterns ---
 EFFECT_PATTERNS = [
     # Draw cards
@@ -192,74 +266,104 @@ EFFECT_PATTERNS = [
         'regex': re.compile(r"(you may )?(draw|Draw) (?P<amount>\d+|a) card", re.IGNORECASE),
         'effect_type': EffectType.DRAW_CARD,
         'target': TargetType.SELF_PLAYER,
-        'params': {'amount': 1}
+        'params': {'amount': 1},
+        'anchors': ("draw",)
         },
     
     # Gain lore
     {
         'regex': re.compile(r"gain (?P<amount>\d+) lore", re.IGNORECASE),
         'effect_type': EffectType.GAIN_LORE,
-        'target': TargetType.SELF_PLAYER
+        'target': TargetType.SELF_PLAYER,
+        'anchors': ("lore",)
         },
     
     # Lose lore
     {
         'regex': re.compile(r"(each opponent |opponents )?(loses|lose) (?P<amount>\d+) lore", re.IGNORECASE),
         'effect_type': EffectType.LOSE_LORE,
-        'target': TargetType.OPPONENT_PLAYER
+        'target': TargetType.OPPONENT_PLAYER,
+        'anchors': ("lose",)
         },
     
     # Deal damage
     {
         'regex': re.compile(r"deal (?P<amount>\d+) damage to chosen (?P<target_type>character|location)", re.IGNORECASE),
-        'effect_type': EffectType.DEAL_DAMAGE
+        'effect_type': EffectType.DEAL_DAMAGE,
+        'anchors': ("damage",)
         },
     
     # Heal damage
     {
         'regex': re.compile(r"remove( up to)? (?P<amount>\d+) damage from chosen (?P<target_type>character|location)", re.IGNORECASE),
-        'effect_type': EffectType.HEAL_DAMAGE
+        'effect_type': EffectType.HEAL_DAMAGE,
+        'anchors': ("remove",)
         },
     
     # Stat modification
     {
         'regex': re.compile(r"(gets|get|gains|gain) (?P<mod>[+\-]\d+) ((\{(?P<stat>[swl])})|((?P<stat_text>strength|willpower|lore)))", re.IGNORECASE),
         'effect_type': EffectType.MODIFY_STATS,
-        'target': TargetType.SELF_CARD
+        'target': TargetType.SELF_CARD,
+        'anchors': ("get", "gain")
         },
     
     # Add keyword
     {
         'regex': re.compile(r"(gains|gain) (?P<keyword>Challenger \+\d+|Resist \+\d+|Rush|Evasive|Bodyguard|Ward|Vanish|Support|Reckless)", re.IGNORECASE),
-        'effect_type': EffectType.GRANT_KEYWORD
+        'effect_type': EffectType.GRANT_KEYWORD,
+        'anchors': ("gain",)
         },
     
     # Prevent actions
     {
         'regex': re.compile(r"(opponents|chosen character) can't (?P<action>play actions|ready|challenge|be challenged|quest)", re.IGNORECASE),
-        'effect_type': EffectType.PREVENT_ACTION
+        'effect_type': EffectType.PREVENT_ACTION,
+        'anchors': ("can't",)
         },
     
     # Look at top cards
     {
         'regex': re.compile(r"look at the top (?P<amount>\d+) cards of (your|an opponent's) deck", re.IGNORECASE),
-        'effect_type': EffectType.LOOK_AT_TOP_CARDS
+        'effect_type': EffectType.LOOK_AT_TOP_CARDS,
+        'anchors': ("look",)
         },
     
     # Play card from zone
     {
         'regex': re.compile(r"(you may )?(reveal|play) (an? )?(?P<card_type>\w+) card( with (?P<condition>.*?))?( and play it( for free)?)?", re.IGNORECASE),
         'effect_type': EffectType.PLAY_CARD,
-        'target': TargetType.LOOKED_AT_CARDS
+        'target': TargetType.LOOKED_AT_CARDS,
+        'anchors': ("reveal", "play")
         },
     
     # Bottom of deck effect
     {
         'regex': re.compile(r"put (all|the rest|the remaining cards|chosen character) (?P<filter>.*?) (on|in) (the bottom of|your discard|their player's decks)", re.IGNORECASE),
-        'effect_type': EffectType.PUT_ON_BOTTOM
+        'effect_type': EffectType.PUT_ON_BOTTOM,
+        'anchors': ("put",)
         },
     ]
 
+# --- Effect prefilter ---
+# Each effect pattern needs at least one of its literal anchor words to match, so one scan for
+# every anchor (overlapping occurrences included) narrows a segment to the patterns worth
+# searching. The candidates keep EFFECT_PATTERNS order, so the first match is unchanged.
+_EFFECT_ANCHOR_REGEX = re.compile(
+        "(?=(" + "|".join(sorted({re.escape(anchor) for pattern in EFFECT_PATTERNS for anchor in pattern['anchors']},
+                                key=len, reverse=True)) + "))")
+_EFFECT_CANDIDATES_BY_ANCHORS: Dict[frozenset, tuple] = {}
+
+
+def effect_candidates(segment: str) -> tuple:
+    """Returns the EFFECT_PATTERNS entries whose anchor words occur in segment, in list order."""
+    found = frozenset(_EFFECT_ANCHOR_REGEX.findall(segment.lower()))
+    candidates = _EFFECT_CANDIDATES_BY_ANCHORS.get(found)
+    if candidates is None:
+        candidates = tuple(pattern for pattern in EFFECT_PATTERNS if not found.isdisjoint(pattern['anchors']))
+        _EFFECT_CANDIDATES_BY_ANCHORS[found] = candidates
+    return candidates
+
 # --- Keyword Pattern Recognition ---
 KEYWORD_PATTERNS = [
     {'regex': re.compile(r"^Rush$", re.IGNORECASE), 'keyword': 'Rush', 'trigger': TriggerCondition.KEYWORD_RUSH, 'has_value': False},
@@ -488,9 +592,9 @@ def parse_effects(effect_text: str) -> List[Effect]:
                 effects.append(conditional_effect)
                 matched = True
         
-        # Try to match standard effect patterns
+        # Try to match the standard effect patterns whose anchor words occur in the segment
         if not matched:
-            for pattern in EFFECT_PATTERNS:
+            for pattern in effect_candidates(segment):
                 match = pattern['regex'].search(segment)
                 if match:
                     effect_type = pattern['effect_type']
@@ -655,8 +759,8 @@ def parse_abilities(body_text: Optional[str], abilities_text: Optional[str]) ->
             if not chunk:
                 continue
             
-            # Match against pattern dictionary
-            for pattern in OPTIMIZED_PATTERNS:
+            # Match against the patterns this chunk's leading word can start
+            for pattern in classify_chunk(chunk):
                 match = pattern['regex'].match(chunk)
                 if match:
                     # Get basic trigger type (might be dynamic)
@@ -679,15 +783,8 @@ def parse_abilities(body_text: Optional[str], abilities_text: Optional[str]) ->
                         cost = parse_cost(cost_text)
                     
                     # Check for dynamic trigger mapping
-                    if trigger in [TriggerCondition.DYNAMIC_TRIGGER, TriggerCondition.DYNAMIC_TURN_TRIGGER,
-                                   TriggerCondition.DYNAMIC_CONDITION, TriggerCondition.DYNAMIC_CHARACTER_STATE,
-                                   TriggerCondition.DYNAMIC_PREVENTION, ]:
-                        if 'dynamic_mapping' in pattern:
-                            # Look for matches in the mapped patterns
-                            for key, mapped_trigger in pattern['dynamic_mapping'].items():
-                                if key in chunk.lower():
-                                    trigger = mapped_trigger
-                                    break
+                    if trigger in _MAPPED_TRIGGERS and 'dynamic_mapping' in pattern:
+                        trigger = map_dynamic_trigger(pattern, match)
                     
                     # Special handlers
                     params = {}
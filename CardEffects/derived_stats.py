@@ -0,0 +1,346 @@
+import re
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+from card_table import KEYWORDS, MISSING_STAT, keyword_bits
+
+if TYPE_CHECKING:  # Player owns a layer, so only import for type checking
+    from card import Card
+    from card_table import CardTable
+    from player import PlayableCard, Player
+
+'''
+Effective (derived) stats of cards in play.
+
+Printed strength / willpower / lore / keywords come from the catalog. Continuous effects of
+cards in play ("Your other characters get +2 {w}", "Your Puppy characters gain Ward") and
+"this turn" modifiers from played cards are layered on top:
+
+    stats = player.stats
+    stats.strength(playable_card), stats.willpower(playable_card), stats.lore(playable_card)
+    stats.keywords(playable_card) & keyword_bits("Rush")
+
+Each in-play card's effective stats are computed on first read and cached by play uuid. A cache
+entry is only dropped when something that applies to that card changes: a modifier source
+enters or leaves play, a "this turn" modifier is added to it or expires, or it leaves play.
+Every such change also bumps the owner's board_version, so caches keyed on it (legal_actions)
+see effective stat changes that don't move any card.
+
+Only unconditional statics are compiled (no "while", "whenever", "for each", ...). Their
+scope and filters come from the ability text, as the parsed Effects don't record them.
+'''
+
+# Scopes of a StaticModifier: which characters it applies to
+SELF = "self"  # "This character gets ..."
+OWN = "own"  # "Your characters get ..."
+OTHERS = "others"  # "Your other characters get ..."
+OPPOSING = "opposing"  # "Opposing characters get ..."
+
+Stats = Tuple[int, int, int, int]  # strength, willpower, lore, keyword bits
+NO_CHANGE: Stats = (0, 0, 0, 0)
+
+_STAT_SYMBOLS = {"s": 0, "w": 1, "l": 2}
+_STAT_REGEX = re.compile(r"^(?P<amount>[+-]\d+) \{(?P<stat>[swl])\}$", re.IGNORECASE)
+_KEYWORD_REGEX = re.compile(r"^(?P<keyword>" + "|".join(sorted(KEYWORDS, key=len, reverse=True))
+                            + r")(?: \+?\d+)?$", re.IGNORECASE)
+_GRANT_SEPARATOR = re.compile(r",\s*(?:and\s+)?|\s+and\s+")
+
+# Ability name (if any) up to ':', ')' or a dash, then "<subject> get(s)/gain(s) <grants>"
+_STATIC_REGEX = re.compile(
+        r"^(?:.*?[:)\-–]\s*)?"
+        r"(?P<subject>this character|opposing characters"
+        r"|your (?P<other>other )?(?:(?P<classification>[\w'-]+) )?characters(?: named (?P<name>[^,.]+?))?)"
+        r" (?:gets?|gains?) (?P<grants>[^.]+?)\.?$",
+        re.IGNORECASE)
+_TEMPORARY_REGEX = re.compile(
+        r"^(?:.*?[:)\-–]\s*)?"
+        r"(?P<subject>chosen (?P<opposing>opposing )?character(?P<yours> of yours)?) (?:gets?|gains?) (?P<grants>[^.]+?)"
+        r" this turn\.?$",
+        re.IGNORECASE)
+
+
+def parse_grants(text: str) -> Optional[Stats]:
+    """
+    Parses "+2 {w}", "+1 {s} and +1 {l}", "Evasive and Ward", "Resist +1" into stat changes.
+
+    Returns:
+        (strength, willpower, lore, keyword bits), or None if any part isn't recognised.
+    """
+    changes = [0, 0, 0]
+    keywords = 0
+    for part in _GRANT_SEPARATOR.split(text.strip()):
+        stat = _STAT_REGEX.match(part)
+        if stat:
+            changes[_STAT_SYMBOLS[stat.group('stat').lower()]] += int(stat.group('amount'))
+            continue
+        keyword = _KEYWORD_REGEX.match(part)
+        if keyword:
+            keywords |= keyword_bits(keyword.group('keyword'))
+            continue
+        return None
+    return changes[0], changes[1], changes[2], keywords
+
+
+class StaticModifier:
+    """A continuous stat/keyword change a card applies while it is in play."""
+
+    __slots__ = ("scope", "classification", "name", "changes")
+
+    def __init__(self, scope: str, changes: Stats, classification: Optional[str] = None,
+                 name: Optional[str] = None):
+        self.scope = scope
+        self.changes = changes
+        self.classification = classification  # Lowercase; only characters with it are affected
+        self.name = name  # Only characters with this name (before " - ") are affected
+
+    def applies_to(self, card: 'Card') -> bool:
+        """True if the modifier's filters (not its scope) accept a card."""
+        if card.type != "Character":
+            return False
+        if self.classification is not None and self.classification not in (c.lower() for c in card.classifications):
+            return False
+        return self.name is None or card.name.split(" - ")[0].lower() == self.name
+
+    def __repr__(self) -> str:
+        return f"<StaticModifier {self.scope} {self.changes} class={self.classification} name={self.name}>"
+
+
+def compile_static(text: Optional[str], table: 'CardTable') -> Optional[StaticModifier]:
+    """Compiles an unconditional continuous ability's text into a StaticModifier, or None."""
+    if not text:
+        return None
+    text = " ".join(text.split())
+    match = _STATIC_REGEX.match(text)
+    if not match or "{" in text[:match.start('subject')]:
+        return None  # An activation cost ("{e}: ...") makes it an activated ability
+    changes = parse_grants(match.group('grants'))
+    if changes is None or changes == NO_CHANGE:
+        return None
+    subject = match.group('subject').lower()
+    classification = match.group('classification')
+    if classification is not None:
+        classification = classification.lower()
+        if classification not in table.index.by_classification:
+            return None  # "Your damaged characters", "your exerted characters", ... are conditions
+    name = match.group('name')
+    if subject == "this character":
+        scope = SELF
+    elif subject == "opposing characters":
+        scope = OPPOSING
+    else:
+        scope = OTHERS if match.group('other') else OWN
+    return StaticModifier(scope, changes, classification, name.lower() if name else None)
+
+
+def compile_temporary(text: Optional[str]) -> Optional[Tuple[str, Stats]]:
+    """
+    Compiles "Chosen (opposing) character (of yours) gets/gains ... this turn".
+
+    Returns:
+        (side, changes) where side is 'own', 'opposing' or 'any', or None if not recognised.
+    """
+    if not text:
+        return None
+    text = " ".join(text.split())
+    match = _TEMPORARY_REGEX.match(text)
+    if not match or "{" in text[:match.start('subject')]:
+        return None  # An activation cost ("{e}: ...") makes it an activated ability
+    changes = parse_grants(match.group('grants'))
+    if changes is None or changes == NO_CHANGE:
+        return None
+    side = "opposing" if match.group('opposing') else "own" if match.group('yours') else "any"
+    return side, changes
+
+
+class DerivedStats:
+    """One player's cache of effective stats for its cards in play (see Player.stats)."""
+
+    __slots__ = ("owner", "_cache", "_sources", "_temporary")
+
+    def __init__(self, owner: 'Player'):
+        """
+        Args:
+            owner: The player whose cards in play this layer describes.
+        """
+        self.owner = owner
+        self._cache: Dict[int, Stats] = {}  # play uuid -> effective stats
+        # (source is an opponent's card, source play uuid) -> (source card, modifiers that reach our cards)
+        self._sources: Dict[Tuple[bool, int], Tuple['PlayableCard', Tuple[StaticModifier, ...]]] = {}
+        self._temporary: Dict[int, List[Stats]] = {}  # play uuid -> "this turn" changes
+
+    # --- Reads ---
+
+    def effective(self, playable_card: 'PlayableCard') -> Stats:
+        """(strength, willpower, lore, keyword bits) of a card in play, missing printed stats as 0."""
+        entry = self._cache.get(playable_card['uuid'])
+        if entry is None:
+            entry = self._cache[playable_card['uuid']] = self.compute(playable_card)
+        return entry
+
+    def strength(self, playable_card: 'PlayableCard') -> int:
+        return self.effective(playable_card)[0]
+
+    def willpower(self, playable_card: 'PlayableCard') -> int:
+        return self.effective(playable_card)[1]
+
+    def lore(self, playable_card: 'PlayableCard') -> int:
+        return self.effective(playable_card)[2]
+
+    def keywords(self, playable_card: 'PlayableCard') -> int:
+        return self.effective(playable_card)[3]
+
+    def compute(self, playable_card: 'PlayableCard') -> Stats:
+        """Effective stats from scratch (what the cache holds)."""
+        catalog = self.owner.catalog
+        card_id = playable_card['card_id']
+        strength, willpower, lore = (int(catalog.strength[card_id]), int(catalog.willpower[card_id]),
+                                     int(catalog.lore[card_id]))
+        strength = 0 if strength == MISSING_STAT else strength
+        willpower = 0 if willpower == MISSING_STAT else willpower
+        lore = 0 if lore == MISSING_STAT else lore
+        keywords = int(catalog.keyword_mask[card_id])
+        changes = [modifier.changes for (from_opponent, _), (source, modifiers) in self._sources.items()
+                   for modifier in modifiers if self._reaches(modifier, source, from_opponent, playable_card)]
+        changes.extend(self._temporary.get(playable_card['uuid'], ()))
+        for delta_strength, delta_willpower, delta_lore, granted in changes:
+            strength += delta_strength
+            willpower += delta_willpower
+            lore += delta_lore
+            keywords |= granted
+        return max(strength, 0), max(willpower, 0), max(lore, 0), keywords
+
+    def _reaches(self, modifier: StaticModifier, source: 'PlayableCard', from_opponent: bool,
+                 target: 'PlayableCard') -> bool:
+        if modifier.scope == SELF:
+            return not from_opponent and source is target
+        if modifier.scope == OTHERS and source is target:
+            return False
+        return modifier.applies_to(self.owner.card(target['card_id']))
+
+    # --- Changes (each drops only the cache entries it affects) ---
+
+    def add_source(self, source: 'PlayableCard', modifiers: Tuple[StaticModifier, ...], from_opponent: bool) -> None:
+        """Starts applying a card's static modifiers (the card just entered play)."""
+        reaching = tuple(modifier for modifier in modifiers if (modifier.scope == OPPOSING) == from_opponent)
+        if reaching:
+            self._sources[(from_opponent, source['uuid'])] = (source, reaching)
+            self._invalidate_reached(source, reaching, from_opponent)
+            self.owner.board_version += 1
+
+    def remove_source(self, source: 'PlayableCard', from_opponent: bool) -> bool:
+        """
+        Stops applying a card's static modifiers (the card left play).
+
+        Returns:
+            True if it lowered willpower anywhere (damaged characters may now be banished).
+        """
+        entry = self._sources.pop((from_opponent, source['uuid']), None)
+        if entry is None:
+            return False
+        self._invalidate_reached(source, entry[1], from_opponent)
+        self.owner.board_version += 1
+        return any(modifier.changes[1] > 0 for modifier in entry[1])
+
+    def _invalidate_reached(self, source: 'PlayableCard', modifiers: Tuple[StaticModifier, ...],
+                            from_opponent: bool) -> None:
+        cache = self._cache
+        if not cache:
+            return
+        for target in self.owner.play_area:
+            if target['uuid'] in cache and any(self._reaches(modifier, source, from_opponent, target)
+                                               for modifier in modifiers):
+                del cache[target['uuid']]
+
+    def forget(self, playable_card: 'PlayableCard') -> None:
+        """Drops a card's cache entry (it left play; its uuid may be reused)."""
+        self._cache.pop(playable_card['uuid'], None)
+
+    def add_temporary(self, playable_card: 'PlayableCard', changes: Stats) -> None:
+        """Applies a "this turn" change to a card in play until expire_temporary()."""
+        uuid = playable_card['uuid']
+        self._temporary.setdefault(uuid, []).append(changes)
+        self._cache.pop(uuid, None)
+        self.owner.board_version += 1
+        self.owner.undo_log.append((self._undo_temporary, uuid))
+
+    def _undo_temporary(self, uuid: int) -> None:
+        changes = self._temporary[uuid]
+        changes.pop()
+        if not changes:
+            del self._temporary[uuid]
+        self._cache.pop(uuid, None)
+        self.owner.board_version += 1
+
+    def expire_temporary(self) -> bool:
+        """
+        Ends every "this turn" change (called at the end of each turn).
+
+        Returns:
+            True if a willpower boost ended (damaged characters may now be banished).
+        """
+        if not self._temporary:
+            return False
+        expired = self._temporary
+        self._temporary = {}
+        for uuid in expired:
+            self._cache.pop(uuid, None)
+        self.owner.board_version += 1
+        self.owner.undo_log.append((self._undo_expire, expired))
+        return any(changes[1] > 0 for changes_list in expired.values() for changes in changes_list)
+
+    def _undo_expire(self, expired: Dict[int, List[Stats]]) -> None:
+        self._temporary = expired
+        for uuid in expired:
+            self._cache.pop(uuid, None)
+        self.owner.board_version += 1
+
+    def temporary_items(self) -> Tuple[Tuple[int, Stats], ...]:
+        """The active "this turn" changes as (uuid, changes) pairs (for snapshots)."""
+        return tuple((uuid, changes) for uuid, changes_list in self._temporary.items() for changes in changes_list)
+
+    def restore_temporary(self, items: Tuple[Tuple[int, Stats], ...]) -> None:
+        """Re-applies changes from temporary_items() without recording undo."""
+        for uuid, changes in items:
+            self._temporary.setdefault(uuid, []).append(changes)
+            self._cache.pop(uuid, None)
+        if items:
+            self.owner.board_version += 1
+
+    def __repr__(self) -> str:
+        return (f"<DerivedStats {len(self._cache)} cached, {len(self._sources)} sources, "
+                f"{len(self._temporary)} cards with this-turn changes>")
+
+
+# --- Example Usage ---
+if __name__ == "__main__":
+    import timeit
+    from catalog import load_card_maps
+    from deck import Deck
+    from events import NULL_SINK
+    from game_state import GameState
+    from player import Player
+
+    all_cards_by_id, all_cards_by_name, _ = load_card_maps(with_abilities=True)
+    rhino = all_cards_by_name["Rhino - Motivational Speaker"]  # "Your other characters get +2 {w}"
+    friend = next(card for card in all_cards_by_id.values() if card.type == "Character" and card.cost == 1)
+    names = [rhino.name, friend.name] * 15
+    game = GameState(Player("Alyssa", Deck(names, all_cards_by_name), 0, NULL_SINK),
+                     Player("Brian", Deck(names, all_cards_by_name), 1, NULL_SINK), NULL_SINK)
+    player = game.active_player
+    player.ready_ink = player.total_ink = 20
+    player.hand.extend([friend.card_id, rhino.card_id])
+
+    friend_pc = player.play_card(friend.card_id)
+    print(f"\n'{friend.name}' printed willpower {friend.willpower}, effective {player.stats.willpower(friend_pc)}")
+    mark = game.mark()
+    rhino_pc = player.play_card(rhino.card_id)
+    print(f"With '{rhino.name}' in play: {player.stats.willpower(friend_pc)} "
+          f"(Rhino itself: {player.stats.willpower(rhino_pc)})")
+    player.banish(rhino_pc)
+    print(f"Rhino banished: {player.stats.willpower(friend_pc)}")
+    game.undo_to(mark)
+    print(f"Undone to before Rhino: {player.stats.willpower(friend_pc)}, {player.stats!r}")
+
+    runs = 100_000
+    cached_us = timeit.timeit(lambda: player.stats.willpower(friend_pc), number=runs) / runs * 1e6
+    compute_us = timeit.timeit(lambda: player.stats.compute(friend_pc), number=runs) / runs * 1e6
+    print(f"Cached read: {cached_us:.2f} us, recompute: {compute_us:.2f} us")
@@ -0,0 +1,462 @@
+import re
+from collections import Counter
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple
+
+from CardEffects.ability import Ability, AbilityCost, Effect
+from CardEffects.derived_stats import Stats, StaticModifier, compile_static, compile_temporary
+from CardEffects.effects_Definitions import EffectType, TargetType, TriggerCondition
+
+if TYPE_CHECKING:  # card_table.py builds the engine lazily and Player calls it, so only import for type checking
+    from card_table import CardTable
+    from player import PlayableCard, Player
+
+'''
+Compiled execution of parsed abilities.
+
+Each card's parse_abilities() output is compiled once (on first use) into a CardPlan of
+CompiledAbility objects whose steps are plain closures: the handler for the EffectType, the
+validated parameters and the resolver for the TargetType are all bound at compile time, so
+resolving an ability at game time is one call per effect with no parameter dict lookups:
+
+    plan = catalog.effect_engine.plan(card_id)
+    for ability in plan.on_play:
+        ability.resolve(EffectContext(player, player.opponent, playable_card, card_id))
+
+Unconditional static modifiers ("Your other characters get +2 {w}") are compiled into
+CardPlan.statics for the derived stats layer (CardEffects/derived_stats.py), and "Chosen
+character gets ... this turn" into a step that adds a temporary modifier there.
+
+If none of the catalog's cards has parsed_abilities yet (load_card_maps without
+with_abilities), the engine attaches them through the ability cache when it is created, so
+every entry point that plays cards resolves their effects.
+
+Effects the engine can't execute yet (OTHER, conditional statics, unrecognised conditions, ...)
+are left out of the plan and counted in EffectEngine.unsupported.
+'''
+
+# Abilities of Actions/Songs that resolve when the card is played
+ACTION_TRIGGERS = frozenset({TriggerCondition.CONTINUOUS, TriggerCondition.SIMPLE_ACTION_EFFECT,
+                             TriggerCondition.ON_PLAY})
+# Abilities of cards that stay in play which resolve when the card is played
+ON_PLAY_TRIGGERS = frozenset({TriggerCondition.ON_PLAY})
+# Effects a static or "this turn" modifier replaces when its ability text compiles
+STAT_EFFECTS = frozenset({EffectType.MODIFY_STATS, EffectType.GRANT_KEYWORD})
+
+Step = Callable[['EffectContext'], None]
+Candidates = List[Tuple['Player', 'PlayableCard']]
+
+
+class EffectContext:
+    """Who is resolving an ability, against whom, and from which card."""
+
+    __slots__ = ("player", "opponent", "source", "card_id")
+
+    def __init__(self, player: 'Player', opponent: Optional['Player'], source: Optional['PlayableCard'],
+                 card_id: int):
+        self.player = player
+        self.opponent = opponent
+        self.source = source  # The card's PlayableCard if it is in play (None for Actions/Songs)
+        self.card_id = card_id
+
+
+class CompiledAbility:
+    """An Ability reduced to its trigger, cost and a tuple of ready-to-call steps."""
+
+    __slots__ = ("trigger", "cost", "steps", "source_text")
+
+    def __init__(self, trigger: TriggerCondition, cost: Optional[AbilityCost], steps: Tuple[Step, ...],
+                 source_text: Optional[str]):
+        self.trigger = trigger
+        self.cost = cost
+        self.steps = steps
+        self.source_text = source_text
+
+    def resolve(self, context: EffectContext) -> None:
+        for step in self.steps:
+            step(context)
+
+    def __repr__(self) -> str:
+        return f"<CompiledAbility {self.trigger.name}, {len(self.steps)} steps: {self.source_text!r}>"
+
+
+class CardPlan:
+    """A card's compiled abilities, grouped the way the game looks them up."""
+
+    __slots__ = ("abilities", "on_play", "activated", "by_trigger", "statics")
+
+    def __init__(self, abilities: Tuple[CompiledAbility, ...], is_action: bool,
+                 statics: Tuple[StaticModifier, ...] = ()):
+        self.abilities = abilities
+        self.statics = statics  # Applied by Player.stats while the card is in play
+        play_triggers = ACTION_TRIGGERS if is_action else ON_PLAY_TRIGGERS
+        self.on_play = tuple(ability for ability in abilities if ability.trigger in play_triggers)
+        self.activated = tuple(ability for ability in abilities if ability.trigger is TriggerCondition.ACTIVATED)
+        by_trigger: Dict[TriggerCondition, List[CompiledAbility]] = {}
+        for ability in abilities:
+            by_trigger.setdefault(ability.trigger, []).append(ability)
+        self.by_trigger = {trigger: tuple(group) for trigger, group in by_trigger.items()}
+
+
+EMPTY_PLAN = CardPlan((), False)
+
+
+# --- Target resolvers (chosen per TargetType at compile time) ---
+
+def _characters(player: Optional['Player']) -> Candidates:
+    if player is None:
+        return []
+    return [(player, playable) for playable in player.play_area
+            if player.card(playable['card_id']).type == "Character"]
+
+
+def _locations(player: Optional['Player']) -> Candidates:
+    if player is None:
+        return []
+    return [(player, playable) for playable in player.play_area
+            if player.card(playable['card_id']).type == "Location"]
+
+
+def _any_character(context: EffectContext) -> Candidates:
+    return _characters(context.player) + _characters(context.opponent)
+
+
+def _any_location(context: EffectContext) -> Candidates:
+    return _locations(context.player) + _locations(context.opponent)
+
+
+def _own_characters(context: EffectContext) -> Candidates:
+    return _characters(context.player)
+
+
+def _opponent_characters(context: EffectContext) -> Candidates:
+    return _characters(context.opponent)
+
+
+def _source_card(context: EffectContext) -> Candidates:
+    return [(context.player, context.source)] if context.source is not None else []
+
+
+CARD_TARGETS: Dict[TargetType, Callable[[EffectContext], Candidates]] = {
+    TargetType.TARGET_CHARACTER_CHOSEN: _any_character,
+    TargetType.TARGET_LOCATION_CHOSEN: _any_location,
+    TargetType.TARGET_CARD_IN_PLAY_CHOSEN: _any_character,
+    TargetType.ALL_OWN_CHARACTERS: _own_characters,
+    TargetType.ALL_OPPONENT_CHARACTERS: _opponent_characters,
+    TargetType.ALL_CHARACTERS: _any_character,
+    TargetType.SELF_CARD: _source_card,
+    }
+# Targets that affect every candidate instead of one chosen card
+GROUP_TARGETS = frozenset({TargetType.ALL_OWN_CHARACTERS, TargetType.ALL_OPPONENT_CHARACTERS,
+                           TargetType.ALL_CHARACTERS})
+
+PLAYER_TARGETS: Dict[TargetType, Callable[[EffectContext], Optional['Player']]] = {
+    TargetType.SELF_PLAYER: lambda context: context.player,
+    TargetType.OPPONENT_PLAYER: lambda context: context.opponent,
+    }
+
+
+def _choose_hostile(context: EffectContext, candidates: Candidates, amount: int) -> Optional[Tuple['Player', 'PlayableCard']]:
+    """Default choice for harmful effects: an opposing character this banishes (by effective willpower), else the most expensive one."""
+    opposing = [(owner, playable) for owner, playable in candidates if owner is not context.player]
+    if not opposing:
+        return None
+
+    def priority(candidate):
+        owner, playable = candidate
+        _, willpower, lore, _ = owner.stats.effective(playable)
+        banishes = playable['damage'] + amount >= willpower
+        return banishes, owner.card(playable['card_id']).cost, lore
+
+    return max(opposing, key=priority)
+
+
+def _choose_friendly(context: EffectContext, candidates: Candidates) -> Optional[Tuple['Player', 'PlayableCard']]:
+    """Default choice for helpful effects: the player's own most damaged card."""
+    own = [(owner, playable) for owner, playable in candidates if owner is context.player]
+    if not own:
+        return None
+    return max(own, key=lambda candidate: candidate[1]['damage'])
+
+
+# --- Effect compilers (one per EffectType; each validates parameters and returns a Step) ---
+
+_COMPILERS: Dict[EffectType, Callable[[Effect], Optional[Step]]] = {}
+
+
+def compiles(effect_type: EffectType):
+    """Registers a compiler for an EffectType."""
+    def register(function: Callable[[Effect], Optional[Step]]):
+        _COMPILERS[effect_type] = function
+        return function
+    return register
+
+
+def _amount(effect: Effect, key: str = 'amount') -> Optional[int]:
+    value = effect.get_param(key)
+    return value if isinstance(value, int) and not isinstance(value, bool) and value >= 0 else None
+
+
+@compiles(EffectType.DRAW_CARD)
+def _compile_draw(effect: Effect) -> Optional[Step]:
+    amount, target = _amount(effect), PLAYER_TARGETS.get(effect.target)
+    if amount is None or target is None:
+        return None
+
+    def draw(context: EffectContext) -> None:
+        player = target(context)
+        if player is not None:
+            for _ in range(amount):
+                player.draw_card()
+    return draw
+
+
+@compiles(EffectType.GAIN_LORE)
+def _compile_gain_lore(effect: Effect) -> Optional[Step]:
+    amount, target = _amount(effect), PLAYER_TARGETS.get(effect.target)
+    if amount is None or target is None:
+        return None
+
+    def gain_lore(context: EffectContext) -> None:
+        player = target(context)
+        if player is not None:
+            player.gain_lore(amount)
+    return gain_lore
+
+
+@compiles(EffectType.LOSE_LORE)
+def _compile_lose_lore(effect: Effect) -> Optional[Step]:
+    amount, target = _amount(effect), PLAYER_TARGETS.get(effect.target)
+    if amount is None or target is None:
+        return None
+
+    def lose_lore(context: EffectContext) -> None:
+        player = target(context)
+        if player is not None:
+            player.lose_lore(amount)
+    return lose_lore
+
+
+@compiles(EffectType.DEAL_DAMAGE)
+def _compile_deal_damage(effect: Effect) -> Optional[Step]:
+    amount, resolver = _amount(effect), CARD_TARGETS.get(effect.target)
+    if amount is None or resolver is None:
+        return None
+
+    if effect.target in GROUP_TARGETS:
+        def deal_damage_to_all(context: EffectContext) -> None:
+            for owner, playable in resolver(context):
+                owner.deal_damage(playable, amount)
+        return deal_damage_to_all
+
+    def deal_damage(context: EffectContext) -> None:
+        chosen = _choose_hostile(context, resolver(context), amount)
+        if chosen is not None:
+            chosen[0].deal_damage(chosen[1], amount)
+    return deal_damage
+
+
+@compiles(EffectType.HEAL_DAMAGE)
+def _compile_heal_damage(effect: Effect) -> Optional[Step]:
+    amount, resolver = _amount(effect), CARD_TARGETS.get(effect.target)
+    if amount is None or resolver is None:
+        return None
+
+    if effect.target in GROUP_TARGETS:
+        def heal_all(context: EffectContext) -> None:
+            for owner, playable in resolver(context):
+                owner.remove_damage(playable, amount)
+        return heal_all
+
+    def heal(context: EffectContext) -> None:
+        chosen = _choose_friendly(context, resolver(context))
+        if chosen is not None:
+            chosen[0].remove_damage(chosen[1], amount)
+    return heal
+
+
+# "If you have 3 or more other characters in play" and similar counts of your own cards
+_HAVE_IN_PLAY_REGEX = re.compile(
+        r"^if you have (?P<count>\d+) or more (?P<other>other )?(?P<kind>characters|items|locations|cards) in play$",
+        re.IGNORECASE)
+_KIND_TYPES = {"characters": ("Character",), "items": ("Item",), "locations": ("Location",),
+               "cards": ("Character", "Item", "Location")}
+
+
+def compile_condition(condition_text: str) -> Optional[Callable[[EffectContext], bool]]:
+    """Compiles a CONDITIONAL effect's condition_text into a predicate, or None if it isn't recognised."""
+    match = _HAVE_IN_PLAY_REGEX.match(condition_text.strip().rstrip('.,'))
+    if not match:
+        return None
+    count = int(match.group('count'))
+    types = _KIND_TYPES[match.group('kind').lower()]
+    exclude_source = bool(match.group('other'))
+
+    def condition(context: EffectContext) -> bool:
+        player = context.player
+        matching = sum(1 for playable in player.play_area
+                       if player.card(playable['card_id']).type in types
+                       and not (exclude_source and playable is context.source))
+        return matching >= count
+    return condition
+
+
+@compiles(EffectType.CONDITIONAL)
+def _compile_conditional(effect: Effect) -> Optional[Step]:
+    condition_text, nested = effect.get_param('condition_text'), effect.get_param('nested_effects')
+    if not isinstance(condition_text, str) or not isinstance(nested, list):
+        return None
+    condition = compile_condition(condition_text)
+    steps = [compile_effect(nested_effect) for nested_effect in nested]
+    if condition is None or not steps or None in steps:
+        return None
+    steps = tuple(steps)
+
+    def conditional(context: EffectContext) -> None:
+        if condition(context):
+            for step in steps:
+                step(context)
+    return conditional
+
+
+def compile_temporary_modifier(side: str, changes: Stats) -> Step:
+    """
+    Step for "Chosen character gets/gains ... this turn" (see derived_stats.compile_temporary).
+    Boosts go to the player's own best character, penalties to the opponent's strongest one.
+    """
+    harmful = changes[0] < 0 or changes[1] < 0 or changes[2] < 0
+    targets_opponent = side == "opposing" or (harmful and side == "any")
+
+    def value(candidate):
+        owner, playable = candidate
+        strength, _, lore, _ = owner.stats.effective(playable)
+        return (strength, lore) if harmful else (not playable['exerted'], lore, strength)
+
+    def modify(context: EffectContext) -> None:
+        candidates = _characters(context.opponent if targets_opponent else context.player)
+        if candidates:
+            owner, playable = max(candidates, key=value)
+            owner.stats.add_temporary(playable, changes)
+            if changes[1] < 0:  # Lowered willpower may now be at or below the damage
+                owner._banish_lethal()
+    return modify
+
+
+def compile_effect(effect: Effect) -> Optional[Step]:
+    """Compiles one Effect into a Step, or returns None if the engine can't execute it."""
+    compiler = _COMPILERS.get(effect.effect_type)
+    return compiler(effect) if compiler is not None else None
+
+
+class EffectEngine:
+    """Compiles and caches a CardPlan per card id of a catalog (see CardTable.effect_engine)."""
+
+    def __init__(self, table: 'CardTable'):
+        """
+        Args:
+            table: The catalog whose cards' parsed_abilities are compiled.
+        """
+        self.table = table
+        if not any(card.parsed_abilities for card in table.cards):
+            from CardEffects.ability_cache import DEFAULT_CACHE_FILENAME, attach_parsed_abilities
+            attach_parsed_abilities(table.cards, table.ability_cache_path or DEFAULT_CACHE_FILENAME)
+        self._plans: List[Optional[CardPlan]] = [None] * len(table)
+        self.unsupported: Counter = Counter()  # EffectType name -> effects left out of plans
+
+    def plan(self, card_id: int) -> CardPlan:
+        """Returns the compiled plan for a card, compiling it on first use."""
+        plan = self._plans[card_id]
+        if plan is None:
+            plan = self._plans[card_id] = self.compile_card(card_id)
+        return plan
+
+    def compile_card(self, card_id: int) -> CardPlan:
+        card = self.table.cards[card_id]
+        if not card.parsed_abilities:
+            return EMPTY_PLAN
+        is_action = card.type == "Action" or "Song" in card.type
+        compiled = []
+        statics = []
+        seen_texts = set()
+        for ability in card.parsed_abilities:
+            # The parser emits some action texts twice (as SIMPLE_ACTION_EFFECT and CONTINUOUS)
+            if ability.source_text in seen_texts:
+                continue
+            seen_texts.add(ability.source_text)
+            trigger = ability.trigger
+            if is_action and trigger is TriggerCondition.ACTIVATED:
+                trigger = TriggerCondition.SIMPLE_ACTION_EFFECT  # Actions have no activated abilities ("Name - text")
+            steps = []
+            handled = STAT_EFFECTS if self._compile_modifier(card, ability, trigger, is_action, statics, steps) else ()
+            for effect in ability.effects:
+                if effect.effect_type in handled:
+                    continue
+                step = compile_effect(effect)
+                if step is None:
+                    self.unsupported[effect.effect_type.name] += 1
+                else:
+                    steps.append(step)
+            if steps:
+                compiled.append(CompiledAbility(trigger, ability.cost, tuple(steps), ability.source_text))
+        return CardPlan(tuple(compiled), is_action, tuple(statics))
+
+    def _compile_modifier(self, card, ability: Ability, trigger: TriggerCondition, is_action: bool,
+                          statics: List[StaticModifier], steps: List[Step]) -> bool:
+        """Compiles an ability's text as a static or "this turn" modifier. Returns True if it was one."""
+        if not any(effect.effect_type in STAT_EFFECTS for effect in ability.effects):
+            return False
+        if not is_action:
+            static = compile_static(ability.source_text, self.table)
+            if static is not None:
+                statics.append(static)
+                return True
+        if trigger in (ACTION_TRIGGERS if is_action else ON_PLAY_TRIGGERS):
+            temporary = compile_temporary(ability.source_text)
+            if temporary is not None:
+                steps.append(compile_temporary_modifier(*temporary))
+                return True
+        return False
+
+    def compile_all(self) -> int:
+        """Compiles every card now (instead of on first use). Returns the number of executable abilities."""
+        return sum(len(self.plan(card_id).abilities) + len(self.plan(card_id).statics)
+                   for card_id in range(len(self.table)))
+
+
+# --- Example Usage ---
+if __name__ == "__main__":
+    import timeit
+    from catalog import load_card_maps
+    from deck import Deck
+    from events import NULL_SINK
+    from game_state import GameState
+    from player import Player
+
+    all_cards_by_id, all_cards_by_name, _ = load_card_maps(with_abilities=True)
+    table = next(iter(all_cards_by_id.values())).table
+    engine = table.effect_engine
+    start = timeit.default_timer()
+    executable = engine.compile_all()
+    print(f"\nCompiled {len(table)} cards in {(timeit.default_timer() - start) * 1000:.1f} ms: "
+          f"{executable} executable abilities")
+    print(f"Left out (not executable yet): {dict(engine.unsupported.most_common(6))}")
+
+    # Play "This Is My Family" (gain 1 lore, draw a card) from a hand of copies
+    song = all_cards_by_name["This Is My Family"]
+    names = [song.name] * 30
+    game = GameState(Player("Alyssa", Deck(names, all_cards_by_name), 0, NULL_SINK),
+                     Player("Brian", Deck(names, all_cards_by_name), 1, NULL_SINK), NULL_SINK)
+    player = game.active_player
+    player.ready_ink = player.total_ink = 10
+    hand_before, lore_before = len(player.hand), player.lore
+    mark = game.mark()
+    player.play_card(song.card_id)
+    print(f"Played '{song.name}': lore {lore_before} -> {player.lore}, hand {hand_before} -> {len(player.hand)}")
+    game.undo_to(mark)
+    print(f"After undo: lore {player.lore}, hand {len(player.hand)}")
+
+    plan = engine.plan(song.card_id)
+    context = EffectContext(player, player.opponent, None, song.card_id)
+    runs = 20000
+    resolve_us = timeit.timeit(lambda: ([a.resolve(context) for a in plan.on_play], game.undo_to(mark)),
+                               number=runs) / runs * 1e6
+    print(f"Resolve + undo of its plan: {resolve_us:.2f} us")
@@ -0,0 +1,173 @@
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+from CardEffects.effect_engine import CardPlan, CompiledAbility, EffectContext
+from CardEffects.effects_Definitions import TriggerCondition
+from events import AbilityTriggered
+
+if TYPE_CHECKING:  # Player owns an index, so only import for type checking
+    from player import PlayableCard, Player
+
+'''
+Subscription index for triggered abilities of cards in play.
+
+A card's compiled triggered abilities (CardPlan.by_trigger) are subscribed when it enters its
+owner's play area and unsubscribed when it leaves. Each subscription is filed under
+(TriggerCondition, scope), where scope says whose event the ability listens to:
+
+    SELF      the event happened to this card          ("When this character quests")
+    OWN       the event happened to its owner          ("At the start of your turn")
+    OPPONENT  the event happened to the owner's opponent ("Whenever an opponent plays a song")
+
+Firing an event looks up one bucket (and for SELF, one card in it), so dispatch cost depends on
+how many cards care about the event, not on how many cards are in play:
+
+    player.triggers.fire(TriggerCondition.ON_QUEST, SELF, playable_card)
+    player.opponent.triggers.fire(TriggerCondition.ON_OPPONENT_PLAYS_SONG, OPPONENT)
+'''
+
+SELF = "self"
+OWN = "own"
+OPPONENT = "opponent"
+
+# Which scopes each indexed trigger is subscribed under. ON_PLAY is not indexed: play_card
+# resolves CardPlan.on_play directly. Passive triggers (CONTINUOUS, keywords, ...) never fire.
+TRIGGER_SCOPES: Dict[TriggerCondition, Tuple[str, ...]] = {
+    TriggerCondition.ON_QUEST: (SELF,),
+    TriggerCondition.ON_BANISH: (SELF,),
+    TriggerCondition.ON_CHALLENGE: (SELF,),
+    TriggerCondition.ON_BEING_CHALLENGED: (SELF,),
+    TriggerCondition.ON_EXERT: (SELF,),
+    TriggerCondition.ON_READY: (SELF,),
+    TriggerCondition.ON_SING: (SELF,),
+    TriggerCondition.ON_MOVE_TO_LOCATION: (SELF,),
+    TriggerCondition.ON_CHARACTER_MOVES_FROM_LOCATION: (SELF,),
+    TriggerCondition.ON_OPPONENT_PLAYS_CARD: (OPPONENT,),
+    TriggerCondition.ON_OPPONENT_PLAYS_SONG: (OPPONENT,),
+    TriggerCondition.ON_CHARACTER_ENTERS_PLAY: (OWN, OPPONENT),
+    TriggerCondition.ON_CHARACTER_LEAVES_PLAY: (OWN, OPPONENT),
+    TriggerCondition.START_OF_TURN: (OWN,),
+    TriggerCondition.END_OF_TURN: (OWN,),
+    }
+
+Subscription = Tuple['PlayableCard', Tuple[CompiledAbility, ...]]
+
+
+class TriggerIndex:
+    """One player's in-play triggered abilities, bucketed by (TriggerCondition, scope)."""
+
+    __slots__ = ("owner", "_buckets", "_keys_by_uuid")
+
+    def __init__(self, owner: 'Player'):
+        """
+        Args:
+            owner: The player whose cards subscribe (abilities resolve with it as the acting player).
+        """
+        self.owner = owner
+        # (trigger, scope) -> play uuid -> (playable card, abilities); empty buckets are removed
+        self._buckets: Dict[Tuple[TriggerCondition, str], Dict[int, Subscription]] = {}
+        # play uuid -> the bucket keys it is filed under (for unsubscribe)
+        self._keys_by_uuid: Dict[int, List[Tuple[TriggerCondition, str]]] = {}
+
+    def subscribe(self, playable_card: 'PlayableCard', plan: CardPlan) -> None:
+        """Files a card's triggered abilities under every (trigger, scope) they listen to."""
+        keys = []
+        uuid = playable_card['uuid']
+        for trigger, abilities in plan.by_trigger.items():
+            for scope in TRIGGER_SCOPES.get(trigger, ()):
+                key = (trigger, scope)
+                self._buckets.setdefault(key, {})[uuid] = (playable_card, abilities)
+                keys.append(key)
+        if keys:
+            self._keys_by_uuid[uuid] = keys
+
+    def unsubscribe(self, playable_card: 'PlayableCard') -> None:
+        """Removes every subscription of a card (no-op if it has none)."""
+        uuid = playable_card['uuid']
+        for key in self._keys_by_uuid.pop(uuid, ()):
+            bucket = self._buckets[key]
+            del bucket[uuid]
+            if not bucket:
+                del self._buckets[key]
+
+    def listens(self, trigger: TriggerCondition, scope: str) -> bool:
+        """True if any card subscribes to (trigger, scope)."""
+        return (trigger, scope) in self._buckets
+
+    def fire(self, trigger: TriggerCondition, scope: str, source: Optional['PlayableCard'] = None) -> int:
+        """
+        Resolves the abilities subscribed to an event.
+
+        Args:
+            trigger: What happened.
+            scope: Whose event it is, seen from this index's owner (SELF, OWN or OPPONENT).
+            source: For SELF, the card the event happened to.
+
+        Returns:
+            The number of cards whose abilities resolved.
+        """
+        bucket = self._buckets.get((trigger, scope))
+        if not bucket:
+            return 0
+        if scope == SELF:
+            subscription = bucket.get(source['uuid']) if source is not None else None
+            uuids = (source['uuid'],) if subscription is not None else ()
+        else:
+            # uuids grow with play order, so sorting gives play order whatever was undone/redone
+            uuids = sorted(bucket) if len(bucket) > 1 else tuple(bucket)
+        owner = self.owner
+        fired = 0
+        for uuid in uuids:
+            subscription = bucket.get(uuid)
+            if subscription is None:  # Left play while an earlier ability resolved
+                continue
+            playable_card, abilities = subscription
+            if owner.events.enabled:
+                owner.events.emit(AbilityTriggered(owner.name, owner.card(playable_card['card_id']).name,
+                                                   trigger.name))
+            context = EffectContext(owner, owner.opponent, playable_card, playable_card['card_id'])
+            for ability in abilities:
+                ability.resolve(context)
+            fired += 1
+        return fired
+
+    def __len__(self) -> int:
+        """Number of cards with at least one subscription."""
+        return len(self._keys_by_uuid)
+
+    def __repr__(self) -> str:
+        return (f"<TriggerIndex {len(self)} cards, "
+                f"{sum(len(bucket) for bucket in self._buckets.values())} subscriptions>")
+
+
+# --- Example Usage ---
+if __name__ == "__main__":
+    import timeit
+    from catalog import load_card_maps
+    from deck import Deck
+    from events import NULL_SINK
+    from player import Player
+
+    all_cards_by_id, all_cards_by_name, _ = load_card_maps()
+    names = [card.name for card in all_cards_by_id.values() if card.type == "Character"][:60]
+    player = Player("Alyssa", Deck(names, all_cards_by_name), 0, NULL_SINK)
+
+    # One card with a (hand-built) "At the start of your turn, gain 1 lore" ability
+    gain = CompiledAbility(TriggerCondition.START_OF_TURN, None, (lambda context: context.player.gain_lore(1),),
+                           "At the start of your turn, gain 1 lore.")
+    listener = {'card_id': all_cards_by_name[names[0]].card_id, 'exerted': False, 'damage': 0, 'dry': True,
+                'uuid': -1}
+    player.triggers.subscribe(listener, CardPlan((gain,), False))
+
+    runs = 100_000
+    for board_size in (0, 10, 1000):
+        player.play_area = [{'card_id': all_cards_by_name[names[i % len(names)]].card_id, 'exerted': False,
+                             'damage': 0, 'dry': True, 'uuid': i} for i in range(board_size)]
+        for playable_card in player.play_area:  # Cards with no triggered abilities subscribe to nothing
+            player.triggers.subscribe(playable_card, player.catalog.effect_engine.plan(playable_card['card_id']))
+        quest_us = timeit.timeit(lambda: player.triggers.fire(TriggerCondition.ON_QUEST, SELF, listener),
+                                 number=runs) / runs * 1e6
+        start_us = timeit.timeit(lambda: player.triggers.fire(TriggerCondition.START_OF_TURN, OWN),
+                                 number=runs) / runs * 1e6
+        print(f"{board_size:>5} other cards in play: ON_QUEST (no listener) {quest_us:.2f} us, "
+              f"START_OF_TURN (1 listener) {start_us:.2f} us")
+    print(f"Lore gained from START_OF_TURN: {player.lore}, {player.triggers!r}")
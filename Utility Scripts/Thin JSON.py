@@ -1,49 +1,20 @@
 import json
 import os
-import re
+import sys
 
 # Get the parent directory of the script's directory
 script_dir = os.path.dirname(os.path.abspath(__file__))
 parent_dir = os.path.dirname(script_dir)  # This goes up one level to the parent directory
+sys.path.insert(0, parent_dir)
+
+# The simplified entry format is shared with dataFetcher's incremental refresh
+from dataFetcher import simplify_card
 
 # Define the file paths using the parent directory
 input_file = os.path.join(parent_dir, "lorcana_cards.json")
 output_file = os.path.join(parent_dir, "lorcana_cards_simplified.json")
 
 
-def clean_body_text(text):
-    if not text:
-        return text
-
-    # Remove text between parentheses
-    text = re.sub(r'\([^)]*\)', '', text)
-
-    # Specific pattern for abilities followed by a colon
-    # Match a word or phrase at the start of a line or after a newline, followed by a colon and whitespace
-    text = re.sub(r'(^|\n)([^:\n]+):\s*', r'\1', text)
-
-    # Specific pattern for abilities followed by a dash
-    # Match a word or phrase at the start of a line or after a newline, followed by a dash and whitespace
-    text = re.sub(r'(^|\n)([^-\n]+)-\s*', r'\1', text)
-
-    # Replace patterns like "Trapped! " at the start of a line or after newline
-    text = re.sub(r'(^|\n)(\w+)!\s*', r'\1', text)
-
-    # Remove any redundant newlines that might have been created
-    text = re.sub(r'\n\s*\n', '\n', text)
-
-    text = re.sub(r"\n", ' ', text)
-    text = re.sub(r'\n*', ' ', text)
-
-    text = re.sub(r'{i}', ' ink', text)
-    text = re.sub(r'{w}', ' willpower', text)
-    text = re.sub(r'{s}', ' strength', text)
-    text = re.sub(r'{l}', ' lore', text)
-    text = re.sub(r'{e}', ' exert', text)
-
-    return text.strip()
-
-
 def create_smaller_json(input_file, output_file):
 	try:
 		print(f"Attempting to open file at: {input_file}")
@@ -62,25 +33,7 @@ def create_smaller_json(input_file, output_file):
 		# Create new list with only the specified fields
 		simplified_cards = []
 		for card in cards:
-			# Clean the Body_Text field
-			body_text = card.get("Body_Text")
-			cleaned_body_text = clean_body_text(body_text)
-
-			simplified_card = {
-					"Name":      card.get("Name"),
-					"Color":     card.get("Color"),
-					"Cost":      card.get("Cost"),
-					"Inkable":   card.get("Inkable"),
-					"Type":      card.get("Type"),
-					"Unique_ID": card.get("Unique_ID"),
-					"Body_Text": cleaned_body_text,
-					"Abilities": card.get("Abilities"),
-					"Willpower": card.get("Willpower"),
-					"Move Cost": card.get("Move Cost"),
-					"Strength":  card.get("Strength"),
-					"Lore":      card.get("Lore"),
-			}
-			simplified_cards.append(simplified_card)
+			simplified_cards.append(simplify_card(card))
 
 		# Write the simplified data to a new file
 		with open(output_file, 'w', encoding='utf-8') as f:
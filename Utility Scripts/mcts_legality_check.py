@@ -0,0 +1,60 @@
+import os
+import sys
+import time
+
+# Get the parent directory of the script's directory
+script_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(script_dir)  # This goes up one level to the parent directory
+sys.path.insert(0, parent_dir)
+os.chdir(parent_dir)  # Decklists and card data are referenced relative to the repository root
+
+from agents import greedy_agent
+from catalog import load_card_maps
+from deck import Deck, load_deck_identifiers_from_file
+from events import NULL_SINK
+from game_state import GameState
+from legal_actions import LegalActionGenerator, rescan_legal_actions
+from mcts_agent import MCTSAgent
+from player import Player
+from rng import game_rng
+
+'''
+Plays seeded MCTS games and checks that every action applied, during search or for real, is
+in rescan_legal_actions() for the position it is applied to. The search tree is reused
+between decisions of a turn while hidden cards are re-dealt for every decision, so a reused
+node must never replay an action that was only legal under an earlier deal.
+Game 5 of root seed 3 at 400 playouts applied an illegal play and crashed before the fix.
+'''
+
+applied, illegal = 0, []
+_apply = LegalActionGenerator.apply
+
+
+def checked_apply(generator, action):
+	global applied
+	applied += 1
+	if action not in rescan_legal_actions(generator.game):
+		illegal.append((generator.game.turn, action))
+	return _apply(generator, action)
+
+
+LegalActionGenerator.apply = checked_apply
+
+all_cards_by_id, _, _ = load_card_maps()
+name_resolver = next(iter(all_cards_by_id.values())).table.name_resolver
+names = load_deck_identifiers_from_file("Decks/BouncingBosses.txt")
+
+start = time.perf_counter()
+for game_index, playouts in ((5, 400), (0, 200), (1, 200), (2, 200), (3, 200)):
+	rng = game_rng(3, game_index)
+	game = GameState(Player("MCTS", Deck(names, name_resolver, rng), 0, NULL_SINK),
+	                 Player("Greedy", Deck(names, name_resolver, rng), 1, NULL_SINK), NULL_SINK)
+	before = len(illegal)
+	result = game.run(MCTSAgent(playouts=playouts), greedy_agent)
+	print(f"Game {game_index} ({playouts} playouts): winner {result.winner} after {result.turns} turns, "
+	      f"{len(illegal) - before} illegal actions")
+
+print(f"\n{applied} actions applied in {time.perf_counter() - start:.1f}s, {len(illegal)} illegal")
+for turn, action in illegal[:10]:
+	print(f"  turn {turn}: {action}")
+sys.exit(1 if illegal else 0)
@@ -0,0 +1,97 @@
+import json
+import os
+import sys
+import timeit
+
+# Get the parent directory of the script's directory
+script_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(script_dir)  # This goes up one level to the parent directory
+sys.path.insert(0, parent_dir)
+
+from CardEffects.ability_parser import (EFFECT_PATTERNS, OPTIMIZED_PATTERNS, classify_chunk, effect_candidates,
+                                        map_dynamic_trigger, _MAPPED_TRIGGERS)
+
+'''
+Times trigger classification of every body text chunk of every card: the old linear scan over
+OPTIMIZED_PATTERNS (with a substring search over dynamic_mapping keys) against classify_chunk
+(leading-word dispatch) with map_dynamic_trigger (trigger_key group lookup).
+
+Then times effect matching of every segment: searching all of EFFECT_PATTERNS against
+searching only the effect_candidates picked by the anchor-word prefilter.
+'''
+
+
+def split_chunks(body_text):
+	"""Splits body text into chunks the same way parse_abilities does."""
+	if '\r\n' in body_text:
+		chunks = []
+		for line in body_text.split('\r\n'):
+			line = line.strip()
+			if line:
+				chunks.extend(chunk.strip() for chunk in line.split('.') if chunk.strip())
+		return chunks
+	return [chunk.strip() for chunk in body_text.split('.') if chunk.strip()]
+
+
+def classify_linear(chunk):
+	"""The original scan: first matching pattern, then the first mapping key found in the chunk."""
+	for pattern in OPTIMIZED_PATTERNS:
+		match = pattern['regex'].match(chunk)
+		if match:
+			trigger = pattern['trigger']
+			if trigger in _MAPPED_TRIGGERS and 'dynamic_mapping' in pattern:
+				for key, mapped_trigger in pattern['dynamic_mapping'].items():
+					if key in chunk.lower():
+						trigger = mapped_trigger
+						break
+			return trigger
+
+
+def classify_dispatch(chunk):
+	"""The leading-word dispatch used by parse_abilities."""
+	for pattern in classify_chunk(chunk):
+		match = pattern['regex'].match(chunk)
+		if match:
+			trigger = pattern['trigger']
+			if trigger in _MAPPED_TRIGGERS and 'dynamic_mapping' in pattern:
+				trigger = map_dynamic_trigger(pattern, match)
+			return trigger
+
+
+def match_effect_linear(segment):
+	"""The original effect scan: the first EFFECT_PATTERNS entry found in the segment."""
+	for index, pattern in enumerate(EFFECT_PATTERNS):
+		if pattern['regex'].search(segment):
+			return index
+
+
+def match_effect_prefiltered(segment):
+	"""The prefiltered scan used by parse_effects."""
+	for pattern in effect_candidates(segment):
+		if pattern['regex'].search(segment):
+			return EFFECT_PATTERNS.index(pattern)
+
+
+def benchmark(label, function, items, unit):
+	runs = 20
+	seconds = min(timeit.repeat(lambda: [function(item) for item in items], number=runs, repeat=3)) / runs
+	print(f"{label:>22}: {len(items) / seconds:>10,.0f} {unit}/sec ({seconds * 1000:.2f} ms per pass)")
+
+
+with open(os.path.join(parent_dir, "lorcana_cards_simplified.json"), 'r', encoding='utf-8') as f:
+	cards = json.load(f)
+
+chunks = [chunk for card in cards if card.get("Body_Text") for chunk in split_chunks(card["Body_Text"])]
+mismatches = [chunk for chunk in chunks if classify_linear(chunk) != classify_dispatch(chunk)]
+print(f"{len(cards)} cards, {len(chunks)} body text chunks, {len(mismatches)} classification mismatches")
+for chunk in mismatches[:10]:
+	print(f"  {chunk!r}: {classify_linear(chunk)} vs {classify_dispatch(chunk)}")
+
+benchmark("Linear scan", classify_linear, chunks, "chunks")
+benchmark("Leading-word dispatch", classify_dispatch, chunks, "chunks")
+
+segments = [segment.strip() for chunk in chunks for segment in chunk.split(';') if segment.strip()]
+mismatches = [segment for segment in segments if match_effect_linear(segment) != match_effect_prefiltered(segment)]
+print(f"\n{len(segments)} effect segments, {len(mismatches)} effect pattern mismatches")
+benchmark("All effect patterns", match_effect_linear, segments, "segments")
+benchmark("Anchor-word prefilter", match_effect_prefiltered, segments, "segments")
@@ -0,0 +1,119 @@
+import json
+import os
+import sys
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Get the parent directory of the script's directory
+script_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(script_dir)  # This goes up one level to the parent directory
+sys.path.insert(0, parent_dir)
+
+from CardEffects.ability_cache import DEFAULT_CACHE_FILENAME, AbilityCache, ability_cache_key
+from dataFetcher import SIMPLIFIED_FILENAME, refresh_lorcana_data, simplify_card
+
+'''
+Runs refresh_lorcana_data against a local stand-in for the card API (http.server on a free
+port) and checks each response path:
+
+    1. first download               200, file and validators written
+    2. conditional, not modified    304, file kept, mtime renewed
+    3. conditional, card changed    200, merged, simplified JSON patched, ability cache entry dropped
+    4. new ETag, same cards         200, nothing rewritten
+'''
+
+
+class StandInAPI(BaseHTTPRequestHandler):
+	"""Serves `cards` with an ETag, answering 304 when the client's If-None-Match matches."""
+	cards = []
+	etag = '"v1"'
+	last_modified = "Sat, 01 Mar 2025 00:00:00 GMT"
+	requests_seen = []
+
+	def do_GET(self):
+		StandInAPI.requests_seen.append(dict(self.headers))
+		if self.headers.get("If-None-Match") == StandInAPI.etag:
+			self.send_response(304)
+			self.end_headers()
+			return
+		body = json.dumps(StandInAPI.cards).encode('utf-8')
+		self.send_response(200)
+		self.send_header("Content-Type", "application/json")
+		self.send_header("Content-Length", str(len(body)))
+		self.send_header("ETag", StandInAPI.etag)
+		self.send_header("Last-Modified", StandInAPI.last_modified)
+		self.end_headers()
+		self.wfile.write(body)
+
+	def log_message(self, format, *args):
+		pass  # Keep the check's output readable
+
+
+def check(label, condition):
+	print(f"  {'ok  ' if condition else 'FAIL'} {label}")
+	if not condition:
+		failures.append(label)
+
+
+with open(os.path.join(parent_dir, "lorcana_cards.json"), 'r', encoding='utf-8') as f:
+	StandInAPI.cards = json.load(f)[:5]
+
+failures = []
+server = ThreadingHTTPServer(("127.0.0.1", 0), StandInAPI)
+threading.Thread(target=server.serve_forever, daemon=True).start()
+url = f"http://127.0.0.1:{server.server_address[1]}/bulk/cards"
+
+with tempfile.TemporaryDirectory() as work_dir:
+	filename = os.path.join(work_dir, "lorcana_cards.json")
+
+	print("1. First download")
+	cards, changes = refresh_lorcana_data(url=url, filename=filename)
+	check("all cards added", len(changes["added"]) == 5 and len(cards) == 5)
+	check("no validators sent", "If-None-Match" not in StandInAPI.requests_seen[-1])
+	check("ETag stored", json.load(open(filename + ".meta.json"))["etag"] == StandInAPI.etag)
+
+	# Derived artifacts for the cards as they are now
+	with open(os.path.join(work_dir, SIMPLIFIED_FILENAME), 'w', encoding='utf-8') as f:
+		json.dump([simplify_card(card) for card in cards], f)
+	cache = AbilityCache(os.path.join(work_dir, DEFAULT_CACHE_FILENAME))
+	for card in cards:
+		cache.get_abilities(card.get("Body_Text") or None, card.get("Abilities"))
+	cache.save()
+	changed_card = cards[0]
+	old_key = ability_cache_key(changed_card.get("Body_Text") or None, changed_card.get("Abilities"))
+	check("ability cache primed", old_key in cache.entries)
+
+	print("2. Not modified")
+	os.utime(filename, (0, 0))
+	cards, changes = refresh_lorcana_data(url=url, filename=filename)
+	check("If-None-Match sent", StandInAPI.requests_seen[-1].get("If-None-Match") == StandInAPI.etag)
+	check("If-Modified-Since sent", StandInAPI.requests_seen[-1].get("If-Modified-Since") == StandInAPI.last_modified)
+	check("no changes", not any(changes.values()) and len(cards) == 5)
+	check("mtime renewed", os.path.getmtime(filename) > 0)
+
+	print("3. One card changed")
+	updated = dict(changed_card, Body_Text="Draw 2 cards.", Date_Modified="2099-01-01 00:00:00.0")
+	StandInAPI.cards = [updated] + StandInAPI.cards[1:]
+	StandInAPI.etag = '"v2"'
+	cards, changes = refresh_lorcana_data(url=url, filename=filename)
+	check("only that card updated", changes == {"added": [], "updated": [changed_card["Unique_ID"]], "removed": []})
+	check("local file merged", json.load(open(filename, encoding='utf-8'))[0]["Body_Text"] == "Draw 2 cards.")
+	simplified = json.load(open(os.path.join(work_dir, SIMPLIFIED_FILENAME), encoding='utf-8'))
+	check("simplified JSON patched", simplified[0]["Body_Text"] == "Draw 2 cards." and len(simplified) == 5)
+	check("stale ability cache entry dropped",
+	      old_key not in AbilityCache(os.path.join(work_dir, DEFAULT_CACHE_FILENAME)).entries)
+
+	print("4. New ETag, same cards")
+	StandInAPI.etag = '"v3"'
+	before = open(filename, 'rb').read()
+	os.utime(filename, (0, 0))
+	cards, changes = refresh_lorcana_data(url=url, filename=filename)
+	check("no changes", not any(changes.values()))
+	check("file not rewritten", open(filename, 'rb').read() == before)
+	check("mtime renewed", os.path.getmtime(filename) > 0)
+	check("new ETag stored", json.load(open(filename + ".meta.json"))["etag"] == '"v3"')
+
+server.shutdown()
+print(f"\n{'All checks passed' if not failures else f'{len(failures)} checks failed'}")
+sys.exit(1 if failures else 0)
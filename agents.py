@@ -0,0 +1,88 @@
+# agents.py
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # game_state.py imports nothing from here, agents only need the types
+    from game_state import GameState
+    from player import Player
+
+'''
+Simple agents for GameState.run().
+
+An agent plays one main phase for the active player by calling Player methods
+(ink_card, play_card, quest, challenge) and returns to end the turn.
+'''
+
+
+def _quest_with_everything(player: 'Player') -> None:
+    """Quests with every ready, dry character that has (effective) lore."""
+    for playable in list(player.play_area):
+        if playable['exerted'] or not playable['dry']:
+            continue
+        if player.card(playable['card_id']).type == "Character" and player.stats.lore(playable) > 0:
+            player.quest(playable)
+
+
+def greedy_agent(game: 'GameState', player: 'Player') -> None:
+    """
+    Inks the most expensive inkable card, plays the most expensive affordable cards,
+    then quests with every character that can.
+    """
+    if not player.has_inked_this_turn:
+        inkable = [card_id for card_id in player.hand if player.card(card_id).inkable]
+        if inkable:
+            player.ink_card(max(inkable, key=lambda card_id: player.card(card_id).cost))
+
+    while True:
+        affordable = [card_id for card_id in player.hand if player.card(card_id).cost <= player.ready_ink]
+        if not affordable:
+            break
+        player.play_card(max(affordable, key=lambda card_id: player.card(card_id).cost))
+
+    _quest_with_everything(player)
+
+
+def random_agent(game: 'GameState', player: 'Player') -> None:
+    """Inks, plays and quests with uniformly random legal choices from the game's rng (a baseline opponent)."""
+    if not player.has_inked_this_turn:
+        inkable = [card_id for card_id in player.hand if player.card(card_id).inkable]
+        if inkable and game.rng.random() < 0.8:
+            player.ink_card(game.rng.choice(inkable))
+
+    while True:
+        affordable = [card_id for card_id in player.hand if player.card(card_id).cost <= player.ready_ink]
+        if not affordable or game.rng.random() < 0.2:
+            break
+        player.play_card(game.rng.choice(affordable))
+
+    _quest_with_everything(player)
+
+
+# --- Example Usage ---
+if __name__ == "__main__":
+    import time
+    from catalog import load_card_maps
+    from deck import Deck, load_deck_identifiers_from_file
+    from events import NULL_SINK
+    from game_state import GameState
+    from player import Player
+
+    all_cards_by_id, _, _ = load_card_maps()
+    name_resolver = next(iter(all_cards_by_id.values())).table.name_resolver
+    # Mirror match, so the agents are compared rather than the decks
+    deck_names = load_deck_identifiers_from_file("Decks/BouncingBosses.txt")
+    decks_1 = [Deck(deck_names, name_resolver) for _ in range(500)]
+    decks_2 = [Deck(deck_names, name_resolver) for _ in range(500)]
+
+    wins = [0, 0]
+    start = time.perf_counter()
+    for deck_1, deck_2 in zip(decks_1, decks_2):
+        game = GameState(Player("Greedy", deck_1, 0, NULL_SINK), Player("Random", deck_2, 1, NULL_SINK), NULL_SINK)
+        result = game.run(greedy_agent, random_agent)
+        if result.winner is not None:
+            wins[result.winner] += 1
+    elapsed = time.perf_counter() - start
+
+    print(f"\nLast game: {result.reason} after {result.turns} turns, lore curves {result.lore_curve}")
+    print(f"Greedy {wins[0]} - Random {wins[1]} over {len(decks_1)} games "
+          f"({len(decks_1) / elapsed:.0f} games/sec)")
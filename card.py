@@ -1,6 +1,27 @@
 import json
-from typing import List, Optional
-from effects import EffectData
+from typing import Iterable, List, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:  # effects.py imports Card, so only import EffectData for type checking
+    from effects import EffectData
+    from CardEffects.ability import Ability
+
+from card_table import MISSING_STAT, CardTable
+
+
+def _optional_int(value) -> Optional[int]:
+    """Converts a raw stat to int, returning None for missing or unparsable values."""
+    if value is None:
+        return None
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        return None
+
+
+def _table_stat(value) -> Optional[int]:
+    """Converts a CardTable stat cell to int, or None for MISSING_STAT."""
+    return None if value == MISSING_STAT else int(value)
+
 
 class Card:
     """Represents a single Lorcana card with relevant attributes for simulation."""
@@ -15,6 +36,9 @@ class Card:
         # --- Core Identification & Cost ---
         self.name: str = card_data.get("Name", "Unknown Name")
         self.unique_id: str | None = card_data.get("Unique_ID") # Keep Unique_ID if available
+        # Set code, e.g. 'TFC'; snapshots don't carry Set_ID, so fall back to the Unique_ID prefix
+        self.set_id: str | None = card_data.get("Set_ID") or (
+            self.unique_id.split('-', 1)[0].upper() if self.unique_id and '-' in self.unique_id else None)
         self.cost: int = card_data.get("Cost", 0)
         self.inkable: bool = card_data.get("Inkable", False)
 
@@ -24,9 +48,10 @@ class Card:
         self.colors: list[str] = [c.strip() for c in raw_color.split(',')] if raw_color else []
 
         # --- Character Stats (handle None for non-characters) ---
-        self.strength: int | None = card_data.get("Strength")
-        self.willpower: int | None = card_data.get("Willpower")
-        self.lore: int | None = card_data.get("Lore")
+        # Sanity check/conversion: unparsable values are treated as missing
+        self.strength: int | None = _optional_int(card_data.get("Strength"))
+        self.willpower: int | None = _optional_int(card_data.get("Willpower"))
+        self.lore: int | None = _optional_int(card_data.get("Lore"))
 
         # --- Rules Text & Keywords ---
         self.body_text: str = card_data.get("Body_Text", "")
@@ -35,27 +60,27 @@ class Card:
         raw_abilities: str | None = card_data.get("Abilities")
         self.abilities: list[str] = [a.strip() for a in raw_abilities.split(',')] if raw_abilities else []
 
-        # --- Sanity check/conversion for numerical stats ---
-        if self.strength is not None:
-            try:
-                self.strength = int(self.strength)
-            except (ValueError, TypeError):
-                # print(f"Warning: Could not convert Strength '{self.strength}' to int for card '{self.name}'. Setting to None.")
-                self.strength = None
-        if self.willpower is not None:
-            try:
-                self.willpower = int(self.willpower)
-            except (ValueError, TypeError):
-                # print(f"Warning: Could not convert Willpower '{self.willpower}' to int for card '{self.name}'. Setting to None.")
-                self.willpower = None
-        if self.lore is not None:
-            try:
-                self.lore = int(self.lore)
-            except (ValueError, TypeError):
-                # print(f"Warning: Could not convert Lore '{self.lore}' to int for card '{self.name}'. Setting to None.")
-                self.lore = None
-
-        self.parsed_effects: List[EffectData] = []
+        # --- CardTable row (set by parse_card_data via CardTable) ---
+        self.table: Optional[CardTable] = None
+        self.card_id: Optional[int] = None
+
+        self.parsed_effects: List['EffectData'] = []
+        # Filled by CardEffects.ability_cache.attach_parsed_abilities (cached parse_abilities output)
+        self.parsed_abilities: List['Ability'] = []
+
+    def bind_row(self, table: CardTable, card_id: int) -> None:
+        """
+        Binds this card to row card_id of a CardTable.
+        The row's numeric stats are copied back into plain attributes (in the table's
+        normalized form), so stat reads in the game loop never touch NumPy scalars.
+        """
+        self.table = table
+        self.card_id = card_id
+        self.cost = int(table.cost[card_id])
+        self.inkable = bool(table.inkable[card_id])
+        self.strength = _table_stat(table.strength[card_id])
+        self.willpower = _table_stat(table.willpower[card_id])
+        self.lore = _table_stat(table.lore[card_id])
 
     def __str__(self) -> str:
         """Provides a user-friendly string representation."""
@@ -72,13 +97,17 @@ class Card:
 
 # --- Updated Helper function to parse the full list ---
 
-def parse_card_data(raw_data_list: list[dict]) -> tuple[dict[str, Card], dict[str, Card], dict[str, Card]]:
+def parse_card_data(raw_data_list: Iterable[dict]) -> tuple[dict[str, Card], dict[str, Card], dict[str, Card]]:
     """
-    Parses a list of raw card dictionaries into dictionaries of Card objects,
+    Parses raw card dictionaries into dictionaries of Card objects,
     mapped by Unique_ID, by Name, and by lowercase Name.
+    raw_data_list may be a generator (e.g. dataFetcher.iter_card_records), in which
+    case each raw dictionary can be released as soon as its Card is built.
+    All cards are also placed in a shared CardTable (reachable as card.table),
+    which assigns each one a dense integer card_id.
 
     Args:
-        raw_data_list: A list of dictionaries, where each dict is raw card data.
+        raw_data_list: An iterable of dictionaries, where each dict is raw card data.
 
     Returns:
         A tuple containing three dictionaries:
@@ -94,9 +123,11 @@ def parse_card_data(raw_data_list: list[dict]) -> tuple[dict[str, Card], dict[st
 
     duplicate_names = set()
     seen_names = set()
+    all_cards: List[Card] = []  # Source order; position becomes the CardTable card_id
 
     for card_data in raw_data_list:
         card_obj = Card(card_data)
+        all_cards.append(card_obj)
 
         # Map by Unique_ID if available
         if card_obj.unique_id:
@@ -126,6 +157,9 @@ def parse_card_data(raw_data_list: list[dict]) -> tuple[dict[str, Card], dict[st
         else:
             print(f"Warning: Card data missing Name field: {card_data}")
 
+    # Build the columnar table; every Card becomes a view over its row
+    CardTable(all_cards)
+
     print(f"Parsed {len(cards_by_id)} cards by Unique_ID and {len(cards_by_name)} cards by Name.")
     if duplicate_names:
         print(f"Note: The following card names appeared multiple times: {list(duplicate_names)}")
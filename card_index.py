@@ -0,0 +1,204 @@
+# card_index.py
+
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional
+
+import numpy as np
+
+from card_table import keyword_of
+
+if TYPE_CHECKING:  # card_table.py builds the index lazily, so only import for type checking
+    from card import Card
+    from card_table import CardTable
+
+'''
+Secondary indexes and a composable query API over a CardTable.
+
+Every index maps a value (color, type, classification, cost, keyword, set, inkability)
+to a bitset of card ids stored as a Python int, so intersections, unions and ranges are
+single big-int operations over ~1.4k bits:
+
+    index = table.index
+    pirates = (index.query().classification("Pirate").type("Character")
+               .cost(max_cost=3).color("Ruby", "Sapphire"))
+    for card in pirates.cards(): ...
+'''
+
+
+def _mask_to_bits(mask: np.ndarray) -> int:
+    """Converts a boolean NumPy mask over card ids into a bitset int."""
+    return int.from_bytes(np.packbits(mask, bitorder='little').tobytes(), 'little')
+
+
+def _bits_to_ids(bits: int) -> List[int]:
+    """Expands a bitset int into the ascending list of card ids it contains."""
+    ids = []
+    while bits:
+        low = bits & -bits
+        ids.append(low.bit_length() - 1)
+        bits ^= low
+    return ids
+
+
+class CardIndex:
+    """Prebuilt bitset indexes over one CardTable (see CardTable.index)."""
+
+    def __init__(self, table: 'CardTable'):
+        """
+        Builds every index in one pass over the table's cards.
+
+        Args:
+            table: The CardTable whose card ids the bitsets refer to.
+        """
+        self.table = table
+        self.all: int = (1 << len(table)) - 1
+        self.by_color: Dict[str, int] = {}
+        self.by_type: Dict[str, int] = {}
+        self.by_classification: Dict[str, int] = {}
+        self.by_keyword: Dict[str, int] = {}
+        self.by_set: Dict[str, int] = {}
+        self.by_cost: Dict[int, int] = {}
+        self.inkable: int = _mask_to_bits(table.inkable)
+
+        for card_id, card in enumerate(table.cards):
+            bit = 1 << card_id
+            for color in card.colors:
+                self.by_color[color.lower()] = self.by_color.get(color.lower(), 0) | bit
+            self.by_type[card.type.lower()] = self.by_type.get(card.type.lower(), 0) | bit
+            for classification in card.classifications:
+                key = classification.lower()
+                self.by_classification[key] = self.by_classification.get(key, 0) | bit
+            for ability in card.abilities:
+                keyword = keyword_of(ability)
+                if keyword:
+                    self.by_keyword[keyword.lower()] = self.by_keyword.get(keyword.lower(), 0) | bit
+            if card.set_id:
+                self.by_set[card.set_id.upper()] = self.by_set.get(card.set_id.upper(), 0) | bit
+            cost = int(table.cost[card_id])
+            self.by_cost[cost] = self.by_cost.get(cost, 0) | bit
+
+        # Prefix unions so any cost range is one AND-NOT of two lookups
+        self.max_cost = max(self.by_cost, default=0)
+        self._cost_at_most: List[int] = []
+        running = 0
+        for cost in range(self.max_cost + 1):
+            running |= self.by_cost.get(cost, 0)
+            self._cost_at_most.append(running)
+
+    def cost_range(self, min_cost: Optional[int] = None, max_cost: Optional[int] = None) -> int:
+        """Bitset of cards whose cost lies in [min_cost, max_cost] (either bound may be omitted)."""
+        upper = self.all if max_cost is None or max_cost >= self.max_cost else (
+            self._cost_at_most[max_cost] if max_cost >= 0 else 0)
+        if min_cost is None or min_cost <= 0:
+            return upper
+        if min_cost > self.max_cost:
+            return 0
+        return upper & ~self._cost_at_most[min_cost - 1]
+
+    def query(self) -> 'CardQuery':
+        """Starts a query that matches every card; narrow it with the CardQuery methods."""
+        return CardQuery(self, self.all)
+
+
+class CardQuery:
+    """
+    An immutable set of card ids with chainable filters.
+
+    Filters taking several values match any of them (e.g. color("Ruby", "Sapphire")),
+    and chained filters intersect. Queries also combine with &, | and -.
+    """
+
+    __slots__ = ("index", "bits")
+
+    def __init__(self, index: CardIndex, bits: int):
+        self.index = index
+        self.bits = bits
+
+    def _any_of(self, lookup: Dict, values, normalise) -> 'CardQuery':
+        union = 0
+        for value in values:
+            union |= lookup.get(normalise(value), 0)
+        return CardQuery(self.index, self.bits & union)
+
+    # --- Filters ---
+
+    def color(self, *colors: str) -> 'CardQuery':
+        return self._any_of(self.index.by_color, colors, str.lower)
+
+    def type(self, *type_names: str) -> 'CardQuery':
+        return self._any_of(self.index.by_type, type_names, str.lower)
+
+    def classification(self, *classifications: str) -> 'CardQuery':
+        return self._any_of(self.index.by_classification, classifications, str.lower)
+
+    def keyword(self, *keywords: str) -> 'CardQuery':
+        return self._any_of(self.index.by_keyword, keywords,
+                            lambda kw: (keyword_of(kw) or kw).lower())
+
+    def set(self, *set_ids: str) -> 'CardQuery':
+        return self._any_of(self.index.by_set, set_ids, str.upper)
+
+    def inkable(self, inkable: bool = True) -> 'CardQuery':
+        if inkable:
+            return CardQuery(self.index, self.bits & self.index.inkable)
+        return CardQuery(self.index, self.bits & ~self.index.inkable)
+
+    def cost(self, min_cost: Optional[int] = None, max_cost: Optional[int] = None) -> 'CardQuery':
+        return CardQuery(self.index, self.bits & self.index.cost_range(min_cost, max_cost))
+
+    def where(self, mask: np.ndarray) -> 'CardQuery':
+        """Intersects with an arbitrary boolean CardTable mask (e.g. table.lore >= 2)."""
+        return CardQuery(self.index, self.bits & _mask_to_bits(mask))
+
+    # --- Set algebra ---
+
+    def __and__(self, other: 'CardQuery') -> 'CardQuery':
+        return CardQuery(self.index, self.bits & other.bits)
+
+    def __or__(self, other: 'CardQuery') -> 'CardQuery':
+        return CardQuery(self.index, self.bits | other.bits)
+
+    def __sub__(self, other: 'CardQuery') -> 'CardQuery':
+        return CardQuery(self.index, self.bits & ~other.bits)
+
+    # --- Results ---
+
+    def __len__(self) -> int:
+        return self.bits.bit_count()
+
+    def __contains__(self, card_id: int) -> bool:
+        return bool(self.bits >> card_id & 1)
+
+    def ids(self) -> List[int]:
+        """Matching card ids, ascending."""
+        return _bits_to_ids(self.bits)
+
+    def cards(self) -> List['Card']:
+        """Matching Card objects, in card id order."""
+        cards = self.index.table.cards
+        return [cards[card_id] for card_id in _bits_to_ids(self.bits)]
+
+    def __iter__(self) -> Iterator['Card']:
+        return iter(self.cards())
+
+    def __repr__(self) -> str:
+        return f"<CardQuery matching {len(self)} cards>"
+
+
+# --- Example Usage ---
+if __name__ == "__main__":
+    import timeit
+    from catalog import load_card_maps
+
+    all_cards_by_id, _, _ = load_card_maps()
+    index = next(iter(all_cards_by_id.values())).table.index
+
+    def pirates():
+        return (index.query().classification("Pirate").type("Character")
+                .cost(max_cost=3).color("Ruby", "Sapphire"))
+
+    result = pirates()
+    print(f"\nPirate characters costing 3 or less in Ruby/Sapphire: {len(result)}")
+    for card in result.cards():
+        print(f"  {card}")
+    runs = 10000
+    print(f"Query time: {timeit.timeit(pirates, number=runs) / runs * 1e6:.1f} us")
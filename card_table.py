@@ -0,0 +1,207 @@
+# card_table.py
+
+import re
+from typing import TYPE_CHECKING, Iterable, List, Optional
+
+import numpy as np
+
+if TYPE_CHECKING:  # card.py builds the table, so only import Card for type checking
+    from card import Card
+    from card_index import CardIndex
+    from name_resolver import NameResolver
+    from zobrist import ZobristKeys
+    from CardEffects.effect_engine import EffectEngine
+
+# --- Column encodings ---
+# Type codes index into CARD_TYPES; anything unrecognised is stored as TYPE_UNKNOWN.
+CARD_TYPES = ("Character", "Action", "Action - Song", "Item", "Location")
+TYPE_UNKNOWN = 255
+
+# Bit i of color_mask is set when the card has COLORS[i]
+COLORS = ("Amber", "Amethyst", "Emerald", "Ruby", "Sapphire", "Steel")
+
+# Bit i of keyword_mask is set when the card's Abilities list contains KEYWORDS[i] (any value, any Shift variant)
+KEYWORDS = (
+    "Bodyguard", "Challenger", "Evasive", "Reckless", "Resist", "Rush",
+    "Shift", "Singer", "Sing Together", "Support", "Vanish", "Ward",
+    )
+KEYWORD_REGEX = re.compile(r"\b(" + "|".join(sorted(KEYWORDS, key=len, reverse=True)) + r")\b", re.IGNORECASE)
+_KEYWORD_LOOKUP = {kw.lower(): kw for kw in KEYWORDS}
+
+MISSING_STAT = -1  # Stored for Strength/Willpower/Lore of cards that have none (Actions, Items, ...)
+
+
+def type_code(type_name: str) -> int:
+    """Returns the type code used in CardTable.type_code for a card Type string."""
+    try:
+        return CARD_TYPES.index(type_name)
+    except ValueError:
+        return TYPE_UNKNOWN
+
+
+def color_bits(*colors: str) -> int:
+    """Returns the color bitmask for the given color names (unknown names are ignored)."""
+    mask = 0
+    for color in colors:
+        if color in COLORS:
+            mask |= 1 << COLORS.index(color)
+    return mask
+
+
+def keyword_of(ability: str) -> Optional[str]:
+    """Maps an Abilities entry (e.g. 'Challenger +2', 'Puppy Shift 3') to its base keyword, or None."""
+    match = KEYWORD_REGEX.search(ability)
+    return _KEYWORD_LOOKUP[match.group(1).lower()] if match else None
+
+
+def keyword_bits(*keywords: str) -> int:
+    """Returns the keyword bitmask for the given keyword names or Abilities entries."""
+    mask = 0
+    for ability in keywords:
+        keyword = keyword_of(ability)
+        if keyword:
+            mask |= 1 << KEYWORDS.index(keyword)
+    return mask
+
+
+class CardTable:
+    """
+    Column-oriented view of a card pool.
+
+    Each stat is a NumPy array indexed by a dense integer card id (0..len-1), so pool-wide
+    questions are answered with boolean masks instead of Python loops over Card objects:
+
+        table.inkable & table.has_color("Amber") & table.is_type("Character")
+            & (table.cost <= 3) & (table.lore >= 2)
+
+    Card objects bound to the table take their numeric stats from its row.
+    """
+
+    def __init__(self, cards: Iterable['Card']):
+        """
+        Builds the columns from a sequence of Card objects and binds each card to its row.
+
+        Args:
+            cards: The cards of the pool. The position of each card becomes its card_id.
+        """
+        self.cards: List['Card'] = list(cards)
+        size = len(self.cards)
+
+        self.cost = np.zeros(size, dtype=np.int16)
+        self.strength = np.full(size, MISSING_STAT, dtype=np.int16)
+        self.willpower = np.full(size, MISSING_STAT, dtype=np.int16)
+        self.lore = np.full(size, MISSING_STAT, dtype=np.int16)
+        self.inkable = np.zeros(size, dtype=bool)
+        self.type_code = np.full(size, TYPE_UNKNOWN, dtype=np.uint8)
+        self.color_mask = np.zeros(size, dtype=np.uint8)
+        self.keyword_mask = np.zeros(size, dtype=np.uint16)
+
+        for card_id, card in enumerate(self.cards):
+            self.cost[card_id] = card.cost or 0
+            if card.strength is not None:
+                self.strength[card_id] = card.strength
+            if card.willpower is not None:
+                self.willpower[card_id] = card.willpower
+            if card.lore is not None:
+                self.lore[card_id] = card.lore
+            self.inkable[card_id] = bool(card.inkable)
+            self.type_code[card_id] = type_code(card.type)
+            self.color_mask[card_id] = color_bits(*card.colors)
+            self.keyword_mask[card_id] = keyword_bits(*card.abilities)
+            card.bind_row(self, card_id)
+
+        self._index: Optional['CardIndex'] = None
+        self._name_resolver: Optional['NameResolver'] = None
+        self._zobrist_keys: Optional['ZobristKeys'] = None
+        self._effect_engine: Optional['EffectEngine'] = None
+        # Where the EffectEngine finds cached parse results (set by catalog.load_card_maps)
+        self.ability_cache_path: Optional[str] = None
+
+    def __len__(self) -> int:
+        return len(self.cards)
+
+    def card(self, card_id: int) -> 'Card':
+        """Returns the Card object for a card id."""
+        return self.cards[card_id]
+
+    @property
+    def index(self) -> 'CardIndex':
+        """Bitset indexes and query API over this table (built on first use, then shared)."""
+        if self._index is None:
+            from card_index import CardIndex
+            self._index = CardIndex(self)
+        return self._index
+
+    @property
+    def name_resolver(self) -> 'NameResolver':
+        """Name lookups for decklists over this table (built on first use, then shared by every Deck)."""
+        if self._name_resolver is None:
+            from name_resolver import NameResolver
+            self._name_resolver = NameResolver(self.cards)
+        return self._name_resolver
+
+    @property
+    def zobrist_keys(self) -> 'ZobristKeys':
+        """Zobrist hash keys for positions using this table's cards (built on first use, then shared)."""
+        if self._zobrist_keys is None:
+            from zobrist import ZobristKeys
+            self._zobrist_keys = ZobristKeys(self)
+        return self._zobrist_keys
+
+    @property
+    def effect_engine(self) -> 'EffectEngine':
+        """Compiled ability plans for this table's cards (each card compiled on first use, then shared)."""
+        if self._effect_engine is None:
+            from CardEffects.effect_engine import EffectEngine
+            self._effect_engine = EffectEngine(self)
+        return self._effect_engine
+
+    # --- Mask builders ---
+
+    def has_color(self, *colors: str) -> np.ndarray:
+        """Mask of cards that have any of the given colors."""
+        return (self.color_mask & color_bits(*colors)) != 0
+
+    def is_type(self, *type_names: str) -> np.ndarray:
+        """Mask of cards whose Type is one of the given type names."""
+        return np.isin(self.type_code, [type_code(name) for name in type_names])
+
+    def has_keyword(self, *keywords: str) -> np.ndarray:
+        """Mask of cards that have any of the given keywords."""
+        return (self.keyword_mask & keyword_bits(*keywords)) != 0
+
+    def has_stats(self) -> np.ndarray:
+        """Mask of cards with printed Strength/Willpower (characters)."""
+        return (self.strength != MISSING_STAT) & (self.willpower != MISSING_STAT)
+
+    # --- Results ---
+
+    def ids(self, mask: np.ndarray) -> np.ndarray:
+        """Card ids selected by a boolean mask."""
+        return np.flatnonzero(mask)
+
+    def select(self, mask: np.ndarray) -> List['Card']:
+        """Card objects selected by a boolean mask."""
+        return [self.cards[card_id] for card_id in np.flatnonzero(mask)]
+
+    def __repr__(self) -> str:
+        return f"<CardTable containing {len(self.cards)} cards>"
+
+
+# --- Example Usage ---
+if __name__ == "__main__":
+    from catalog import load_card_maps
+
+    all_cards_by_id, _, _ = load_card_maps()
+    table = next(iter(all_cards_by_id.values())).table
+
+    mask = (table.inkable & table.has_color("Amber") & table.is_type("Character")
+            & (table.cost <= 3) & (table.lore >= 2))
+    print(f"\nInkable Amber characters with cost <= 3 and lore >= 2: {int(mask.sum())}")
+    for card in table.select(mask)[:10]:
+        print(f"  {card}")
+
+    characters = table.is_type("Character")
+    print(f"\nAverage character cost: {table.cost[characters].mean():.2f}, "
+          f"average lore: {table.lore[characters].mean():.2f}")
+    print(f"Evasive cards: {int(table.has_keyword('Evasive').sum())}")
@@ -0,0 +1,363 @@
+# catalog.py
+
+import hashlib
+import mmap
+import os
+import struct
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from card import Card, parse_card_data
+
+'''
+Compiled card catalog snapshot.
+
+lorcana_cards.json carries ~25 fields per card, most of which the simulator never
+reads. build_catalog_snapshot() compiles only the simulation fields into a compact,
+versioned binary file with precomputed Unique_ID and name indexes. Workers memory-map
+the snapshot instead of json.load()-ing the full source on every start.
+
+Layout (little-endian):
+    header   - SNAPSHOT_HEADER (magic, format version, card count, source fingerprint, section offsets)
+    records  - card_count x SNAPSHOT_RECORD (string offsets + numeric stats)
+    id index - card_count x u32 record numbers, sorted by Unique_ID
+    name idx - card_count x u32 record numbers, sorted by lowercase Name
+    strings  - u32 length-prefixed UTF-8 strings, deduplicated
+'''
+
+SNAPSHOT_MAGIC = b"LORCCAT\x00"
+SNAPSHOT_VERSION = 1
+SNAPSHOT_SUFFIX = ".catalog"
+
+# magic, version, reserved, card_count, source_size, source_mtime_ns, source_sha256,
+# records_offset, id_index_offset, name_index_offset, strings_offset
+SNAPSHOT_HEADER = struct.Struct("<8sHHIQq32sIIII")
+# uid, name, type, colors, classifications, abilities, body_text, cost, strength, willpower, lore, inkable
+SNAPSHOT_RECORD = struct.Struct("<7I4h?3x")
+INDEX_ENTRY = struct.Struct("<I")
+STRING_LENGTH = struct.Struct("<I")
+
+NO_STRING = 0xFFFFFFFF  # String offset used for fields missing from the source card
+NO_VALUE = -1  # Stat value used for fields missing from the source card (Strength/Willpower/Lore of non-characters)
+
+# Source fields kept in the snapshot, in record order
+STRING_FIELDS = ("Unique_ID", "Name", "Type", "Color", "Classifications", "Abilities", "Body_Text")
+STAT_FIELDS = ("Cost", "Strength", "Willpower", "Lore")
+
+
+def default_snapshot_path(source_path: str) -> str:
+    """Returns the snapshot path that sits next to the given source JSON file."""
+    return os.path.splitext(source_path)[0] + SNAPSHOT_SUFFIX
+
+
+def _file_sha256(path: str) -> bytes:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.digest()
+
+
+def _stat_value(value) -> int:
+    """Converts a raw stat to the snapshot's int16 encoding (NO_VALUE for missing/unparsable)."""
+    if value is None:
+        return NO_VALUE
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        return NO_VALUE
+
+
+def build_catalog_snapshot(raw_cards: Iterable[dict], snapshot_path: str, source_path: Optional[str] = None) -> int:
+    """
+    Compiles raw card dictionaries into a binary catalog snapshot.
+
+    Args:
+        raw_cards: Raw card dictionaries (as returned by fetch_lorcana_data).
+        snapshot_path: Where to write the snapshot.
+        source_path: The JSON file the cards came from. Its size, mtime and hash are
+                     stored in the header so stale snapshots are detected on load.
+
+    Returns:
+        The number of cards written.
+    """
+    strings = bytearray()
+    string_offsets: Dict[str, int] = {}
+
+    def intern(value) -> int:
+        if value is None:
+            return NO_STRING
+        value = str(value)
+        offset = string_offsets.get(value)
+        if offset is None:
+            encoded = value.encode('utf-8')
+            offset = len(strings)
+            strings.extend(STRING_LENGTH.pack(len(encoded)))
+            strings.extend(encoded)
+            string_offsets[value] = offset
+        return offset
+
+    records = bytearray()
+    id_keys: List[Tuple[str, int]] = []
+    name_keys: List[Tuple[str, int]] = []
+    for record_num, card_data in enumerate(raw_cards):
+        records.extend(SNAPSHOT_RECORD.pack(
+                *(intern(card_data.get(field)) for field in STRING_FIELDS),
+                *(_stat_value(card_data.get(field)) for field in STAT_FIELDS),
+                bool(card_data.get("Inkable", False)),
+                ))
+        id_keys.append((card_data.get("Unique_ID") or "", record_num))
+        name_keys.append(((card_data.get("Name") or "").lower(), record_num))
+
+    card_count = len(id_keys)
+    id_index = b"".join(INDEX_ENTRY.pack(num) for _, num in sorted(id_keys))
+    name_index = b"".join(INDEX_ENTRY.pack(num) for _, num in sorted(name_keys))
+
+    if source_path:
+        source_stat = os.stat(source_path)
+        source_size, source_mtime_ns = source_stat.st_size, source_stat.st_mtime_ns
+        source_sha256 = _file_sha256(source_path)
+    else:
+        source_size, source_mtime_ns, source_sha256 = 0, 0, b"\x00" * 32
+
+    records_offset = SNAPSHOT_HEADER.size
+    id_index_offset = records_offset + len(records)
+    name_index_offset = id_index_offset + len(id_index)
+    strings_offset = name_index_offset + len(name_index)
+    header = SNAPSHOT_HEADER.pack(
+            SNAPSHOT_MAGIC, SNAPSHOT_VERSION, 0, card_count,
+            source_size, source_mtime_ns, source_sha256,
+            records_offset, id_index_offset, name_index_offset, strings_offset,
+            )
+
+    # Write to a temporary file first so concurrent workers never map a half-written snapshot
+    tmp_path = f"{snapshot_path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(header)
+            f.write(records)
+            f.write(id_index)
+            f.write(name_index)
+            f.write(strings)
+        os.replace(tmp_path, snapshot_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return card_count
+
+
+class CatalogSnapshot:
+    """Read-only, memory-mapped view over a compiled catalog snapshot."""
+
+    def __init__(self, snapshot_path: str):
+        """
+        Maps a snapshot file into memory and validates its header.
+
+        Args:
+            snapshot_path: Path to a file written by build_catalog_snapshot.
+
+        Raises:
+            ValueError: If the file is not a snapshot or was written by another format version.
+        """
+        self.path = snapshot_path
+        with open(snapshot_path, 'rb') as f:
+            self._buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self._buffer) < SNAPSHOT_HEADER.size:
+            self.close()
+            raise ValueError(f"'{snapshot_path}' is too small to be a catalog snapshot.")
+
+        (magic, version, _reserved, self.card_count,
+         self.source_size, self.source_mtime_ns, self.source_sha256,
+         self._records_offset, self._id_index_offset, self._name_index_offset,
+         self._strings_offset) = SNAPSHOT_HEADER.unpack_from(self._buffer, 0)
+        if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_VERSION:
+            self.close()
+            raise ValueError(f"'{snapshot_path}' is not a version {SNAPSHOT_VERSION} catalog snapshot.")
+
+    def close(self) -> None:
+        """Releases the memory map."""
+        self._buffer.close()
+
+    def __enter__(self) -> 'CatalogSnapshot':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self.card_count
+
+    def matches_source(self, source_path: str) -> bool:
+        """
+        Checks whether the snapshot was compiled from the current contents of source_path.
+        Size and mtime are compared first; the content hash is only computed when they differ.
+        """
+        try:
+            source_stat = os.stat(source_path)
+        except OSError:
+            return False
+        if source_stat.st_size != self.source_size:
+            return False
+        if source_stat.st_mtime_ns == self.source_mtime_ns:
+            return True
+        return _file_sha256(source_path) == self.source_sha256
+
+    def _string(self, offset: int) -> Optional[str]:
+        if offset == NO_STRING:
+            return None
+        start = self._strings_offset + offset
+        (length,) = STRING_LENGTH.unpack_from(self._buffer, start)
+        start += STRING_LENGTH.size
+        return self._buffer[start:start + length].decode('utf-8')
+
+    def record(self, record_num: int) -> dict:
+        """
+        Decodes one snapshot record back into a raw card dictionary.
+        Fields missing from the source card are omitted, so Card() applies its usual defaults.
+        """
+        values = SNAPSHOT_RECORD.unpack_from(self._buffer, self._records_offset + record_num * SNAPSHOT_RECORD.size)
+        card_data = {}
+        for field, offset in zip(STRING_FIELDS, values[:7]):
+            if offset != NO_STRING:
+                card_data[field] = self._string(offset)
+        for field, value in zip(STAT_FIELDS, values[7:11]):
+            if value != NO_VALUE:
+                card_data[field] = value
+        card_data["Inkable"] = values[11]
+        return card_data
+
+    def records(self) -> List[dict]:
+        """Decodes every record, in source order."""
+        return [self.record(num) for num in range(self.card_count)]
+
+    def _search(self, index_offset: int, key: str, key_field: str, lowercase: bool) -> Optional[int]:
+        """Binary search over a sorted index section; returns the last matching record number."""
+        field_pos = STRING_FIELDS.index(key_field)
+        lo, hi = 0, self.card_count
+        while lo < hi:  # bisect_right over (key, record_num)
+            mid = (lo + hi) // 2
+            (record_num,) = INDEX_ENTRY.unpack_from(self._buffer, index_offset + mid * INDEX_ENTRY.size)
+            offset = SNAPSHOT_RECORD.unpack_from(
+                    self._buffer, self._records_offset + record_num * SNAPSHOT_RECORD.size)[field_pos]
+            mid_key = self._string(offset) or ""
+            if lowercase:
+                mid_key = mid_key.lower()
+            if key < mid_key:
+                hi = mid
+            else:
+                lo = mid + 1
+        if lo == 0:
+            return None
+        (record_num,) = INDEX_ENTRY.unpack_from(self._buffer, index_offset + (lo - 1) * INDEX_ENTRY.size)
+        offset = SNAPSHOT_RECORD.unpack_from(
+                self._buffer, self._records_offset + record_num * SNAPSHOT_RECORD.size)[field_pos]
+        found = self._string(offset) or ""
+        return record_num if (found.lower() if lowercase else found) == key else None
+
+    def find_by_id(self, unique_id: str) -> Optional[dict]:
+        """Looks up a single card by Unique_ID without decoding the rest of the catalog."""
+        record_num = self._search(self._id_index_offset, unique_id, "Unique_ID", lowercase=False)
+        return self.record(record_num) if record_num is not None else None
+
+    def find_by_name(self, name: str) -> Optional[dict]:
+        """Looks up a single card by (case-insensitive) Name without decoding the rest of the catalog."""
+        record_num = self._search(self._name_index_offset, name.lower(), "Name", lowercase=True)
+        return self.record(record_num) if record_num is not None else None
+
+
+def open_catalog_snapshot(source_path: str, snapshot_path: Optional[str] = None,
+                          raw_cards: Optional[Iterable[dict]] = None) -> Optional[CatalogSnapshot]:
+    """
+    Opens the snapshot for source_path, (re)compiling it first if it is missing or stale.
+
+    Args:
+        source_path: The card JSON file the snapshot is compiled from.
+        snapshot_path: Snapshot location (default: next to source_path with SNAPSHOT_SUFFIX).
+        raw_cards: Already-loaded source cards, used instead of re-reading source_path on rebuild.
+
+    Returns:
+        An open CatalogSnapshot, or None if neither a valid snapshot nor the source is available.
+    """
+    snapshot_path = snapshot_path or default_snapshot_path(source_path)
+    if os.path.exists(snapshot_path):
+        try:
+            snapshot = CatalogSnapshot(snapshot_path)
+            if snapshot.matches_source(source_path) or not os.path.exists(source_path):
+                return snapshot
+            snapshot.close()
+            print(f"Catalog snapshot '{snapshot_path}' is stale. Rebuilding.")
+        except (ValueError, OSError) as e:
+            print(f"Could not open catalog snapshot '{snapshot_path}': {e}. Rebuilding.")
+
+    if raw_cards is None:
+        if not os.path.exists(source_path):
+            return None
+        # Stream the source so only one card's retained fields are in memory at a time
+        from dataFetcher import iter_card_records
+        raw_cards = iter_card_records(source_path, fields=STRING_FIELDS + STAT_FIELDS + ("Inkable",))
+
+    try:
+        card_count = build_catalog_snapshot(raw_cards, snapshot_path, source_path)
+        print(f"Compiled catalog snapshot with {card_count} cards: {snapshot_path}")
+    except (OSError, ValueError) as e:
+        print(f"Error writing catalog snapshot '{snapshot_path}': {e}")
+        return None
+    return CatalogSnapshot(snapshot_path)
+
+
+def load_card_maps(source_path: Optional[str] = None, snapshot_path: Optional[str] = None,
+                   with_abilities: bool = False,
+                   refresh: bool = True) -> Tuple[Dict[str, Card], Dict[str, Card], Dict[str, Card]]:
+    """
+    Loads the card pool through the compiled snapshot, falling back to fetch_lorcana_data.
+
+    Args:
+        source_path: The card JSON file (default: dataFetcher.LOCAL_FILENAME).
+        snapshot_path: Snapshot location (default: next to source_path).
+        with_abilities: Fill card.parsed_abilities now, reusing the on-disk ability cache
+                        next to source_path so only cards with changed text are re-parsed.
+                        Otherwise the catalog's EffectEngine does this on first use.
+        refresh: First refresh source_path from the API if it is older than
+                 dataFetcher.MAX_FILE_AGE_SECONDS (see refresh_if_stale). Worker processes
+                 pass False so only the parent process checks.
+
+    Returns:
+        The same (cards_by_id, cards_by_name, cards_by_lowercase_name) tuple as parse_card_data.
+    """
+    from dataFetcher import LOCAL_FILENAME, fetch_lorcana_data, refresh_if_stale
+    source_path = source_path or LOCAL_FILENAME
+    if refresh:
+        refresh_if_stale(source_path)
+
+    snapshot = open_catalog_snapshot(source_path, snapshot_path)
+    if snapshot is not None:
+        with snapshot:
+            card_maps = parse_card_data(snapshot.records())
+    else:
+        card_maps = parse_card_data(fetch_lorcana_data(filename=source_path) or [])
+
+    if card_maps[0]:
+        from CardEffects.ability_cache import DEFAULT_CACHE_FILENAME, attach_parsed_abilities
+        table = next(iter(card_maps[0].values())).table
+        table.ability_cache_path = os.path.join(os.path.dirname(os.path.abspath(source_path)), DEFAULT_CACHE_FILENAME)
+        if with_abilities:
+            cache = attach_parsed_abilities(table.cards, table.ability_cache_path, prune_unused=True)
+            print(f"Parsed abilities: {cache.hits} reused from cache, {cache.misses} re-parsed.")
+    return card_maps
+
+
+# --- Example Usage ---
+if __name__ == "__main__":
+    import time
+    from dataFetcher import LOCAL_FILENAME
+
+    start = time.perf_counter()
+    with open_catalog_snapshot(LOCAL_FILENAME) as snap:
+        opened = time.perf_counter()
+        print(f"Opened snapshot with {len(snap)} cards in {(opened - start) * 1000:.2f} ms")
+        print(f"Lookup by ID 'ARI-001': {snap.find_by_id('ARI-001')}")
+        print(f"Lookup by name 'pascal - garden chameleon': {snap.find_by_name('pascal - garden chameleon')}")
+
+    start = time.perf_counter()
+    by_id, by_name, by_lowercase_name = load_card_maps(LOCAL_FILENAME)
+    print(f"Loaded {len(by_id)} Card objects through the snapshot in {(time.perf_counter() - start) * 1000:.2f} ms")
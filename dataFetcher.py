@@ -1,7 +1,9 @@
 import requests
 import json
 import os
+import re
 import time
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
 
 '''
 {i} = ink
@@ -14,8 +16,51 @@ import time
 
 API_URL = "https://api.lorcana-api.com/bulk/cards"
 LOCAL_FILENAME = "lorcana_cards.json"
+SIMPLIFIED_FILENAME = "lorcana_cards_simplified.json"
+META_SUFFIX = ".meta.json" # Sidecar holding the ETag / Last-Modified of the last download
 MAX_FILE_AGE_SECONDS = 86400 * 7 # 7 days
 
+# Fields the simulator reads; everything else (Artist, Flavor_Text, Image, ...) is dropped while streaming
+SIMULATION_FIELDS = (
+    "Unique_ID", "Name", "Type", "Color", "Classifications", "Abilities", "Body_Text",
+    "Cost", "Strength", "Willpower", "Lore", "Inkable", "Move_Cost", "Set_ID", "Date_Modified",
+)
+STREAM_CHUNK_SIZE = 1 << 16 # Characters read from disk at a time by iter_card_records
+
+def card_data_age_ok(filename=LOCAL_FILENAME, max_age=MAX_FILE_AGE_SECONDS):
+    """
+    Checks whether the local card file exists and is younger than max_age seconds.
+
+    Args:
+        filename (str): The local card file.
+        max_age (int): Maximum age in seconds. 0 or None accepts any existing file.
+    """
+    if not os.path.exists(filename):
+        return False
+    if max_age is None or max_age <= 0:
+        return True
+    return (time.time() - os.path.getmtime(filename)) < max_age
+
+
+def refresh_if_stale(filename=LOCAL_FILENAME, max_age=MAX_FILE_AGE_SECONDS, url=API_URL):
+    """
+    Runs refresh_lorcana_data if the local card file is missing or older than max_age.
+
+    A successful refresh (including a 304 response) renews the file's mtime, so the check
+    is cheap until the file is max_age old again. Failures are printed and the existing
+    file is left as it is.
+
+    Returns:
+        bool: True if a refresh was attempted.
+    """
+    if card_data_age_ok(filename, max_age):
+        return False
+    if os.path.exists(filename):
+        print(f"Local file '{filename}' is older than {max_age // 3600} hours. Re-fetching.")
+    refresh_lorcana_data(url=url, filename=filename)
+    return True
+
+
 def fetch_lorcana_data(url=API_URL, filename=LOCAL_FILENAME, max_age=MAX_FILE_AGE_SECONDS, force_update=False):
     """
     Fetches Lorcana card data from the API or loads it from a local file.
@@ -33,15 +78,9 @@ def fetch_lorcana_data(url=API_URL, filename=LOCAL_FILENAME, max_age=MAX_FILE_AG
     """
     use_local_file = False
     if not force_update and os.path.exists(filename):
-        if max_age is None or max_age <= 0:
-            use_local_file = True
-        else:
-            # Check file modification time
-            file_mod_time = os.path.getmtime(filename)
-            if (time.time() - file_mod_time) < max_age:
-                use_local_file = True
-            else:
-                print(f"Local file '{filename}' is older than {max_age // 3600} hours. Re-fetching.")
+        use_local_file = card_data_age_ok(filename, max_age)
+        if not use_local_file:
+            print(f"Local file '{filename}' is older than {max_age // 3600} hours. Re-fetching.")
 
     if use_local_file:
         print(f"Loading card data from local file: {filename}")
@@ -54,37 +93,307 @@ def fetch_lorcana_data(url=API_URL, filename=LOCAL_FILENAME, max_age=MAX_FILE_AG
             print(f"Error loading local file '{filename}': {e}. Attempting to fetch from API.")
             # Fall through to fetch from API if local file is corrupted
 
-    # --- Fetch data from API ---
+    # --- Fetch data from API (conditional request, merged per card) ---
+    result = refresh_lorcana_data(url=url, filename=filename, conditional=not force_update)
+    if result is not None:
+        return result[0]
+
+    if os.path.exists(filename):
+        print(f"Attempting to load potentially stale data from {filename} as a fallback.")
+        try:
+            with open(filename, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            print(f"Successfully loaded {len(data)} cards from stale local file.")
+            return data
+        except Exception as load_err:
+            print(f"Could not load stale local file: {load_err}")
+    return None # Return None if fetching failed and no usable local file
+
+
+# --- Streaming ingestion ---
+
+def iter_card_records(filename=LOCAL_FILENAME, fields: Optional[Sequence[str]] = SIMULATION_FIELDS,
+                      chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[dict]:
+    """
+    Streams the cards of a local card JSON file one at a time.
+
+    The file is read in chunks and decoded object by object, and each card is trimmed to
+    `fields` before it is yielded, so memory scales with the retained fields of one card
+    rather than with the whole file. Feed the result straight into parse_card_data or
+    catalog.build_catalog_snapshot.
+
+    Args:
+        filename (str): The card JSON file (a top-level array of card objects).
+        fields: The keys to keep from each card, or None to keep every field.
+        chunk_size (int): Number of characters read from disk at a time.
+
+    Yields:
+        dict: One (trimmed) card dictionary per array element, in file order.
+
+    Raises:
+        ValueError: If the file is not a JSON array of objects or ends mid-way.
+    """
+    decoder = json.JSONDecoder()
+    with open(filename, 'r', encoding='utf-8') as f:
+        buffer = f.read(chunk_size)
+        pos = 0
+        started = False
+        while True:
+            # Skip whitespace and separators between array elements
+            while pos < len(buffer) and buffer[pos] in " \t\r\n,":
+                pos += 1
+            if pos >= len(buffer):
+                more = f.read(chunk_size)
+                if not more:
+                    raise ValueError(f"Unexpected end of card file '{filename}'.")
+                buffer, pos = buffer[pos:] + more, 0
+                continue
+
+            if not started:
+                if buffer[pos] != '[':
+                    raise ValueError(f"Card file '{filename}' is not a JSON array.")
+                started = True
+                pos += 1
+                continue
+            if buffer[pos] == ']':
+                return
+
+            try:
+                card, end = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                # The object straddles the chunk boundary: keep it and read more
+                more = f.read(chunk_size)
+                if not more:
+                    raise ValueError(f"Truncated or malformed card object in '{filename}'.")
+                buffer, pos = buffer[pos:] + more, 0
+                continue
+            if not isinstance(card, dict):
+                raise ValueError(f"Card file '{filename}' contains a non-object element.")
+
+            yield card if fields is None else {key: card[key] for key in fields if key in card}
+            pos = end
+            if pos >= chunk_size: # Drop consumed text so the buffer stays around one chunk
+                buffer, pos = buffer[pos:], 0
+
+
+# --- Incremental refresh ---
+
+def _load_json(path: str, default=None):
+    """Loads a JSON file, returning default if it is missing or unreadable."""
+    if not os.path.exists(path):
+        return default
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (json.JSONDecodeError, IOError) as e:
+        print(f"Error loading '{path}': {e}")
+        return default
+
+
+def _write_json(path: str, data, indent: Optional[int] = 2) -> None:
+    """Writes JSON through a temporary file so readers never see a partial file."""
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=indent, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+
+def merge_card_data(local_cards: List[dict], remote_cards: List[dict]) -> Tuple[List[dict], Dict[str, List[str]]]:
+    """
+    Merges a fresh bulk download into the local card list by Unique_ID and Date_Modified.
+
+    A card counts as modified when its Date_Modified differs from the local copy; cards
+    missing Date_Modified on either side are compared field by field instead. Unchanged
+    cards keep their local dictionaries; only added or modified cards are taken from the
+    download. The merged list follows the order of remote_cards.
+
+    Returns:
+        A tuple (merged_cards, changes), where changes maps 'added', 'updated' and
+        'removed' to lists of Unique_IDs.
+    """
+    local_by_id = {card.get("Unique_ID"): card for card in local_cards}
+    remote_ids = set()
+    merged: List[dict] = []
+    changes: Dict[str, List[str]] = {"added": [], "updated": [], "removed": []}
+
+    for remote in remote_cards:
+        unique_id = remote.get("Unique_ID")
+        remote_ids.add(unique_id)
+        local = local_by_id.get(unique_id)
+        if local is None:
+            changes["added"].append(unique_id)
+            merged.append(remote)
+        elif (local.get("Date_Modified") != remote.get("Date_Modified")
+              if local.get("Date_Modified") and remote.get("Date_Modified") else local != remote):
+            changes["updated"].append(unique_id)
+            merged.append(remote)
+        else:
+            merged.append(local)
+
+    changes["removed"] = [unique_id for unique_id in local_by_id if unique_id not in remote_ids]
+    return merged, changes
+
+
+def clean_body_text(text):
+    """Strips reminder text, ability names and {symbols} from Body_Text for the simplified JSON."""
+    if not text:
+        return text
+
+    # Remove text between parentheses
+    text = re.sub(r'\([^)]*\)', '', text)
+
+    # Specific pattern for abilities followed by a colon
+    # Match a word or phrase at the start of a line or after a newline, followed by a colon and whitespace
+    text = re.sub(r'(^|\n)([^:\n]+):\s*', r'\1', text)
+
+    # Specific pattern for abilities followed by a dash
+    # Match a word or phrase at the start of a line or after a newline, followed by a dash and whitespace
+    text = re.sub(r'(^|\n)([^-\n]+)-\s*', r'\1', text)
+
+    # Replace patterns like "Trapped! " at the start of a line or after newline
+    text = re.sub(r'(^|\n)(\w+)!\s*', r'\1', text)
+
+    # Remove any redundant newlines that might have been created
+    text = re.sub(r'\n\s*\n', '\n', text)
+
+    text = re.sub(r"\n", ' ', text)
+    text = re.sub(r'\n+', ' ', text)
+
+    text = re.sub(r'{i}', ' ink', text)
+    text = re.sub(r'{w}', ' willpower', text)
+    text = re.sub(r'{s}', ' strength', text)
+    text = re.sub(r'{l}', ' lore', text)
+    text = re.sub(r'{e}', ' exert', text)
+
+    return text.strip()
+
+
+def simplify_card(card: dict) -> dict:
+    """Builds the lorcana_cards_simplified.json entry for one raw card."""
+    return {
+        "Name":      card.get("Name"),
+        "Color":     card.get("Color"),
+        "Cost":      card.get("Cost"),
+        "Inkable":   card.get("Inkable"),
+        "Type":      card.get("Type"),
+        "Unique_ID": card.get("Unique_ID"),
+        "Body_Text": clean_body_text(card.get("Body_Text")),
+        "Abilities": card.get("Abilities"),
+        "Willpower": card.get("Willpower"),
+        "Move Cost": card.get("Move Cost"),
+        "Strength":  card.get("Strength"),
+        "Lore":      card.get("Lore"),
+    }
+
+
+def invalidate_derived_artifacts(merged_cards: List[dict], previous_cards: Dict[str, dict],
+                                 changes: Dict[str, List[str]], filename: str = LOCAL_FILENAME) -> None:
+    """
+    Updates or invalidates the files derived from the card JSON, for the changed cards only.
+
+    - lorcana_cards_simplified.json: changed entries are rewritten in place, removed ones dropped.
+    - ability cache: entries for the previous text of updated/removed cards are discarded.
+    - catalog snapshot (and its name/ID indexes): fingerprinted against the source file,
+      so it is rebuilt automatically on the next load.
+
+    Args:
+        merged_cards: The card list after merge_card_data.
+        previous_cards: The pre-merge local cards, by Unique_ID.
+        changes: The changes dictionary returned by merge_card_data.
+        filename: The card JSON file the artifacts were derived from.
+    """
+    base_dir = os.path.dirname(os.path.abspath(filename))
+    changed_ids = set(changes["added"]) | set(changes["updated"])
+    removed_ids = set(changes["removed"])
+
+    # Simplified JSON
+    simplified_path = os.path.join(base_dir, SIMPLIFIED_FILENAME)
+    simplified = _load_json(simplified_path)
+    if isinstance(simplified, list):
+        new_by_id = {card.get("Unique_ID"): card for card in merged_cards if card.get("Unique_ID") in changed_ids}
+        patched = [simplify_card(new_by_id.pop(entry.get("Unique_ID"))) if entry.get("Unique_ID") in new_by_id else entry
+                   for entry in simplified if entry.get("Unique_ID") not in removed_ids]
+        patched.extend(simplify_card(card) for card in new_by_id.values()) # Newly added cards
+        _write_json(simplified_path, patched)
+        print(f"Updated {len(changed_ids) + len(removed_ids)} entries in {simplified_path}")
+
+    # Parsed ability cache
+    from CardEffects.ability_cache import DEFAULT_CACHE_FILENAME, AbilityCache
+    cache_path = os.path.join(base_dir, DEFAULT_CACHE_FILENAME)
+    if os.path.exists(cache_path):
+        cache = AbilityCache(cache_path)
+        for unique_id in set(changes["updated"]) | removed_ids:
+            if unique_id in previous_cards:
+                cache.discard_card_data(previous_cards[unique_id])
+        cache.save()
+
+
+def refresh_lorcana_data(url=API_URL, filename=LOCAL_FILENAME, session=None, timeout=30, conditional=True):
+    """
+    Refreshes the local card file with a conditional request and a per-card merge.
+
+    The ETag / Last-Modified of the previous download are sent as If-None-Match /
+    If-Modified-Since. A 304 response just renews the local file's age; a 200 response
+    is merged card by card (see merge_card_data), and only if something changed is the
+    file rewritten and the derived artifacts of the changed cards invalidated.
+
+    Args:
+        url (str): The bulk cards endpoint.
+        filename (str): The local card file to refresh.
+        session: Optional requests.Session (or compatible object) used for the request.
+        timeout (int): Request timeout in seconds.
+        conditional (bool): Send the cache validators of the previous download. If False,
+                            the full catalog is always downloaded (it is still merged per card).
+
+    Returns:
+        tuple: (cards, changes) with changes as returned by merge_card_data,
+               or None if the request failed.
+    """
+    meta_path = filename + META_SUFFIX
+    local_cards = _load_json(filename) if os.path.exists(filename) else None
+    meta = _load_json(meta_path, default={}) if local_cards is not None and conditional else {}
+
+    headers = {}
+    if meta.get("etag"):
+        headers["If-None-Match"] = meta["etag"]
+    if meta.get("last_modified"):
+        headers["If-Modified-Since"] = meta["last_modified"]
+
     print(f"Fetching card data from API: {url}")
     try:
-        response = requests.get(url, timeout=30)
+        response = (session or requests).get(url, headers=headers, timeout=timeout)
+        if response.status_code == 304 and local_cards is not None:
+            print("Card data not modified since the last download.")
+            os.utime(filename) # Renew the age used by fetch_lorcana_data
+            return local_cards, {"added": [], "updated": [], "removed": []}
         response.raise_for_status() # Raises an HTTPError for bad responses (4xx or 5xx)
+        remote_cards = response.json()
+    except (requests.exceptions.RequestException, ValueError) as e:
+        print(f"Error fetching data from API: {e}")
+        return None
+    print(f"Successfully fetched {len(remote_cards)} cards from API.")
 
-        data = response.json()
-        print(f"Successfully fetched {len(data)} cards from API.")
+    merged, changes = merge_card_data(local_cards or [], remote_cards)
+    changed = len(changes["added"]) + len(changes["updated"]) + len(changes["removed"])
+    try:
+        if changed or local_cards is None:
+            _write_json(filename, merged)
+            print(f"Card data saved locally to: {filename} "
+                  f"({len(changes['added'])} added, {len(changes['updated'])} updated, {len(changes['removed'])} removed)")
+            if local_cards is not None:
+                previous = {card.get("Unique_ID"): card for card in local_cards}
+                invalidate_derived_artifacts(merged, previous, changes, filename)
+        else:
+            os.utime(filename)
+            print("No card changes found.")
+        _write_json(meta_path, {
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+        })
+    except IOError as e:
+        print(f"Error saving data to local file '{filename}': {e}")
+    return merged, changes
 
-        # Save the data locally
-        try:
-            with open(filename, 'w', encoding='utf-8') as f:
-                # Use indent for readability, ensure_ascii=False for potential special characters
-                json.dump(data, f, indent=2, ensure_ascii=False)
-            print(f"Card data saved locally to: {filename}")
-        except IOError as e:
-            print(f"Error saving data to local file '{filename}': {e}")
-        return data
-
-    except requests.exceptions.RequestException as e:
-        print(f"Error fetching data from API: {e}")
-        if os.path.exists(filename):
-            print(f"Attempting to load potentially stale data from {filename} as a fallback.")
-            try:
-                with open(filename, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                print(f"Successfully loaded {len(data)} cards from stale local file.")
-                return data
-            except Exception as load_err:
-                print(f"Could not load stale local file: {load_err}")
-        return None # Return None if fetching failed and no usable local file
 
 # --- Main execution block ---
 if __name__ == "__main__":
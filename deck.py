@@ -1,8 +1,11 @@
 import os  # For file path operations
 import random
-from collections import Counter
-from typing import Dict, List, Optional  # Added Tuple
-from card import Card, parse_card_data
+from collections import Counter, deque
+from itertools import islice
+from typing import Deque, Dict, Iterable, Iterator, List, Optional, Sequence, Union  # Added Tuple
+from card import Card
+from card_table import CardTable
+from name_resolver import NameResolver
 
 # --- Load Decklist from File ---
 def load_deck_identifiers_from_file(filepath: str) -> Optional[List[str]]:
@@ -68,43 +71,105 @@ def load_deck_identifiers_from_file(filepath: str) -> Optional[List[str]]:
         return None
 
 
+class DeckView(Sequence):
+	"""
+	Read-only window onto the top cards of a Deck, in order (top first). No cards are copied:
+	the view reads the deck directly, so it reflects later draws and shuffles.
+	"""
+
+	__slots__ = ("_cards", "_number")
+
+	def __init__(self, cards: Deque[int], number: int):
+		self._cards = cards
+		self._number = number
+
+	def __len__(self) -> int:
+		return min(self._number, len(self._cards))
+
+	def __getitem__(self, index):
+		if isinstance(index, slice):
+			return [self[i] for i in range(*index.indices(len(self)))]
+		if index < 0:
+			index += len(self)
+		if not 0 <= index < len(self):
+			raise IndexError("DeckView index out of range")
+		return self._cards[index]  # deque indexing is O(1) near the top
+
+	def __iter__(self) -> Iterator[int]:
+		return islice(self._cards, len(self))
+
+	def __repr__(self) -> str:
+		return f"DeckView({list(self)})"
+
+
 class Deck:
-	"""Represents a Lorcana deck, holding Card objects and providing deck operations."""
+	"""
+	Represents a Lorcana deck and provides deck operations.
 
-	def __init__(self, card_names: List[str], name_to_card_map: Dict[str, Card]):
+	Cards are stored as dense integer card ids (see CardTable); the Card object
+	for an id is fetched from self.catalog only when it is needed. The order lives in a
+	deque, so drawing, putting a card on the bottom and putting one on top are all O(1).
+	"""
+
+	def __init__(self, card_names: List[str], name_to_card_map: Union[Dict[str, Card], NameResolver],
+	             rng: Optional[random.Random] = None):
 		"""
-		Initializes a Deck from a list of card names and a name-to-Card map.
+		Initializes a Deck from a list of card names and a name resolver.
+
+		Each unique name is resolved once, so construction costs O(unique names) and the
+		catalog-wide lookup tables are shared by every deck.
 
 		Args:
 			card_names: A list of card names (strings) representing the cards
 						to include in the deck (duplicates allowed as per list).
-			name_to_card_map: A dictionary mapping card names (str) to their
-							  corresponding Card objects.
+			name_to_card_map: The catalog's NameResolver (CardTable.name_resolver), or a
+							  dictionary mapping card names (str) to Card objects (as built by
+							  parse_card_data). For a dictionary, names it doesn't contain fall
+							  back to the resolver of the cards' catalog.
+			rng: The game's random stream (see rng.game_rng), also used by the Player and
+				 GameState built on this deck. Defaults to a fresh, unseeded random.Random.
 		"""
-		self.cards: List[Card] = []
+		self.rng: random.Random = rng if rng is not None else random.Random()
+		self.cards: Deque[int] = deque()  # Card ids, top of the deck first
+		self._shuffle_buffer: List[int] = []  # Reused by shuffle()
+		self.catalog: Optional[CardTable] = None  # Resolves card ids back to Card objects
 		self.failed_lookups: List[str] = []  # Track names not found
 
-		# Create a case-insensitive lookup dictionary
-		case_insensitive_map = {name.lower(): card for name, card in name_to_card_map.items()}
+		name_map: Dict[str, Card] = {}
+		resolver: Optional[NameResolver] = None
+		if isinstance(name_to_card_map, NameResolver):
+			resolver = name_to_card_map
+		elif name_to_card_map:
+			name_map = name_to_card_map
+			sample_card = next(iter(name_map.values()))
+			# Cards outside a CardTable have no shared resolver; build one for this map only
+			resolver = sample_card.table.name_resolver if sample_card.table is not None \
+				else NameResolver(name_map.values())
 
 		name_counts = Counter(card_names)
-		processed_failures = set()
 
 		for name, count in name_counts.items():
-			# Try exact match first
-			card_obj = name_to_card_map.get(name)
-
-			# If not found, try case-insensitive match
-			if not card_obj:
-				card_obj = case_insensitive_map.get(name.lower())
+			# Try the caller's map first, then the shared resolver
+			card_obj = name_map.get(name)
+			if not card_obj and resolver is not None:
+				card_obj, method = resolver.lookup(name)
+				if method == 'fuzzy':
+					print(f"Warning: Card name '{name}' not found. Using closest match '{card_obj.name}'.")
+
+			if card_obj and card_obj.table is None:
+				# Ids only exist for cards placed in a CardTable by parse_card_data
+				print(f"Warning: Card '{name}' has no card id (not built by parse_card_data). Skipping.")
+				card_obj = None
+			elif card_obj and self.catalog is not None and card_obj.table is not self.catalog:
+				print(f"Warning: Card '{name}' belongs to a different card catalog. Skipping.")
+				card_obj = None
 
 			if card_obj:
-				self.cards.extend([card_obj] * count)
+				self.catalog = card_obj.table
+				self.cards.extend([card_obj.card_id] * count)
 			else:
-				if name not in processed_failures:
-					self.failed_lookups.append(name)
-					print(f"Warning: Card name '{name}' not found in name_to_card_map.")
-					processed_failures.add(name)
+				self.failed_lookups.append(name)
+				print(f"Warning: Card name '{name}' not found in name_to_card_map.")
 
 		if self.failed_lookups:
 			print(f"Deck created with {len(self.cards)} cards. Could not find "
@@ -115,22 +180,63 @@ class Deck:
 
 		self.shuffle()
 
-	def shuffle(self) -> None:
-		"""Randomly shuffles the cards currently in the deck."""
-		random.shuffle(self.cards)
+	@classmethod
+	def from_card_ids(cls, card_ids: Iterable[int], catalog: Optional[CardTable],
+	                  rng: Optional[random.Random] = None, failed_lookups: Iterable[str] = ()) -> 'Deck':
+		"""
+		Builds a deck directly from card ids (top first), without resolving names or shuffling.
+
+		Args:
+			card_ids: The deck's card ids, top of the deck first.
+			catalog: The CardTable the ids belong to.
+			rng: The game's random stream. Defaults to a fresh, unseeded random.Random.
+			failed_lookups: Names that could not be resolved when the original deck was built.
+		"""
+		deck = cls.__new__(cls)
+		deck.rng = rng if rng is not None else random.Random()
+		deck.cards = deque(card_ids)
+		deck._shuffle_buffer = []
+		deck.catalog = catalog
+		deck.failed_lookups = list(failed_lookups)
+		return deck
+
+	def copy(self, rng: Optional[random.Random] = None) -> 'Deck':
+		"""Returns an independent copy of this deck (same order) without re-resolving any names."""
+		return Deck.from_card_ids(self.cards, self.catalog, rng, self.failed_lookups)
+
+	def shuffle(self, buffer: Optional[List[int]] = None) -> None:
+		"""
+		Randomly shuffles the cards currently in the deck using the deck's rng.
+
+		The permutation is done in a list (deque indexing is O(n) in the middle) that is kept
+		and reused between shuffles, so repeated shuffles do not allocate.
 
-	def draw(self) -> Optional[Card]:
-		"""Removes and returns the top card from the deck."""
+		Args:
+			buffer: A preallocated list to shuffle in instead of the deck's own (e.g. one
+					buffer shared by every deck of a batch). Its contents are overwritten.
+		"""
+		buffer = buffer if buffer is not None else self._shuffle_buffer
+		buffer[:] = self.cards
+		self.rng.shuffle(buffer)
+		self.cards.clear()
+		self.cards.extend(buffer)
+
+	def card(self, card_id: int) -> Card:
+		"""Returns the Card object for a card id in this deck."""
+		return self.catalog.cards[card_id]
+
+	def draw(self) -> Optional[int]:
+		"""Removes and returns the id of the top card of the deck."""
 		if not self.cards:
 			return None
-		return self.cards.pop(0)
+		return self.cards.popleft()
 
-	def add_card(self, card: Card, to_bottom: bool = True) -> None:
-		"""Adds a card to the deck (default: bottom)."""
+	def add_card(self, card_id: int, to_bottom: bool = True) -> None:
+		"""Adds a card id to the deck (default: bottom)."""
 		if to_bottom:
-			self.cards.append(card)
+			self.cards.append(card_id)
 		else:
-			self.cards.insert(0, card)
+			self.cards.appendleft(card_id)
 
 	def __len__(self) -> int:
 		"""Returns the number of cards remaining in the deck."""
@@ -140,10 +246,12 @@ class Deck:
 		"""Explicit method to get the number of cards remaining."""
 		return len(self.cards)
 
-	def lookAt(self,number) -> list:
-		"""Returns the top number cards from the deck, in order of the deck (top to bottom)."""
-		lookingAt = self.cards[:number]
-		return lookingAt
+	def lookAt(self,number) -> DeckView:
+		"""
+		Returns a read-only view of the ids of the top number cards of the deck, in order of
+		the deck (top to bottom). The view is not a copy: use list(view) to keep the ids.
+		"""
+		return DeckView(self.cards, number)
 
 	# --- Validation Methods ---
 
@@ -151,7 +259,7 @@ class Deck:
 		return len(self.cards) >= min_size
 
 	def validate_copies(self, max_copies: int = 4) -> bool:
-		card_name_counts = Counter(card.name for card in self.cards)
+		card_name_counts = Counter(self.card(card_id).name for card_id in self.cards)
 		for name, count in card_name_counts.items():
 			if count > max_copies:
 				print(f"Validation Error: Card '{name}' found {count} times (max {max_copies}).")
@@ -160,8 +268,8 @@ class Deck:
 
 	def get_colors(self) -> set[str]:
 		colors = set()
-		for card in self.cards:
-			colors.update(card.colors)
+		for card_id in set(self.cards):
+			colors.update(self.card(card_id).colors)
 		return colors
 
 	def validate_colors(self, max_colors: int = 2) -> bool:
@@ -201,28 +309,22 @@ class Deck:
 if __name__ == "__main__":
 	# Assuming card.py and dataFetcher.py are available
 	try:
-		from dataFetcher import fetch_lorcana_data
-		# parse_card_data is already imported/defined above
+		from catalog import load_card_maps
 	except ImportError:
-		print("Could not import from dataFetcher.py. Exiting.")
+		print("Could not import from catalog.py. Exiting.")
 		exit()
 
-	# 1. Get all card data and parse into maps
+	# 1. Get all card data (through the compiled catalog snapshot) and parse into maps
 	print("Loading card data...")
-	raw_card_data = fetch_lorcana_data()
-	if not raw_card_data:
+	all_cards_by_id, all_cards_by_name, all_cards_by_lowercase_name = load_card_maps()
+	if not all_cards_by_id:
 		print("Cannot proceed without card data. Exiting.")
 		exit()
 
-	all_cards_by_id, all_cards_by_name, all_cards_by_lowercase_name = parse_card_data(raw_card_data)
 	print(f"Loaded {len(all_cards_by_id)} unique cards by ID, {len(all_cards_by_name)} by Name.")
 
-	# Merge the name mappings for the deck constructor
-	combined_name_map = {**all_cards_by_name, **all_cards_by_lowercase_name}
-
-	if not combined_name_map:
-		print("Card name map is empty. Cannot load deck from file. Exiting.")
-		exit()
+	# One resolver per catalog, shared by every deck built from it
+	name_resolver = next(iter(all_cards_by_id.values())).table.name_resolver
 
 	# 2. Define the decklist filename and content
 	# --- Use a more realistic decklist for testing ---
@@ -236,7 +338,7 @@ if __name__ == "__main__":
 	if deck_card_names:
 		# 4. Create the Deck instance using the loaded names and the name map
 		print("\n--- Creating Deck Instance ---")
-		my_deck = Deck(deck_card_names, combined_name_map)
+		my_deck = Deck(deck_card_names, name_resolver)
 		# Creation message now printed inside __init__
 
 		# Check if deck creation was successful (no failed lookups)
@@ -257,9 +359,9 @@ if __name__ == "__main__":
 			hand = []
 			for i in range(7):
 				drawn_card = my_deck.draw()
-				if drawn_card:
+				if drawn_card is not None:
 					hand.append(drawn_card)
-					print(f"  Drew {i + 1}: {drawn_card.name}")
+					print(f"  Drew {i + 1}: {my_deck.card(drawn_card).name}")
 				else:
 					print("  Deck ran out of cards!")
 					break
@@ -0,0 +1,205 @@
+# deck_odds.py
+
+from collections import Counter
+from dataclasses import dataclass
+from fractions import Fraction
+from functools import lru_cache
+from math import comb
+from typing import Callable, Dict, FrozenSet, Optional, Tuple, Union
+
+from card import Card
+from card_index import CardQuery
+from deck import Deck
+
+'''
+Exact draw probabilities for a Deck (multivariate hypergeometric).
+
+Each requirement is a card category (a CardQuery, a card name, or any Card -> bool function)
+with a minimum and optional maximum count among the cards seen. The deck's cards are split
+into cells by which categories they belong to, so overlapping categories ("1-drops" and
+"inkable cards") are counted exactly, and the probability is a sum over how many cards are
+drawn from each cell:
+
+    odds = DeckOdds(deck)
+    index = deck.catalog.index
+    odds.opening_hand(Requirement(index.query().cost(1, 1)), Requirement(index.query().inkable(), 3))
+    odds.by_turn(4, Requirement("Genie - Wish Fulfilled"), on_the_play=False)
+
+Results are exact Fractions internally and memoized, so repeated questions cost a dict lookup.
+Mulligans are not modelled.
+'''
+
+OPENING_HAND = 7
+
+Predicate = Union[CardQuery, str, Callable[[Card], bool]]
+
+
+@dataclass(frozen=True)
+class Requirement:
+    """At least minimum (and at most maximum, if given) of the seen cards match predicate."""
+    predicate: Predicate
+    minimum: int = 1
+    maximum: Optional[int] = None
+
+
+def cards_seen(turn: int, on_the_play: bool = True) -> int:
+    """Cards seen by the end of the draw step of a turn (the player on the play skips the turn 1 draw)."""
+    return OPENING_HAND + turn - (1 if on_the_play else 0)
+
+
+@lru_cache(maxsize=65536)
+def _hypergeometric(cells: Tuple[Tuple[int, int], ...], bounds: Tuple[Tuple[int, Optional[int]], ...],
+                    draws: int) -> Fraction:
+    """
+    Probability that draws cards from the cells meet every bound.
+
+    Args:
+        cells: (size, membership bitmask) per cell; bit i set when the cell counts towards bounds[i].
+        bounds: (minimum, maximum or None) per requirement.
+        draws: Number of cards drawn without replacement.
+    """
+    population = sum(size for size, _ in cells)
+    if draws > population:
+        draws = population
+    # Counts only matter up to the point where a bound's outcome is decided
+    caps = [maximum + 1 if maximum is not None else minimum for minimum, maximum in bounds]
+
+    # state: (cards drawn, clipped count per requirement) -> number of ways
+    states: Dict[Tuple[int, Tuple[int, ...]], int] = {(0, (0,) * len(bounds)): 1}
+    for size, membership in cells:
+        members = [i for i in range(len(bounds)) if membership >> i & 1]
+        next_states: Dict[Tuple[int, Tuple[int, ...]], int] = {}
+        for (drawn, counts), ways in states.items():
+            for taken in range(min(size, draws - drawn) + 1):
+                new_counts = list(counts)
+                for i in members:
+                    new_counts[i] = min(caps[i], new_counts[i] + taken)
+                key = (drawn + taken, tuple(new_counts))
+                next_states[key] = next_states.get(key, 0) + ways * comb(size, taken)
+        states = next_states
+
+    favourable = sum(ways for (drawn, counts), ways in states.items()
+                     if drawn == draws and all(minimum <= count and (maximum is None or count <= maximum)
+                                               for count, (minimum, maximum) in zip(counts, bounds)))
+    return Fraction(favourable, comb(population, draws))
+
+
+class DeckOdds:
+    """Exact probability calculator over a snapshot of a deck's card counts."""
+
+    def __init__(self, deck: Deck):
+        """
+        Args:
+            deck: The deck whose current contents (not order) are used. Later draws from
+                  the deck do not change this calculator.
+        """
+        self.catalog = deck.catalog
+        self.counts: Counter = Counter(deck.cards)
+        self.size = sum(self.counts.values())
+        self._matches: Dict[object, FrozenSet[int]] = {}
+        self._results: Dict[tuple, Fraction] = {}
+
+    @staticmethod
+    def _key(predicate: Predicate) -> object:
+        # CardQuery compares by identity, so key it by the set of cards it selects
+        return ("query", predicate.bits) if isinstance(predicate, CardQuery) else predicate
+
+    def matching(self, predicate: Predicate) -> FrozenSet[int]:
+        """Returns the ids of the deck's cards matching a predicate."""
+        key = self._key(predicate)
+        matches = self._matches.get(key)
+        if matches is not None:
+            return matches
+        if isinstance(predicate, CardQuery):
+            matches = frozenset(card_id for card_id in self.counts if card_id in predicate)
+        elif isinstance(predicate, str):
+            card, _ = self.catalog.name_resolver.lookup(predicate, fuzzy=False)
+            if card is None:
+                print(f"Warning: Card name '{predicate}' not found, it matches no cards.")
+            matches = frozenset(card_id for card_id in self.counts
+                                if card is not None and self.catalog.cards[card_id].name == card.name)
+        else:
+            matches = frozenset(card_id for card_id in self.counts if predicate(self.catalog.cards[card_id]))
+        self._matches[key] = matches
+        return matches
+
+    def count(self, predicate: Predicate) -> int:
+        """Number of cards in the deck matching a predicate."""
+        return sum(self.counts[card_id] for card_id in self.matching(predicate))
+
+    def probability(self, draws: int, *requirements: Requirement, exact: bool = False) -> Union[float, Fraction]:
+        """
+        Probability that draws random cards from the deck meet every requirement.
+
+        Args:
+            draws: Number of cards seen.
+            requirements: The requirements, all of which must hold.
+            exact: Return a Fraction instead of a float.
+        """
+        query = (draws, tuple((self._key(r.predicate), r.minimum, r.maximum) for r in requirements))
+        result = self._results.get(query)
+        if result is None:
+            result = self._results[query] = self._compute(draws, requirements)
+        return result if exact else float(result)
+
+    def _compute(self, draws: int, requirements: Tuple[Requirement, ...]) -> Fraction:
+        matches = [self.matching(requirement.predicate) for requirement in requirements]
+        cells: Counter = Counter()
+        for card_id, copies in self.counts.items():
+            membership = 0
+            for i, matched in enumerate(matches):
+                if card_id in matched:
+                    membership |= 1 << i
+            cells[membership] += copies
+        bounds = tuple((requirement.minimum, requirement.maximum) for requirement in requirements)
+        return _hypergeometric(tuple(sorted((size, membership) for membership, size in cells.items())),
+                               bounds, draws)
+
+    def opening_hand(self, *requirements: Requirement, exact: bool = False) -> Union[float, Fraction]:
+        """Probability that the opening hand meets every requirement."""
+        return self.probability(OPENING_HAND, *requirements, exact=exact)
+
+    def by_turn(self, turn: int, *requirements: Requirement, on_the_play: bool = True,
+                exact: bool = False) -> Union[float, Fraction]:
+        """Probability that the cards seen by a turn's draw step meet every requirement."""
+        return self.probability(cards_seen(turn, on_the_play), *requirements, exact=exact)
+
+    def expected(self, predicate: Predicate, draws: int) -> float:
+        """Expected number of matching cards among draws cards."""
+        return draws * self.count(predicate) / self.size
+
+
+# --- Example Usage ---
+if __name__ == "__main__":
+    import timeit
+    from catalog import load_card_maps
+    from deck import load_deck_identifiers_from_file
+    from rng import game_rng
+
+    all_cards_by_id, _, _ = load_card_maps()
+    name_resolver = next(iter(all_cards_by_id.values())).table.name_resolver
+    deck = Deck(load_deck_identifiers_from_file("Decks/BouncingBosses.txt"), name_resolver)
+    odds = DeckOdds(deck)
+    index = deck.catalog.index
+
+    one_drop = Requirement(index.query().cost(1, 1))
+    three_inkable = Requirement(index.query().inkable(), 3)
+    keep = odds.opening_hand(one_drop, three_inkable, exact=True)
+    print(f"\nP(a 1-drop and 3+ inkable cards in the opening 7) = {keep} ~ {float(keep):.4f}")
+    for on_the_play in (True, False):
+        print(f"P(Genie - Wish Fulfilled by turn 4 {'on the play' if on_the_play else 'on the draw'}) = "
+              f"{odds.by_turn(4, Requirement('Genie - Wish Fulfilled'), on_the_play=on_the_play):.4f}")
+
+    # Brute-force check by shuffling and dealing
+    trials, hits = 20_000, 0
+    shuffled = deck.copy(game_rng(0, 0))
+    ones, inkable = odds.matching(one_drop.predicate), odds.matching(three_inkable.predicate)
+    for _ in range(trials):
+        shuffled.shuffle()
+        hand = shuffled.lookAt(OPENING_HAND)
+        hits += any(card_id in ones for card_id in hand) and sum(card_id in inkable for card_id in hand) >= 3
+    print(f"Shuffle-and-deal estimate over {trials} hands: {hits / trials:.4f}")
+
+    runs = 10_000
+    cached_us = timeit.timeit(lambda: odds.opening_hand(one_drop, three_inkable), number=runs) / runs * 1e6
+    print(f"Repeated query: {cached_us:.1f} us")
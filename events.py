@@ -0,0 +1,371 @@
+# events.py
+
+import json
+from dataclasses import asdict, dataclass, field
+from typing import IO, Any, ClassVar, Dict, List, Optional
+
+'''
+Structured game events and the sinks that consume them.
+
+Player and GameState describe every action as a typed event instead of printing. Emitters
+guard on sink.enabled before building the event, so with a NullSink no event object is
+created and no string is formatted:
+
+    if self.events.enabled:
+        self.events.emit(CardInked(self.name, card.name, self.total_ink))
+
+ConsoleSink (the default) prints each event's message(); JsonlSink writes one JSON object
+per event; ListSink keeps the events in memory.
+'''
+
+
+# --- Events ---
+
+@dataclass(slots=True)
+class GameEvent:
+    """Base class for engine events. Subclasses hold raw values and format them only in message()."""
+
+    # Routine events (e.g. a single draw) are only printed by a verbose ConsoleSink
+    quiet: ClassVar[bool] = False
+
+    def message(self) -> str:
+        return type(self).__name__
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"event": type(self).__name__, **asdict(self)}
+
+
+@dataclass(slots=True)
+class GameStarted(GameEvent):
+    first_player: str
+
+    def message(self) -> str:
+        return f"\n--- Game Start ---\n{self.first_player} will go first."
+
+
+@dataclass(slots=True)
+class TurnStarted(GameEvent):
+    turn: int
+
+    def message(self) -> str:
+        return f"\n=== Starting Turn {self.turn} ==="
+
+
+@dataclass(slots=True)
+class PhaseStarted(GameEvent):
+    player: str
+    phase: str  # 'Ready', 'Set' or 'Draw'
+
+    def message(self) -> str:
+        prefix = "\n" if self.phase == "Ready" else ""
+        return f"{prefix}--- {self.player}'s Turn Start ({self.phase} Phase) ---"
+
+
+@dataclass(slots=True)
+class CardsReadied(GameEvent):
+    player: str
+    count: int
+
+    def message(self) -> str:
+        return f"{self.player}: Readied {self.count} card(s) in play."
+
+
+@dataclass(slots=True)
+class InkReadied(GameEvent):
+    player: str
+    ink: int
+
+    def message(self) -> str:
+        return f"{self.player}: Readied {self.ink} ink."
+
+
+@dataclass(slots=True)
+class InitialHandDrawn(GameEvent):
+    player: str
+    count: int
+
+    def message(self) -> str:
+        return f"{self.player}: Drawing initial hand of {self.count} cards."
+
+
+@dataclass(slots=True)
+class CardDrawn(GameEvent):
+    quiet: ClassVar[bool] = True
+
+    player: str
+    card: str
+
+    def message(self) -> str:
+        return f"{self.player}: Drew '{self.card}'."
+
+
+@dataclass(slots=True)
+class DeckedOut(GameEvent):
+    player: str
+
+    def message(self) -> str:
+        return f"{self.player}: Deck is empty! Cannot draw."
+
+
+@dataclass(slots=True)
+class CardInked(GameEvent):
+    player: str
+    card: str
+    total_ink: int
+
+    def message(self) -> str:
+        return f"{self.player}: Inked '{self.card}'. Total ink: {self.total_ink}"
+
+
+@dataclass(slots=True)
+class CardPlayed(GameEvent):
+    player: str
+    card: str
+    cost: int
+    ready_ink: int
+
+    def message(self) -> str:
+        return (f"{self.player}: Played '{self.card}' for {self.cost} ink. "
+                f"({self.ready_ink} ink remaining).")
+
+
+@dataclass(slots=True)
+class ActionResolved(GameEvent):
+    player: str
+    card: str
+    abilities: int = 0  # Compiled abilities that resolved (see CardEffects.effect_engine)
+
+    def message(self) -> str:
+        if not self.abilities:
+            return f"{self.player}: Action/Song '{self.card}' discarded (no executable effect yet)."
+        return f"{self.player}: Action/Song '{self.card}' resolved {self.abilities} ability(ies) and discarded."
+
+
+@dataclass(slots=True)
+class AbilityTriggered(GameEvent):
+    player: str
+    card: str
+    trigger: str  # TriggerCondition name
+
+    def message(self) -> str:
+        return f"{self.player}: '{self.card}' triggers ({self.trigger})."
+
+
+@dataclass(slots=True)
+class LoreChanged(GameEvent):
+    player: str
+    amount: int  # Negative for lore lost
+    total_lore: int
+
+    def message(self) -> str:
+        verb = "gains" if self.amount >= 0 else "loses"
+        return f"{self.player} {verb} {abs(self.amount)} lore from an effect. Total lore: {self.total_lore}."
+
+
+@dataclass(slots=True)
+class DamageChanged(GameEvent):
+    player: str
+    card: str
+    amount: int  # Negative for damage removed
+    damage: int
+
+    def message(self) -> str:
+        if self.amount >= 0:
+            return f"{self.player}: '{self.card}' takes {self.amount} damage (now {self.damage})."
+        return f"{self.player}: {-self.amount} damage removed from '{self.card}' (now {self.damage})."
+
+
+@dataclass(slots=True)
+class Quested(GameEvent):
+    player: str
+    card: str
+    lore_gained: int
+    total_lore: int
+
+    def message(self) -> str:
+        return (f"{self.player}: Quested with '{self.card}' for {self.lore_gained} lore. "
+                f"Total lore: {self.total_lore}.")
+
+
+@dataclass(slots=True)
+class ChallengeDeclared(GameEvent):
+    player: str
+    attacker: str
+    defender: str
+
+    def message(self) -> str:
+        return f"{self.player}: '{self.attacker}' challenges '{self.defender}'!"
+
+
+@dataclass(slots=True)
+class ChallengeDamage(GameEvent):
+    attacker: str
+    attacker_strength: int
+    attacker_damage: int
+    attacker_willpower: int
+    defender: str
+    defender_strength: int
+    defender_damage: int
+    defender_willpower: int
+
+    def message(self) -> str:
+        return (f"  > '{self.attacker}' ({self.attacker_strength} Str) deals {self.attacker_strength} damage.\n"
+                f"  > '{self.defender}' ({self.defender_strength} Str) deals {self.defender_strength} damage.\n"
+                f"  > '{self.defender}' now has {self.defender_damage} damage (Willpower: {self.defender_willpower}).\n"
+                f"  > '{self.attacker}' now has {self.attacker_damage} damage (Willpower: {self.attacker_willpower}).")
+
+
+@dataclass(slots=True)
+class CardBanished(GameEvent):
+    player: str
+    card: str
+
+    def message(self) -> str:
+        return f"{self.player}: '{self.card}' moved from play to discard."
+
+
+# Message templates for ActionRejected, keyed by reason code
+REJECTION_MESSAGES = {
+    "not_in_hand": "Card '{card}' not found in hand.",
+    "not_inkable": "Card '{card}' is not inkable.",
+    "already_inked": "Already inked a card this turn.",
+    "insufficient_ink": "Cannot play '{card}'. Cost {cost}, Ready Ink {ready_ink}.",
+    "not_in_play": "Card '{card}' not found in play area.",
+    "not_a_character": "Card '{card}' is not a character.",
+    "exerted": "Card '{card}' is already exerted.",
+    "drying": "Card '{card}' was played this turn and its ink is still drying.",
+    "no_lore": "Character '{card}' has no base lore value to quest for.",
+    "defender_not_in_play": "Defender '{card}' not found in opponent's play area.",
+    "defender_ready": "Defender '{card}' is ready; only exerted characters can be challenged.",
+    "already_removed": "Tried to banish '{card}', but it was already removed.",
+    "game_over": "Cannot advance turn, game is already over.",
+    }
+
+
+@dataclass(slots=True)
+class ActionRejected(GameEvent):
+    player: str
+    reason: str  # Key of REJECTION_MESSAGES
+    card: Optional[str] = None
+    details: Dict[str, Any] = field(default_factory=dict)
+
+    def message(self) -> str:
+        template = REJECTION_MESSAGES.get(self.reason, self.reason)
+        return f"{self.player} Error: {template.format(card=self.card, **self.details)}"
+
+
+@dataclass(slots=True)
+class GameOver(GameEvent):
+    winner: Optional[str]  # None for a draw
+    reason: str  # 'lore', 'decked' or 'draw'
+    loser: Optional[str] = None
+    lore: int = 0
+
+    def message(self) -> str:
+        if self.reason == "lore":
+            result = f"{self.winner} wins by reaching {self.lore} lore!"
+        elif self.reason == "decked":
+            result = f"{self.loser} lost (decked out). {self.winner} wins!"
+        else:
+            result = "Draw! Both players lost simultaneously (decked out)."
+        return f"\n--- Game Over ---\n{result}"
+
+
+# --- Sinks ---
+
+class EventSink:
+    """Receives game events. Emitters skip building events when enabled is False."""
+
+    enabled: bool = True
+
+    def emit(self, event: GameEvent) -> None:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class NullSink(EventSink):
+    """Discards everything; emitters check enabled and never construct events."""
+
+    enabled = False
+
+    def emit(self, event: GameEvent) -> None:
+        pass
+
+
+class ConsoleSink(EventSink):
+    """Prints each event's message (the engine's default, human-readable output)."""
+
+    def __init__(self, verbose: bool = False):
+        """
+        Args:
+            verbose: Also print routine events marked quiet (e.g. every card drawn).
+        """
+        self.verbose = verbose
+
+    def emit(self, event: GameEvent) -> None:
+        if self.verbose or not event.quiet:
+            print(event.message())
+
+
+class JsonlSink(EventSink):
+    """Writes one JSON object per event to a file."""
+
+    def __init__(self, path_or_file):
+        """
+        Args:
+            path_or_file: A filename (opened for writing, closed by close()) or an open text file.
+        """
+        self._owns_file = isinstance(path_or_file, str)
+        self.file: IO[str] = open(path_or_file, 'w', encoding='utf-8') if self._owns_file else path_or_file
+
+    def emit(self, event: GameEvent) -> None:
+        self.file.write(json.dumps(event.to_dict(), ensure_ascii=False))
+        self.file.write("\n")
+
+    def close(self) -> None:
+        if self._owns_file and not self.file.closed:
+            self.file.close()
+
+
+class ListSink(EventSink):
+    """Keeps events in memory (handy for analysis and debugging)."""
+
+    def __init__(self):
+        self.events: List[GameEvent] = []
+
+    def emit(self, event: GameEvent) -> None:
+        self.events.append(event)
+
+
+NULL_SINK = NullSink()
+
+
+# --- Example Usage ---
+if __name__ == "__main__":
+    import io
+
+    sample_events = [
+        GameStarted("Alyssa"),
+        CardInked("Alyssa", "Maui - Half-Shark", 1),
+        ActionRejected("Brian", "insufficient_ink", "Be Prepared", {"cost": 7, "ready_ink": 2}),
+        GameOver("Alyssa", "lore", lore=20),
+        ]
+
+    console = ConsoleSink()
+    for event in sample_events:
+        console.emit(event)
+
+    buffer = io.StringIO()
+    with JsonlSink(buffer) as jsonl:
+        for event in sample_events:
+            jsonl.emit(event)
+    print("\nJSONL output:")
+    print(buffer.getvalue())
@@ -1,49 +1,119 @@
 import os
 import random
-from typing import List, Optional, Tuple
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Tuple
 
 # Attempt to import necessary classes
 try:
-    from player import Player
+    from player import Player, UndoRecord
     from card import Card
     from deck import Deck
 except ImportError:
     print("Warning: Could not import Player, Card, or Deck classes. GameState functionality/example will be limited.")
     exit()
+from events import ActionRejected, EventSink, GameOver, GameStarted, TurnStarted
+
+# An agent plays one main phase: it is called with the game and the active player and acts
+# through the Player methods (ink_card, play_card, quest, challenge). Returning ends the turn.
+Agent = Callable[['GameState', Player], None]
+
+
+@dataclass
+class GameResult:
+    """Compact summary of a finished game (see GameState.run)."""
+    winner: Optional[int]  # Index of the winning player, None for a draw or turn limit
+    reason: str  # 'lore', 'decked', 'draw' or 'turn_limit'
+    turns: int
+    first_player: int
+    lore_curve: Tuple[List[int], List[int]]  # Each player's lore at the end of each of their turns
+    cards_played: Tuple[List[int], List[int]]  # Card ids each player played, in order
+
+
 class GameState:
     """Manages the state and flow of a Lorcana game between two players."""
 
     TARGET_LORE = 20 # Standard lore goal to win
+    MAX_TURNS = 100 # Safety cap for run(); decks normally run out long before this
 
-    def __init__(self, player1: Player, player2: Player):
+    def __init__(self, player1: Player, player2: Player, events: Optional[EventSink] = None,
+                 rng: Optional[random.Random] = None):
         """
         Initializes the game state.
 
         Args:
             player1: The first Player object.
             player2: The second Player object.
+            events: Event sink shared by the game and both players. Defaults to player1's sink.
+            rng: The game's random stream (see rng.game_rng). Defaults to player1's rng.
         """
         self.players: List[Player] = [player1, player2]
+        self.events: EventSink = events if events is not None else player1.events
+        # One make/unmake log for the whole game, so undo() reverts changes in global order
+        self.undo_log: List[UndoRecord] = []
+        for player in self.players:
+            player.events = self.events
+            player.undo_log = self.undo_log
+        player1.opponent, player2.opponent = player2, player1
+        self.rng: random.Random = rng if rng is not None else player1.rng
         self.turn: int = 1
         self.game_over: bool = False
         self.winner: Optional[Player] = None
+        self.win_reason: Optional[str] = None # 'lore', 'decked' or 'draw' once the game is over
 
         # Randomly determine the starting player
-        self.active_player_index: int = random.choice([0, 1])
+        self.active_player_index: int = self.rng.randrange(2)
+        self.first_player_index: int = self.active_player_index
         self.active_player: Player = self.players[self.active_player_index]
         self.inactive_player: Player = self.players[1 - self.active_player_index]
 
-        print(f"\n--- Game Start ---")
-        print(f"{self.active_player.name} will go first.")
+        if self.events.enabled:
+            self.events.emit(GameStarted(self.active_player.name))
 
         # Initial state display (optional)
         # self.display_state()
 
         # Perform start-of-game actions for the first player
+        # (official rules skip the first player's draw on turn 1, so no draw phase here)
         self.active_player.turn_start_ready_phase()
-        # Note: Official rules skip the first player's draw phase on turn 1.
-        # We'll implement this rule in the game loop logic later,
-        # for now, the player methods exist.
+        self.active_player.turn_start_set_phase()
+        self.undo_log.clear() # The opening position is the root; nothing before it can be undone
+
+    # --- Make/unmake ---
+
+    def undo(self) -> bool:
+        """
+        Reverts the most recent change to the game or either player.
+
+        Returns:
+            True if a change was undone, False if there was nothing to undo.
+        """
+        if not self.undo_log:
+            return False
+        undo_function, *args = self.undo_log.pop()
+        undo_function(*args)
+        return True
+
+    def mark(self) -> int:
+        """Returns a position in the undo log to return to later with undo_to()."""
+        return len(self.undo_log)
+
+    def undo_to(self, mark: int) -> None:
+        """Reverts every change made since mark() returned the given value."""
+        log = self.undo_log
+        while len(log) > mark:
+            undo_function, *args = log.pop()
+            undo_function(*args)
+
+    def _undo_next_turn(self, previous_index: int, previous_turn: int) -> None:
+        self.active_player_index = previous_index
+        self.active_player = self.players[previous_index]
+        self.inactive_player = self.players[1 - previous_index]
+        self.turn = previous_turn
+
+    def _undo_game_over(self) -> None:
+        self.game_over = False
+        self.winner = None
+        self.win_reason = None
 
     def get_opponent(self, player: Player) -> Player:
         """Returns the opponent of the given player."""
@@ -70,9 +140,11 @@ class GameState:
         for player in self.players:
             if player.lore >= self.TARGET_LORE:
                 self.game_over = True
+                self.undo_log.append((self._undo_game_over,))
                 self.winner = player
-                print(f"\n--- Game Over ---")
-                print(f"{self.winner.name} wins by reaching {player.lore} lore!")
+                self.win_reason = "lore"
+                if self.events.enabled:
+                    self.events.emit(GameOver(player.name, "lore", lore=player.lore))
                 return True
 
         # Check loss condition (decking out)
@@ -82,21 +154,27 @@ class GameState:
         if player1_lost and player2_lost:
             # Rare case: Both players deck out simultaneously? Declare a draw.
             self.game_over = True
+            self.undo_log.append((self._undo_game_over,))
             self.winner = None # Indicate a draw
-            print(f"\n--- Game Over ---")
-            print("Draw! Both players lost simultaneously (decked out).")
+            self.win_reason = "draw"
+            if self.events.enabled:
+                self.events.emit(GameOver(None, "draw"))
             return True
         elif player1_lost:
             self.game_over = True
+            self.undo_log.append((self._undo_game_over,))
             self.winner = self.players[1]
-            print(f"\n--- Game Over ---")
-            print(f"{self.players[0].name} lost (decked out). {self.winner.name} wins!")
+            self.win_reason = "decked"
+            if self.events.enabled:
+                self.events.emit(GameOver(self.winner.name, "decked", loser=self.players[0].name))
             return True
         elif player2_lost:
             self.game_over = True
+            self.undo_log.append((self._undo_game_over,))
             self.winner = self.players[0]
-            print(f"\n--- Game Over ---")
-            print(f"{self.players[1].name} lost (decked out). {self.winner.name} wins!")
+            self.win_reason = "decked"
+            if self.events.enabled:
+                self.events.emit(GameOver(self.winner.name, "decked", loser=self.players[1].name))
             return True
 
         return False # No win/loss condition met yet
@@ -104,18 +182,23 @@ class GameState:
     def next_turn(self):
         """Advances the game to the next player's turn."""
         if self.game_over:
-            print("Cannot advance turn, game is already over.")
+            if self.events.enabled:
+                self.events.emit(ActionRejected("GameState", "game_over"))
             return
 
+        self.active_player.turn_end_phase()
+
         # Switch active player
+        self.undo_log.append((self._undo_next_turn, self.active_player_index, self.turn))
         self.active_player_index = 1 - self.active_player_index
         self.active_player = self.players[self.active_player_index]
         self.inactive_player = self.players[1 - self.active_player_index]
 
-        # Increment turn counter only when player 1 starts their turn again
-        if self.active_player_index == 0:
+        # Increment turn counter only when the first player starts their turn again
+        if self.active_player_index == self.first_player_index:
             self.turn += 1
-            print(f"\n=== Starting Turn {self.turn} ===")
+            if self.events.enabled:
+                self.events.emit(TurnStarted(self.turn))
 
         # Perform start-of-turn actions for the new active player
         # Win condition check (lore) should happen *before* readying according to rules
@@ -123,6 +206,7 @@ class GameState:
              return # Stop if game ended due to lore check
 
         self.active_player.turn_start_ready_phase()
+        self.active_player.turn_start_set_phase()
         self.active_player.turn_start_draw_phase()
 
         # Check if drawing caused the player to lose
@@ -133,6 +217,47 @@ class GameState:
         # self.display_state()
 
 
+    def run(self, agent1: Agent, agent2: Agent, max_turns: int = MAX_TURNS) -> GameResult:
+        """
+        Plays the game to completion from its current (freshly started) state.
+
+        Each turn the active player's agent plays the main phase; next_turn() then runs the
+        opponent's ready, set and draw phases and the win/loss checks. Pass events.NULL_SINK
+        when creating the players/game for silent, fast batch runs.
+
+        Args:
+            agent1: Agent for self.players[0].
+            agent2: Agent for self.players[1].
+            max_turns: Stop with reason 'turn_limit' after this many full turns.
+
+        Returns:
+            A GameResult summarising the game.
+        """
+        agents = (agent1, agent2)
+        lore_curve: Tuple[List[int], List[int]] = ([], [])
+
+        while not self.game_over:
+            index = self.active_player_index
+            player = self.active_player
+            agents[index](self, player)
+            lore_curve[index].append(player.lore)
+
+            if self.check_win_condition():
+                break
+            if self.turn >= max_turns and 1 - index == self.first_player_index:
+                break
+            self.next_turn()
+
+        winner = self.players.index(self.winner) if self.winner is not None else None
+        return GameResult(
+                winner=winner,
+                reason=self.win_reason or "turn_limit",
+                turns=self.turn,
+                first_player=self.first_player_index,
+                lore_curve=lore_curve,
+                cards_played=(self.players[0].cards_played, self.players[1].cards_played),
+                )
+
     def display_state(self):
         """Prints the state of both players."""
         print(f"\n===== Game State - Turn {self.turn} =====")
@@ -146,8 +271,7 @@ class GameState:
 if __name__ == "__main__":
     # Requires data_fetcher, card, deck, and player modules
     try:
-        from dataFetcher import fetch_lorcana_data
-        from card import parse_card_data
+        from catalog import load_card_maps
         from deck import Deck, load_deck_identifiers_from_file
         # Player is imported at the top
     except ImportError:
@@ -156,11 +280,9 @@ if __name__ == "__main__":
 
     # 1. Load Card Data
     print("Loading card data...")
-    raw_card_data = fetch_lorcana_data()
-    if not raw_card_data: exit("Failed to load card data.")
-    all_cards_by_id, all_cards_by_name, all_cards_by_lowercase_name = parse_card_data(raw_card_data)
+    all_cards_by_id, all_cards_by_name, all_cards_by_lowercase_name = load_card_maps()
     if not all_cards_by_name: exit("Card name map is empty.")
-    combined_name_map = {**all_cards_by_name, **all_cards_by_lowercase_name}
+    name_resolver = next(iter(all_cards_by_id.values())).table.name_resolver  # Shared by both decks
 
     # 2. Load Decks for two players
     deck_file_1 = "Decks/LandGo.txt" # Player 1's deck
@@ -169,7 +291,7 @@ if __name__ == "__main__":
     print(f"\nLoading deck for Player 1: '{deck_file_1}'...")
     p1_names = load_deck_identifiers_from_file(deck_file_1)
     if not p1_names: exit(f"Failed to load deck file '{deck_file_1}'.")
-    deck1 = Deck(p1_names, combined_name_map)
+    deck1 = Deck(p1_names, name_resolver)
     if deck1.failed_lookups: print(f"Warning: Deck 1 created with missing cards.")
     if not deck1.is_valid(check_size=True, check_copies=True):
          print("Warning: Deck 1 is not valid.")
@@ -182,7 +304,7 @@ if __name__ == "__main__":
 
     p2_names = load_deck_identifiers_from_file(deck_file_2)
     if not p2_names: exit(f"Failed to load deck file '{deck_file_2}'.")
-    deck2 = Deck(p2_names, combined_name_map)
+    deck2 = Deck(p2_names, name_resolver)
     if deck2.failed_lookups: print(f"Warning: Deck 2 created with missing cards.")
     if not deck2.is_valid(check_size=True, check_copies=True):
          print("Warning: Deck 2 is not valid.")
@@ -203,8 +325,8 @@ if __name__ == "__main__":
     # (Add simple AI actions here later: ink, play)
     # Example: Find and ink first inkable card
     active_p = game.active_player
-    inkable_card = next((c for c in active_p.hand if c.inkable), None)
-    if inkable_card and not active_p.has_inked_this_turn:
+    inkable_card = next((c for c in active_p.hand if active_p.card(c).inkable), None)
+    if inkable_card is not None and not active_p.has_inked_this_turn:
         active_p.ink_card(inkable_card)
     game.display_state()
     game.next_turn() # -> Player 2's turn 1 start
@@ -212,8 +334,8 @@ if __name__ == "__main__":
     # Turn 1 - Player 2
     print(f"\n--- {game.active_player.name}'s Main Phase (Turn 1) ---")
     active_p = game.active_player
-    inkable_card = next((c for c in active_p.hand if c.inkable), None)
-    if inkable_card and not active_p.has_inked_this_turn:
+    inkable_card = next((c for c in active_p.hand if active_p.card(c).inkable), None)
+    if inkable_card is not None and not active_p.has_inked_this_turn:
         active_p.ink_card(inkable_card)
     game.display_state()
     game.next_turn() # -> Player 1's turn 2 start (Turn counter increments)
@@ -222,12 +344,12 @@ if __name__ == "__main__":
     print(f"\n--- {game.active_player.name}'s Main Phase (Turn 2) ---")
     active_p = game.active_player
     # Try to play a 1-cost
-    play_1 = next((c for c in active_p.hand if c.cost == 1), None)
-    if play_1 and active_p.ready_ink >= 1:
+    play_1 = next((c for c in active_p.hand if active_p.card(c).cost == 1), None)
+    if play_1 is not None and active_p.ready_ink >= 1:
         active_p.play_card(play_1)
     # Try to ink
-    inkable_card = next((c for c in active_p.hand if c.inkable), None)
-    if inkable_card and not active_p.has_inked_this_turn:
+    inkable_card = next((c for c in active_p.hand if active_p.card(c).inkable), None)
+    if inkable_card is not None and not active_p.has_inked_this_turn:
          active_p.ink_card(inkable_card)
     game.display_state()
     game.next_turn() # -> Player 2's turn 2 start
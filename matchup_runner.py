@@ -0,0 +1,229 @@
+# matchup_runner.py
+
+import math
+import multiprocessing
+import os
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from agents import greedy_agent
+from dataFetcher import refresh_if_stale
+from deck import Deck, load_deck_identifiers_from_file
+from events import NULL_SINK, EventSink
+from game_state import Agent, GameResult, GameState
+from player import Player
+from rng import game_rng
+
+'''
+Monte Carlo matchup runner: plays many headless games between two decklists across a
+process pool and aggregates win rates with confidence intervals.
+
+Each worker loads the card catalog and resolves both decklists once (initializer), then
+plays chunks of games. Game i owns the random stream rng.game_rng(root_seed, i), so results
+do not depend on how games were sharded and replay_game() can re-run any one game alone.
+Workers stream compact per-game records back with imap_unordered as chunks finish.
+'''
+
+DEFAULT_CHUNK_SIZE = 250  # Games per task; large enough to amortise IPC, small enough to balance load
+Z_95 = 1.959964  # Normal quantile for 95% confidence intervals
+
+# (game_index, winner, reason, turns, first_player) - winner is 0 (deck 1), 1 (deck 2) or None
+GameRecord = Tuple[int, Optional[int], str, int, int]
+
+
+def wilson_interval(successes: int, trials: int, z: float = Z_95) -> Tuple[float, float]:
+    """Wilson score interval for a binomial proportion."""
+    if trials == 0:
+        return 0.0, 1.0
+    p = successes / trials
+    denominator = 1 + z * z / trials
+    centre = (p + z * z / (2 * trials)) / denominator
+    margin = z * math.sqrt(p * (1 - p) / trials + z * z / (4 * trials * trials)) / denominator
+    return max(0.0, centre - margin), min(1.0, centre + margin)
+
+
+@dataclass
+class MatchupResult:
+    """Aggregated outcome of a matchup run."""
+    games: int = 0
+    wins: List[int] = field(default_factory=lambda: [0, 0])  # Wins for deck 1 and deck 2
+    draws: int = 0  # Draws and turn-limit games
+    first_player_wins: int = 0
+    total_turns: int = 0
+    reasons: Dict[str, int] = field(default_factory=dict)
+    elapsed: float = 0.0
+
+    def add(self, record: GameRecord) -> None:
+        _, winner, reason, turns, first_player = record
+        self.games += 1
+        self.total_turns += turns
+        self.reasons[reason] = self.reasons.get(reason, 0) + 1
+        if winner is None:
+            self.draws += 1
+        else:
+            self.wins[winner] += 1
+            if winner == first_player:
+                self.first_player_wins += 1
+
+    @property
+    def decided(self) -> int:
+        return self.wins[0] + self.wins[1]
+
+    @property
+    def win_rate(self) -> float:
+        """Deck 1's share of the decided games."""
+        return self.wins[0] / self.decided if self.decided else 0.0
+
+    @property
+    def win_rate_ci(self) -> Tuple[float, float]:
+        """95% Wilson interval for win_rate."""
+        return wilson_interval(self.wins[0], self.decided)
+
+    @property
+    def games_per_second(self) -> float:
+        return self.games / self.elapsed if self.elapsed else 0.0
+
+    def summary(self) -> str:
+        low, high = self.win_rate_ci
+        first_rate = self.first_player_wins / self.decided if self.decided else 0.0
+        return (f"{self.games} games: deck 1 {self.wins[0]} - deck 2 {self.wins[1]} ({self.draws} undecided)\n"
+                f"Deck 1 win rate {self.win_rate:.2%} (95% CI {low:.2%} - {high:.2%}), "
+                f"first player wins {first_rate:.2%}, average {self.total_turns / max(self.games, 1):.1f} turns\n"
+                f"End reasons: {self.reasons}. {self.games_per_second:.0f} games/sec")
+
+
+# --- Worker side ---
+
+_worker: Dict[str, object] = {}
+
+
+def _init_worker(deck_file_1: str, deck_file_2: str, agent_1: Agent, agent_2: Agent,
+                 root_seed: int) -> None:
+    """Pool initializer: loads the catalog and resolves both decklists once per process."""
+    from catalog import load_card_maps
+
+    all_cards_by_id, _, _ = load_card_maps(refresh=False)  # iter_matchup refreshed the card data once
+    name_resolver = next(iter(all_cards_by_id.values())).table.name_resolver
+    decks = []
+    for deck_file in (deck_file_1, deck_file_2):
+        names = load_deck_identifiers_from_file(deck_file)
+        if not names:
+            raise ValueError(f"Could not load decklist '{deck_file}'.")
+        deck = Deck(names, name_resolver)
+        # Canonical order, so a game's shuffle depends only on its seed
+        decks.append(Deck.from_card_ids(sorted(deck.cards), deck.catalog, failed_lookups=deck.failed_lookups))
+    _worker.update(decks=decks, agents=(agent_1, agent_2), root_seed=root_seed)
+
+
+def _run_game(game_index: int, events: EventSink) -> GameResult:
+    """Plays one game from the worker's template decks using the game's own random stream."""
+    rng = game_rng(_worker["root_seed"], game_index)
+    deck_1, deck_2 = (template.copy(rng) for template in _worker["decks"])
+    deck_1.shuffle()
+    deck_2.shuffle()
+    game = GameState(Player("Deck 1", deck_1, 0, events), Player("Deck 2", deck_2, 1, events), events, rng)
+    return game.run(*_worker["agents"])
+
+
+def _play_game(game_index: int) -> GameRecord:
+    result = _run_game(game_index, NULL_SINK)
+    return game_index, result.winner, result.reason, result.turns, result.first_player
+
+
+def _play_chunk(bounds: Tuple[int, int]) -> List[GameRecord]:
+    start, stop = bounds
+    return [_play_game(game_index) for game_index in range(start, stop)]
+
+
+# --- Runner ---
+
+def iter_matchup(deck_file_1: str, deck_file_2: str, games: int, agent_1: Agent = greedy_agent,
+                 agent_2: Agent = greedy_agent, processes: Optional[int] = None, root_seed: int = 0,
+                 chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[GameRecord]:
+    """
+    Plays games between two decklists and yields one GameRecord per game as results arrive.
+
+    Args:
+        deck_file_1: Decklist for player index 0.
+        deck_file_2: Decklist for player index 1.
+        games: Number of games to play.
+        agent_1: Agent for deck 1 (module-level functions, so they can be sent to workers).
+        agent_2: Agent for deck 2.
+        processes: Worker processes (default: all cores). 1 plays in this process.
+        root_seed: Root of the per-game seeds; the same root and game index replay the same game.
+        chunk_size: Games per task sent to a worker.
+    """
+    refresh_if_stale()  # Once here, so workers don't all hit the API
+    chunks = [(start, min(start + chunk_size, games)) for start in range(0, games, chunk_size)]
+    processes = processes or os.cpu_count() or 1
+    init_args = (deck_file_1, deck_file_2, agent_1, agent_2, root_seed)
+
+    if processes == 1:
+        _init_worker(*init_args)
+        for chunk in chunks:
+            yield from _play_chunk(chunk)
+        return
+
+    with multiprocessing.Pool(processes, initializer=_init_worker, initargs=init_args) as pool:
+        for records in pool.imap_unordered(_play_chunk, chunks):
+            yield from records
+
+
+def replay_game(deck_file_1: str, deck_file_2: str, game_index: int, agent_1: Agent = greedy_agent,
+                agent_2: Agent = greedy_agent, root_seed: int = 0,
+                events: Optional[EventSink] = None) -> GameResult:
+    """
+    Re-runs a single game of a batch exactly, e.g. to inspect an outlier with a ConsoleSink.
+
+    Args:
+        deck_file_1, deck_file_2, agent_1, agent_2, root_seed: As passed to iter_matchup/run_matchup.
+        game_index: The index of the game within the batch.
+        events: Sink for the game's events (default: a ConsoleSink).
+
+    Returns:
+        The game's GameResult.
+    """
+    from events import ConsoleSink
+
+    _init_worker(deck_file_1, deck_file_2, agent_1, agent_2, root_seed)
+    return _run_game(game_index, events if events is not None else ConsoleSink())
+
+
+def run_matchup(deck_file_1: str, deck_file_2: str, games: int,
+                progress: Optional[Callable[[MatchupResult], None]] = None, **kwargs) -> MatchupResult:
+    """
+    Plays a matchup and aggregates the results (see iter_matchup for the arguments).
+
+    Args:
+        progress: Optional callback given the running MatchupResult after each game.
+
+    Returns:
+        The aggregated MatchupResult.
+    """
+    result = MatchupResult()
+    start = time.perf_counter()
+    for record in iter_matchup(deck_file_1, deck_file_2, games, **kwargs):
+        result.add(record)
+        if progress:
+            result.elapsed = time.perf_counter() - start
+            progress(result)
+    result.elapsed = time.perf_counter() - start
+    return result
+
+
+# --- Example Usage ---
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Play a Monte Carlo matchup between two decklists.")
+    parser.add_argument("deck_1", nargs="?", default="Decks/LandGo.txt")
+    parser.add_argument("deck_2", nargs="?", default="Decks/BouncingBosses.txt")
+    parser.add_argument("--games", type=int, default=10000)
+    parser.add_argument("--processes", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    matchup = run_matchup(args.deck_1, args.deck_2, args.games, processes=args.processes, root_seed=args.seed)
+    print(f"\n{args.deck_1} vs {args.deck_2}")
+    print(matchup.summary())
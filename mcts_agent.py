@@ -0,0 +1,287 @@
+# mcts_agent.py
+
+import math
+import random
+import time
+from typing import Dict, List, Optional, Tuple
+
+from agents import greedy_agent
+from compact_state import CompactGameState
+from events import NULL_SINK
+from game_state import GameState
+from legal_actions import END_TURN, Action, LegalActionGenerator
+from player import Player
+from zobrist import TranspositionTable, game_hash
+
+'''
+Monte Carlo Tree Search agent for GameState.run().
+
+Each decision in the agent's main phase is searched on a private copy of the game in which
+hidden information is re-dealt (own deck order, opponent's hand and deck), so the agent
+never peeks at the real deck order. The copy has a private random stream seeded with one
+draw from the real game's rng per decision, so a seeded game replays exactly no matter how
+many playouts a wall-clock budget allowed. Iterations walk the tree with UCT, expand one action,
+roll the game out and unwind everything with GameState.undo_to(), so no state is copied
+per node. The tree covers the agent's own turn: after an action is chosen its subtree
+becomes the root for the next decision of that turn. Because every decision re-deals hidden
+cards, a reused node's actions are re-checked against the legal actions each time it is
+visited: children whose action is not legal now are skipped and untried actions are rebuilt.
+
+    agent = MCTSAgent(playouts=300)              # or MCTSAgent(budget_ms=50)
+    result = game.run(agent, greedy_agent)
+    print(agent.report())
+'''
+
+DEFAULT_PLAYOUTS = 200
+EXPLORATION = 1.41
+MAX_ROLLOUT_TURNS = 30  # Rollouts stop after this many extra turns and are scored on lore
+TRANSPOSITION_MIN_SAMPLES = 4  # Rollouts a cached position needs before its mean replaces new rollouts
+
+
+class Node:
+    """One position in the search tree (the agent's own decisions within a turn)."""
+
+    __slots__ = ("action", "children", "untried", "live", "legal", "visits", "value")
+
+    def __init__(self, action: Optional[Action] = None):
+        self.action = action
+        self.children: Dict[Action, 'Node'] = {}
+        self.untried: List[Action] = []  # Legal now, not expanded yet
+        self.live: List['Node'] = []  # Children whose action is legal now
+        self.legal: Optional[Tuple[Action, ...]] = None  # The legal actions untried/live were built from
+        self.visits = 0
+        self.value = 0.0
+
+    def sync(self, legal: Tuple[Action, ...]) -> None:
+        """
+        Rebuilds untried/live for the legal actions of the position reached now.
+        The generator returns the same tuple while nothing changed, so this is usually one identity check.
+        """
+        if legal is self.legal:
+            return
+        self.legal = legal
+        children = self.children
+        self.untried = [action for action in legal if action not in children]
+        self.live = [children[action] for action in legal if action in children]
+
+    def best_child(self, exploration: float) -> 'Node':
+        log_visits = math.log(self.visits)
+        return max(self.live,
+                   key=lambda child: child.value / child.visits
+                   + exploration * math.sqrt(log_visits / child.visits))
+
+
+class MCTSAgent:
+    """Callable agent that searches each main-phase decision with MCTS."""
+
+    def __init__(self, playouts: Optional[int] = None, budget_ms: Optional[float] = None,
+                 rollout: str = "random", exploration: float = EXPLORATION,
+                 max_rollout_turns: int = MAX_ROLLOUT_TURNS,
+                 transpositions: Optional[TranspositionTable] = None):
+        """
+        Args:
+            playouts: Iterations per decision (default DEFAULT_PLAYOUTS when budget_ms is not set).
+            budget_ms: Wall-clock budget per decision in milliseconds. If both are given,
+                       whichever runs out first ends the search.
+            rollout: 'random' (uniform legal actions) or 'heuristic' (greedy_agent for both sides).
+            exploration: UCT exploration constant.
+            max_rollout_turns: Rollouts that run longer than this are scored on lore difference.
+            transpositions: Optional table of rollout results by position hash. Leaves reached
+                            again by another action order reuse the cached mean once it has
+                            TRANSPOSITION_MIN_SAMPLES rollouts instead of rolling out again.
+        """
+        if rollout not in ("random", "heuristic"):
+            raise ValueError(f"Unknown rollout policy '{rollout}'.")
+        self.playouts = playouts if playouts is not None or budget_ms is not None else DEFAULT_PLAYOUTS
+        self.budget_ms = budget_ms
+        self.rollout = rollout
+        self.exploration = exploration
+        self.max_rollout_turns = max_rollout_turns
+        self.transpositions = transpositions
+
+        self._root: Optional[Node] = None
+        self._root_key: Optional[Tuple[int, int, int]] = None
+
+        # Running totals across decisions
+        self.decisions = 0
+        self.iterations = 0
+        self.nodes = 0
+        self.search_seconds = 0.0
+        self.cached_evaluations = 0
+
+    # --- Agent interface ---
+
+    def __call__(self, game: GameState, player: Player) -> None:
+        """Plays the main phase: searches, applies the best action, repeats until END_TURN."""
+        generator = LegalActionGenerator(game)
+        while not game.game_over:
+            action = self.choose_action(game)
+            if action[0] == END_TURN:
+                break
+            generator.apply(action)
+            self._advance_root(action)
+
+    def choose_action(self, game: GameState) -> Action:
+        """Searches the current position and returns the most visited action."""
+        key = (id(game), game.turn, game.active_player_index)
+        if key != self._root_key or self._root is None:
+            self._root = Node()
+            self._root_key = key
+
+        search_game = self._determinize(game)
+        if self.transpositions is not None:
+            self.transpositions.new_generation()  # Hidden cards were re-dealt
+        generator = LegalActionGenerator(search_game)
+        root = self._root
+        root.sync(generator.actions())
+        me = game.active_player_index
+
+        start = time.perf_counter()
+        deadline = start + self.budget_ms / 1000 if self.budget_ms is not None else None
+        iterations = 0
+        while True:
+            if self.playouts is not None and iterations >= self.playouts:
+                break
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+            self._iterate(search_game, generator, root, me)
+            iterations += 1
+
+        self.decisions += 1
+        self.iterations += iterations
+        self.search_seconds += time.perf_counter() - start
+
+        root.sync(generator.actions())
+        if not root.live:
+            return generator.actions()[-1] if generator.actions() else (END_TURN, 0, 0)
+        return max(root.live, key=lambda child: child.visits).action
+
+    # --- Search ---
+
+    def _determinize(self, game: GameState) -> GameState:
+        """Copies the game with hidden cards re-dealt from the agent's point of view."""
+        rng = random.Random(game.rng.getrandbits(64))  # Search randomness never touches the real stream
+        search_game = CompactGameState.from_game(game).to_game(rng)
+        search_game.events = NULL_SINK
+        me, opponent = search_game.active_player, search_game.inactive_player
+        for player in search_game.players:
+            player.events = NULL_SINK
+        me.deck.shuffle()
+        unseen = opponent.hand + list(opponent.deck.cards)
+        rng.shuffle(unseen)
+        opponent.hand = unseen[:len(opponent.hand)]
+        opponent.deck.cards.clear()
+        opponent.deck.cards.extend(unseen[len(opponent.hand):])
+        opponent.zobrist = opponent.zobrist_keys.zone_hash(opponent)  # The hand changed under to_player's hash
+        return search_game
+
+    def _iterate(self, game: GameState, generator: LegalActionGenerator, root: Node, me: int) -> None:
+        mark = game.mark()
+        turn = game.turn
+        path = [root]
+        node = root
+
+        # Selection: follow UCT while the node is fully expanded and still our decision
+        while True:
+            node.sync(generator.actions())
+            if node.untried or not node.live or game.game_over or node.action and node.action[0] == END_TURN:
+                break
+            node = node.best_child(self.exploration)
+            generator.apply(node.action)
+            path.append(node)
+
+        # Expansion
+        if node.untried and not game.game_over and not (node.action and node.action[0] == END_TURN):
+            action = node.untried.pop(game.rng.randrange(len(node.untried)))
+            child = node.children[action] = Node(action)
+            node.live.append(child)
+            generator.apply(action)
+            path.append(child)
+            self.nodes += 1
+
+        # Simulation (or a cached result for a transposed position) and backpropagation
+        reward = self._evaluate(game, generator, me, turn)
+        game.undo_to(mark)
+        for visited in path:
+            visited.visits += 1
+            visited.value += reward
+
+    def _evaluate(self, game: GameState, generator: LegalActionGenerator, me: int, start_turn: int) -> float:
+        table = self.transpositions
+        if table is None:
+            return self._rollout(game, generator, me, start_turn)
+        position = game_hash(game)
+        samples, total = table.probe(position) or (0, 0.0)
+        if samples >= TRANSPOSITION_MIN_SAMPLES:
+            self.cached_evaluations += 1
+            return total / samples
+        reward = self._rollout(game, generator, me, start_turn)
+        table.store(position, (samples + 1, total + reward), samples + 1)
+        return reward
+
+    def _rollout(self, game: GameState, generator: LegalActionGenerator, me: int, start_turn: int) -> float:
+        rng = game.rng
+        while not game.game_over and game.turn < start_turn + self.max_rollout_turns:
+            if self.rollout == "heuristic":
+                greedy_agent(game, game.active_player)
+                if not game.check_win_condition():
+                    game.next_turn()
+                continue
+            actions = generator.actions()
+            if len(actions) > 1 and rng.random() < 0.85:
+                generator.apply(actions[rng.randrange(len(actions) - 1)])
+            else:
+                game.next_turn()
+        return self._score(game, me)
+
+    @staticmethod
+    def _score(game: GameState, me: int) -> float:
+        if game.game_over:
+            if game.winner is None:
+                return 0.5
+            return 1.0 if game.players.index(game.winner) == me else 0.0
+        lore_difference = game.players[me].lore - game.players[1 - me].lore
+        return min(1.0, max(0.0, 0.5 + lore_difference / (2 * GameState.TARGET_LORE)))
+
+    def _advance_root(self, action: Action) -> None:
+        """Keeps the chosen action's subtree for the next decision of this turn."""
+        if self._root is not None:
+            self._root = self._root.children.get(action) or Node(action)
+
+    # --- Statistics ---
+
+    @property
+    def nodes_per_second(self) -> float:
+        return self.nodes / self.search_seconds if self.search_seconds else 0.0
+
+    @property
+    def playouts_per_second(self) -> float:
+        return self.iterations / self.search_seconds if self.search_seconds else 0.0
+
+    def report(self) -> str:
+        return (f"MCTS: {self.decisions} decisions, {self.iterations} playouts, {self.nodes} nodes in "
+                f"{self.search_seconds:.2f}s ({self.playouts_per_second:.0f} playouts/sec, "
+                f"{self.nodes_per_second:.0f} nodes/sec, {self.cached_evaluations} cached evaluations)")
+
+
+# --- Example Usage ---
+if __name__ == "__main__":
+    from catalog import load_card_maps
+    from deck import Deck, load_deck_identifiers_from_file
+    from rng import game_rng
+
+    all_cards_by_id, _, _ = load_card_maps()
+    name_resolver = next(iter(all_cards_by_id.values())).table.name_resolver
+    names = load_deck_identifiers_from_file("Decks/BouncingBosses.txt")
+
+    agent = MCTSAgent(playouts=100, rollout="heuristic")
+    wins, games = 0, 20
+    for game_index in range(games):
+        rng = game_rng(3, game_index)
+        game = GameState(Player("MCTS", Deck(names, name_resolver, rng), 0, NULL_SINK),
+                         Player("Greedy", Deck(names, name_resolver, rng), 1, NULL_SINK), NULL_SINK)
+        result = game.run(agent, greedy_agent)
+        wins += result.winner == 0
+
+    print(f"\nMCTS won {wins}/{games} mirror games against the greedy agent")
+    print(agent.report())
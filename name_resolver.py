@@ -0,0 +1,139 @@
+# name_resolver.py
+
+import re
+import unicodedata
+from collections import Counter
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple
+
+if TYPE_CHECKING:  # card_table.py builds the resolver lazily, so only import for type checking
+    from card import Card
+
+'''
+Card name resolution shared by every Deck built from the same catalog.
+
+A NameResolver is built once per card pool (see CardTable.name_resolver) and tries, in order:
+    1. exact name                      "Maui - Half-Shark"
+    2. case-insensitive name           "maui - half-shark"
+    3. normalized name                 "Maui – Half Shark" (punctuation, apostrophes, accents and
+                                        whitespace ignored)
+    4. trigram fuzzy match             "Maui - Half-Shrak" (typos in decklist files)
+Results are memoized per input string, so repeated decklists cost one dict lookup per unique name.
+'''
+
+FUZZY_MIN_SCORE = 0.5  # Minimum Dice similarity of trigram sets for a fuzzy match
+
+_NON_ALNUM = re.compile(r"[^0-9a-z]+")
+
+
+def normalize_name(name: str) -> str:
+    """Lowercases a card name and strips accents, punctuation, apostrophes and whitespace."""
+    decomposed = unicodedata.normalize("NFKD", name)
+    ascii_name = "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+    return _NON_ALNUM.sub("", ascii_name.lower())
+
+
+def _trigrams(normalized: str) -> set:
+    padded = f"  {normalized} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class NameResolver:
+    """Resolves decklist names to Card objects with exact, case-insensitive, normalized and fuzzy lookups."""
+
+    def __init__(self, cards: Iterable['Card'], fuzzy_min_score: float = FUZZY_MIN_SCORE):
+        """
+        Builds the lookup tables for a card pool.
+
+        Args:
+            cards: The cards of the pool. When two cards share a key, the first one wins.
+            fuzzy_min_score: Minimum trigram similarity (0..1) accepted by the fuzzy fallback.
+        """
+        self.fuzzy_min_score = fuzzy_min_score
+        self._exact: Dict[str, 'Card'] = {}
+        self._lower: Dict[str, 'Card'] = {}
+        self._normalized: Dict[str, 'Card'] = {}
+        self._memo: Dict[str, Tuple[Optional['Card'], str]] = {}
+
+        for card in cards:
+            self._exact.setdefault(card.name, card)
+            self._lower.setdefault(card.name.lower(), card)
+            self._normalized.setdefault(normalize_name(card.name), card)
+
+        # Trigram -> positions in self._keys, built from the normalized names
+        self._keys: List[str] = list(self._normalized)
+        self._key_trigram_counts: List[int] = []
+        self._trigram_index: Dict[str, List[int]] = {}
+        for position, key in enumerate(self._keys):
+            grams = _trigrams(key)
+            self._key_trigram_counts.append(len(grams))
+            for gram in grams:
+                self._trigram_index.setdefault(gram, []).append(position)
+
+    def __len__(self) -> int:
+        return len(self._exact)
+
+    def _fuzzy(self, normalized: str) -> Optional['Card']:
+        grams = _trigrams(normalized)
+        shared = Counter()
+        for gram in grams:
+            shared.update(self._trigram_index.get(gram, ()))
+        best_card, best_score = None, self.fuzzy_min_score
+        for position, overlap in shared.items():
+            score = 2 * overlap / (len(grams) + self._key_trigram_counts[position])
+            if score >= best_score:
+                best_card, best_score = self._normalized[self._keys[position]], score
+        return best_card
+
+    def lookup(self, name: str, fuzzy: bool = True) -> Tuple[Optional['Card'], str]:
+        """
+        Resolves a name and reports how it was matched.
+
+        Args:
+            name: The card name as written in a decklist.
+            fuzzy: Allow the trigram fallback when no exact/normalized match exists.
+
+        Returns:
+            (card, method) where method is 'exact', 'case', 'normalized', 'fuzzy' or 'missing'.
+        """
+        memo = self._memo.get(name)
+        if memo is not None and (fuzzy or memo[1] != 'fuzzy'):
+            return memo
+
+        card = self._exact.get(name)
+        if card is not None:
+            result = (card, 'exact')
+        elif (card := self._lower.get(name.lower())) is not None:
+            result = (card, 'case')
+        else:
+            normalized = normalize_name(name)
+            card = self._normalized.get(normalized)
+            if card is not None:
+                result = (card, 'normalized')
+            elif fuzzy and normalized and (card := self._fuzzy(normalized)) is not None:
+                result = (card, 'fuzzy')
+            else:
+                result = (None, 'missing')
+
+        if fuzzy or result[1] != 'missing':
+            self._memo[name] = result
+        return result
+
+    def resolve(self, name: str, fuzzy: bool = True) -> Optional['Card']:
+        """Returns the Card for a decklist name, or None if nothing matches."""
+        return self.lookup(name, fuzzy)[0]
+
+    def __repr__(self) -> str:
+        return f"<NameResolver over {len(self._exact)} card names>"
+
+
+# --- Example Usage ---
+if __name__ == "__main__":
+    from catalog import load_card_maps
+
+    all_cards_by_id, _, _ = load_card_maps()
+    resolver = next(iter(all_cards_by_id.values())).table.name_resolver
+
+    for query in ("Maui - Half-Shark", "maui - half-shark", "Maui – Half Shark",
+                  "Chernabogs Followers - Creatures of Evil", "Maui - Half-Shrak", "Not A Real Card"):
+        card, method = resolver.lookup(query)
+        print(f"{query!r:45} -> {method:10} {card.name if card else None}")
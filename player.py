@@ -1,7 +1,7 @@
 # player.py
 
-from typing import List, Optional, Dict, Any # For type hinting
-import random # Potentially for mulligan later, but not strictly needed yet
+from typing import List, Optional, Dict, Any, Tuple # For type hinting
+import random
 
 # Attempt to import necessary classes, handle potential ImportError
 try:
@@ -9,16 +9,34 @@ try:
     from deck import Deck
 except ImportError:
     print("Warning: Could not import Card or Deck classes. Player class functionality will be limited.")
+from events import (ActionRejected, ActionResolved, CardBanished, CardDrawn, CardInked, CardPlayed,
+                    CardsReadied, ChallengeDamage, ChallengeDeclared, ConsoleSink, DamageChanged, DeckedOut,
+                    EventSink, InitialHandDrawn, InkReadied, LoreChanged, PhaseStarted, Quested)
+from card_table import keyword_bits
+from CardEffects.derived_stats import DerivedStats
+from CardEffects.effect_engine import CardPlan, EffectContext
+from CardEffects.effects_Definitions import TriggerCondition
+from CardEffects.trigger_index import OPPONENT, OWN, SELF, TriggerIndex
+from zobrist import MASK64
+
+_RUSH = keyword_bits("Rush")
 
 # Define a type alias for cards in play for clarity
-# Each item will be a dictionary holding the card and its state
+# Each item will be a dictionary holding the card id and its state
 # Added 'uuid' for unique identification within the play area if needed later
-PlayableCard = Dict[str, Any] # Keys: 'card': Card, 'exerted': bool, 'damage': int, 'uuid': int
+# 'dry' is False for characters played this turn (ink still drying): they can't quest, and can
+# only challenge with Rush. It becomes True at their controller's next ready phase.
+PlayableCard = Dict[str, Any] # Keys: 'card_id': int, 'exerted': bool, 'damage': int, 'dry': bool, 'uuid': int
+
+# Every state change pushes (undo_function, *args) onto the undo log; popping a record and
+# calling undo_function(*args) reverts exactly that change (see Player.undo / GameState.undo).
+UndoRecord = Tuple[Any, ...]
 
 class Player:
     """Represents a player in the Lorcana game."""
 
-    def __init__(self, name: str, deck: Deck, player_id: int):
+    def __init__(self, name: str, deck: Deck, player_id: int, events: Optional[EventSink] = None,
+                 rng: Optional[random.Random] = None):
         """
         Initializes a Player.
 
@@ -26,17 +44,25 @@ class Player:
             name (str): The player's name (e.g., "Player 1").
             deck (Deck): The Deck object assigned to this player.
             player_id (int): A unique ID for the player (e.g., 0 or 1).
+            events (EventSink): Where game events go. Defaults to a ConsoleSink;
+                                pass events.NULL_SINK for silent batch runs.
+            rng (random.Random): The game's random stream. Defaults to the deck's rng.
         """
         self.name: str = name
         self.player_id: int = player_id
         self.deck: Deck = deck
-        self.hand: List[Card] = []
-        self.inkwell: List[Card] = [] # Cards used as ink
-        self.discard_pile: List[Card] = []
+        self.events: EventSink = events if events is not None else ConsoleSink()
+        self.rng: random.Random = rng if rng is not None else deck.rng
+        # Zones hold card ids; self.card() fetches the Card from the deck's catalog when needed
+        self.catalog = deck.catalog
+        self.hand: List[int] = []
+        self.inkwell: List[int] = [] # Cards used as ink
+        self.discard_pile: List[int] = []
         # Cards currently on the board (characters, items, locations)
         # Each entry is a PlayableCard dictionary
         self.play_area: List[PlayableCard] = []
         self.lore: int = 0
+        self.cards_played: List[int] = [] # Card ids in the order they were played (for game results)
         self._play_area_uuid_counter = 0 # Simple counter for unique IDs in play
 
         # Ink state
@@ -48,10 +74,153 @@ class Player:
         self.has_drawn_this_turn: bool = False
         self.has_inked_this_turn: bool = False
         self.lost_game: bool = False # Flag if player lost (e.g., deck empty)
+        self.opponent: Optional['Player'] = None # Set by GameState; effects that target "opponent" use it
+        # Triggered abilities of this player's cards in play (see CardEffects/trigger_index.py)
+        self.triggers: TriggerIndex = TriggerIndex(self)
+        # Effective stats of this player's cards in play (see CardEffects/derived_stats.py)
+        self.stats: DerivedStats = DerivedStats(self)
+
+        # Make/unmake support; GameState replaces this with a log shared by both players
+        self.undo_log: List[UndoRecord] = []
+        # Bumped whenever the hand / own play area changes (legality caches key on these)
+        self.hand_version: int = 0
+        self.board_version: int = 0
+        # Zobrist hash of the zones and play-area states, kept up to date by every change
+        # (see zobrist.py; counters are folded in by ZobristKeys.player_hash)
+        self.zobrist_keys = self.catalog.zobrist_keys if self.catalog is not None else None
+        self.zobrist: int = 0
 
         # --- Initial Setup ---
         self._initial_draw()
 
+    def card(self, card_id: int) -> Card:
+        """Returns the Card object for a card id."""
+        return self.catalog.cards[card_id]
+
+    def _reject(self, reason: str, card: Optional[Card] = None, **details) -> None:
+        """Emits an ActionRejected event (see events.REJECTION_MESSAGES for reason codes)."""
+        if self.events.enabled:
+            self.events.emit(ActionRejected(self.name, reason, card.name if card else None, details))
+
+    # --- Zone helpers (each records how to revert itself) ---
+
+    def _take_from_hand(self, card_id: int) -> int:
+        """Removes a card from hand and returns the index it was at."""
+        index = self.hand.index(card_id)
+        del self.hand[index]
+        return index
+
+    def undo(self) -> bool:
+        """
+        Reverts the most recent recorded change in this player's undo log (shared with the
+        opponent when the player belongs to a GameState).
+
+        Returns:
+            True if a change was undone, False if the log was empty.
+        """
+        if not self.undo_log:
+            return False
+        undo_function, *args = self.undo_log.pop()
+        undo_function(*args)
+        return True
+
+    def _undo_draw(self, card_id: int) -> None:
+        self.hand_version += 1
+        self.zobrist = (self.zobrist - self.zobrist_keys.hand[card_id]) & MASK64
+        self.hand.pop()
+        self.deck.add_card(card_id, to_bottom=False)
+
+    def _undo_decked_out(self) -> None:
+        self.lost_game = False
+
+    def _undo_ink(self, card_id: int, hand_index: int) -> None:
+        self.hand_version += 1
+        keys = self.zobrist_keys
+        self.zobrist = (self.zobrist - keys.inkwell[card_id] + keys.hand[card_id]) & MASK64
+        self.inkwell.pop()
+        self.hand.insert(hand_index, card_id)
+        self.total_ink = len(self.inkwell)
+        self.ready_ink -= 1
+        self.has_inked_this_turn = False
+
+    def _undo_play(self, card_id: int, hand_index: int, cost: int, stayed_in_play: bool) -> None:
+        self.hand_version += 1
+        self.board_version += 1
+        keys = self.zobrist_keys
+        if stayed_in_play:
+            playable_card = self.play_area.pop()
+            self.triggers.unsubscribe(playable_card)
+            self.stats.forget(playable_card)
+            self._statics_left(playable_card, self.catalog.effect_engine.plan(card_id), check_banish=False)
+            self.zobrist -= keys.play_key(playable_card)
+            self._play_area_uuid_counter -= 1
+        else:
+            self.zobrist -= keys.discard[self.discard_pile.pop()]
+        self.zobrist = (self.zobrist + keys.hand[card_id]) & MASK64
+        self.cards_played.pop()
+        self.hand.insert(hand_index, card_id)
+        self.ready_ink += cost
+        self.exerted_ink -= cost
+
+    def _undo_quest(self, playable_card: PlayableCard, lore_gained: int) -> None:
+        self.board_version += 1
+        play_key = self.zobrist_keys.play_key
+        self.zobrist -= play_key(playable_card)
+        playable_card['exerted'] = False
+        self.zobrist = (self.zobrist + play_key(playable_card)) & MASK64
+        self.lore -= lore_gained
+
+    def _undo_challenge(self, attacker_pc: PlayableCard, defender_pc: PlayableCard, opponent: 'Player',
+                        attacker_strength: int, defender_strength: int) -> None:
+        self.board_version += 1
+        play_key = self.zobrist_keys.play_key
+        self.zobrist -= play_key(attacker_pc)
+        opponent.zobrist -= play_key(defender_pc)
+        attacker_pc['exerted'] = False
+        defender_pc['damage'] -= attacker_strength
+        attacker_pc['damage'] -= defender_strength
+        self.zobrist = (self.zobrist + play_key(attacker_pc)) & MASK64
+        opponent.zobrist = (opponent.zobrist + play_key(defender_pc)) & MASK64
+
+    def _undo_banish(self, playable_card: PlayableCard, index: int) -> None:
+        self.board_version += 1
+        keys = self.zobrist_keys
+        self.zobrist = (self.zobrist - keys.discard[self.discard_pile.pop()] + keys.play_key(playable_card)) & MASK64
+        self.play_area.insert(index, playable_card)
+        plan = self.catalog.effect_engine.plan(playable_card['card_id'])
+        self.triggers.subscribe(playable_card, plan)
+        self._statics_entered(playable_card, plan)
+
+    def _undo_ready_phase(self, flags: List[Tuple[bool, bool]], ready_ink: int, exerted_ink: int,
+                          has_drawn: bool, has_inked: bool) -> None:
+        self.board_version += 1
+        play_key = self.zobrist_keys.play_key
+        for p_card, (exerted, dry) in zip(self.play_area, flags):
+            if p_card['exerted'] == exerted and p_card['dry'] == dry:
+                continue
+            self.zobrist -= play_key(p_card)
+            p_card['exerted'] = exerted
+            p_card['dry'] = dry
+            self.zobrist += play_key(p_card)
+        self.zobrist &= MASK64
+        self.ready_ink = ready_ink
+        self.exerted_ink = exerted_ink
+        self.has_drawn_this_turn = has_drawn
+        self.has_inked_this_turn = has_inked
+
+    def _undo_lore(self, amount: int) -> None:
+        self.lore -= amount
+
+    def _undo_damage(self, playable_card: PlayableCard, amount: int) -> None:
+        self.board_version += 1
+        play_key = self.zobrist_keys.play_key
+        self.zobrist -= play_key(playable_card)
+        playable_card['damage'] -= amount
+        self.zobrist = (self.zobrist + play_key(playable_card)) & MASK64
+
+    def _undo_draw_phase(self) -> None:
+        self.has_drawn_this_turn = False
+
     def _generate_play_uuid(self) -> int:
         """Generates a simple unique ID for a card entering the play area."""
         self._play_area_uuid_counter += 1
@@ -59,77 +228,92 @@ class Player:
 
     def _initial_draw(self, num_cards: int = 7):
         """Draws the initial hand."""
-        print(f"{self.name}: Drawing initial hand of {num_cards} cards.")
+        if self.events.enabled:
+            self.events.emit(InitialHandDrawn(self.name, num_cards))
         for _ in range(num_cards):
             self.draw_card()
         # Mulligan logic could be added here later
 
-    def draw_card(self) -> Optional[Card]:
+    def draw_card(self) -> Optional[int]:
         """
         Draws a card from the deck and adds it to the hand.
         Sets the lost_game flag if the deck is empty.
 
         Returns:
-            The Card drawn, or None if the deck was empty.
+            The id of the card drawn, or None if the deck was empty.
         """
         drawn_card = self.deck.draw()
-        if drawn_card:
+        if drawn_card is not None:
             self.hand.append(drawn_card)
+            self.undo_log.append((self._undo_draw, drawn_card))
+            self.hand_version += 1
+            self.zobrist = (self.zobrist + self.zobrist_keys.hand[drawn_card]) & MASK64
+            if self.events.enabled:
+                self.events.emit(CardDrawn(self.name, self.card(drawn_card).name))
             return drawn_card
         else:
-            if not self.lost_game: # Only print/set loss once
-                 print(f"{self.name}: Deck is empty! Cannot draw.")
+            if not self.lost_game: # Only report/set loss once
+                 if self.events.enabled:
+                     self.events.emit(DeckedOut(self.name))
                  self.lost_game = True
+                 self.undo_log.append((self._undo_decked_out,))
             return None
 
-    def ink_card(self, card_to_ink: Card) -> bool:
+    def ink_card(self, card_to_ink: int) -> bool:
         """
         Moves a card from the hand to the inkwell if possible.
 
         Args:
-            card_to_ink: The specific Card object instance from the hand to ink.
+            card_to_ink: The id of the card in hand to ink.
 
         Returns:
             True if the card was successfully inked, False otherwise.
         """
+        card = self.card(card_to_ink)
         if card_to_ink not in self.hand:
-            print(f"{self.name} Error: Card '{card_to_ink.name}' not found in hand.")
+            self._reject("not_in_hand", card)
             return False
-        if not card_to_ink.inkable:
-            print(f"{self.name} Error: Card '{card_to_ink.name}' is not inkable.")
+        if not card.inkable:
+            self._reject("not_inkable", card)
             return False
         if self.has_inked_this_turn:
-             print(f"{self.name} Error: Already inked a card this turn.")
+             self._reject("already_inked", card)
              return False
 
         # Move card
-        self.hand.remove(card_to_ink)
+        hand_index = self._take_from_hand(card_to_ink)
         self.inkwell.append(card_to_ink)
+        self.undo_log.append((self._undo_ink, card_to_ink, hand_index))
+        self.hand_version += 1
+        keys = self.zobrist_keys
+        self.zobrist = (self.zobrist - keys.hand[card_to_ink] + keys.inkwell[card_to_ink]) & MASK64
         self.total_ink = len(self.inkwell) # Update total ink count
+        self.ready_ink += 1 # Ink enters the inkwell ready and can be spent this turn
         self.has_inked_this_turn = True # Mark that ink action was taken
-        print(f"{self.name}: Inked '{card_to_ink.name}'. Total ink: {self.total_ink}")
+        if self.events.enabled:
+            self.events.emit(CardInked(self.name, card.name, self.total_ink))
         return True
 
-    def play_card(self, card_to_play: Card) -> Optional[PlayableCard]:
+    def play_card(self, card_to_play: int) -> Optional[PlayableCard]:
         """
         Plays a card from the hand to the play area if enough ink is available.
         Handles immediate discard for Actions/Songs.
 
         Args:
-            card_to_play: The specific Card object instance from the hand to play.
+            card_to_play: The id of the card in hand to play.
 
         Returns:
             The PlayableCard dictionary representing the card in play if it stays,
             or None if it was an Action/Song or playing failed.
         """
+        card = self.card(card_to_play)
         if card_to_play not in self.hand:
-            print(f"{self.name} Error: Card '{card_to_play.name}' not found in hand.")
+            self._reject("not_in_hand", card)
             return None
 
-        cost = card_to_play.cost
+        cost = card.cost
         if cost > self.ready_ink:
-            print(f"{self.name} Error: Cannot play '{card_to_play.name}'. "
-                  f"Cost {cost}, Ready Ink {self.ready_ink}.")
+            self._reject("insufficient_ink", card, cost=cost, ready_ink=self.ready_ink)
             return None
 
         # Pay the cost
@@ -137,32 +321,162 @@ class Player:
         self.exerted_ink += cost
 
         # Move card from hand
-        self.hand.remove(card_to_play)
+        hand_index = self._take_from_hand(card_to_play)
+        self.cards_played.append(card_to_play)
 
-        print(f"{self.name}: Played '{card_to_play.name}' for {cost} ink. "
-              f"({self.ready_ink} ink remaining).")
+        if self.events.enabled:
+            self.events.emit(CardPlayed(self.name, card.name, cost, self.ready_ink))
 
         # Handle Actions/Songs - assume they resolve and discard immediately
         # More complex effects need engine support
-        if card_to_play.type == "Action" or "Song" in card_to_play.type: # Simple check
-             print(f"{self.name}: Action/Song '{card_to_play.name}' resolved (effect TBD) and discarded.")
+        if card.type == "Action" or "Song" in card.type: # Simple check
              self.discard_pile.append(card_to_play)
-             # TODO: Trigger any "On Play" effects here later
+             self.undo_log.append((self._undo_play, card_to_play, hand_index, cost, False))
+             self.hand_version += 1
+             keys = self.zobrist_keys
+             self.zobrist = (self.zobrist - keys.hand[card_to_play] + keys.discard[card_to_play]) & MASK64
+             resolved = self._resolve_on_play(card_to_play, None)
+             if self.events.enabled:
+                 self.events.emit(ActionResolved(self.name, card.name, resolved))
+             self._fire_card_played(card)
              return None # Doesn't stay in play
 
         # For Characters, Items, Locations - Add to play area
         playable_card_state: PlayableCard = {
-            'card': card_to_play,
+            'card_id': card_to_play,
             'exerted': False, # Characters enter ready unless Rush
             'damage': 0,
+            'dry': card.type != "Character", # Characters are drying the turn they are played
             'uuid': self._generate_play_uuid() # Assign a unique ID for this instance
-            # Add other state flags later (e.g., 'can_challenge_this_turn': False for summoning sickness)
         }
-        # TODO: Handle summoning sickness - characters usually can't challenge/quest the turn they are played unless they have Rush
         self.play_area.append(playable_card_state)
-        # TODO: Trigger any "On Play" effects here later
+        self.undo_log.append((self._undo_play, card_to_play, hand_index, cost, True))
+        self.hand_version += 1
+        self.board_version += 1
+        keys = self.zobrist_keys
+        self.zobrist = (self.zobrist - keys.hand[card_to_play] + keys.play_key(playable_card_state)) & MASK64
+        plan = self.catalog.effect_engine.plan(card_to_play)
+        self.triggers.subscribe(playable_card_state, plan)
+        self._statics_entered(playable_card_state, plan)
+        self._resolve_on_play(card_to_play, playable_card_state)
+        self._fire_card_played(card)
         return playable_card_state
 
+    def _resolve_on_play(self, card_id: int, playable_card: Optional[PlayableCard]) -> int:
+        """
+        Resolves a just-played card's compiled "on play" abilities (see CardEffects.effect_engine).
+
+        Returns:
+            The number of abilities resolved.
+        """
+        on_play = self.catalog.effect_engine.plan(card_id).on_play
+        if on_play:
+            context = EffectContext(self, self.opponent, playable_card, card_id)
+            for ability in on_play:
+                ability.resolve(context)
+        return len(on_play)
+
+    def _statics_entered(self, playable_card: PlayableCard, plan: CardPlan) -> None:
+        """Starts applying a card's static modifiers to both players' derived stats."""
+        if plan.statics:
+            self.stats.add_source(playable_card, plan.statics, from_opponent=False)
+            if self.opponent is not None:
+                self.opponent.stats.add_source(playable_card, plan.statics, from_opponent=True)
+
+    def _statics_left(self, playable_card: PlayableCard, plan: CardPlan, check_banish: bool = True) -> None:
+        """Stops applying a card's static modifiers; characters whose willpower dropped to their damage are banished."""
+        if not plan.statics:
+            return
+        affected = [self] if self.stats.remove_source(playable_card, from_opponent=False) else []
+        if self.opponent is not None and self.opponent.stats.remove_source(playable_card, from_opponent=True):
+            affected.append(self.opponent)
+        if check_banish:
+            for player in affected:
+                player._banish_lethal()
+
+    def _banish_lethal(self) -> None:
+        """Banishes characters with damage at or above their (effective) willpower."""
+        for playable_card in [p for p in self.play_area
+                              if p['damage'] and p['damage'] >= self.stats.willpower(p)
+                              and self.card(p['card_id']).willpower is not None]:
+            self.banish(playable_card)
+
+    def _fire_card_played(self, card: Card) -> None:
+        """Fires the triggers that listen for this player playing a card."""
+        opponent = self.opponent
+        if card.type == "Character":
+            self.triggers.fire(TriggerCondition.ON_CHARACTER_ENTERS_PLAY, OWN)
+            if opponent is not None:
+                opponent.triggers.fire(TriggerCondition.ON_CHARACTER_ENTERS_PLAY, OPPONENT)
+        if opponent is not None:
+            opponent.triggers.fire(TriggerCondition.ON_OPPONENT_PLAYS_CARD, OPPONENT)
+            if "Song" in card.type:
+                opponent.triggers.fire(TriggerCondition.ON_OPPONENT_PLAYS_SONG, OPPONENT)
+
+    # --- Effect primitives (used by compiled abilities; each records how to revert itself) ---
+
+    def gain_lore(self, amount: int) -> None:
+        """Gains lore from an effect."""
+        if amount <= 0:
+            return
+        self.lore += amount
+        self.undo_log.append((self._undo_lore, amount))
+        if self.events.enabled:
+            self.events.emit(LoreChanged(self.name, amount, self.lore))
+
+    def lose_lore(self, amount: int) -> None:
+        """Loses lore from an effect (never below 0)."""
+        lost = min(amount, self.lore)
+        if lost <= 0:
+            return
+        self.lore -= lost
+        self.undo_log.append((self._undo_lore, -lost))
+        if self.events.enabled:
+            self.events.emit(LoreChanged(self.name, -lost, self.lore))
+
+    def deal_damage(self, playable_card: PlayableCard, amount: int) -> None:
+        """
+        Puts damage on one of this player's cards in play, banishing it if that reaches its willpower.
+
+        Args:
+            playable_card: The damaged card (from self.play_area).
+            amount: Damage to deal.
+        """
+        if amount <= 0 or playable_card not in self.play_area:
+            return
+        play_key = self.zobrist_keys.play_key
+        self.zobrist -= play_key(playable_card)
+        playable_card['damage'] += amount
+        self.zobrist = (self.zobrist + play_key(playable_card)) & MASK64
+        self.undo_log.append((self._undo_damage, playable_card, amount))
+        self.board_version += 1
+        card = self.card(playable_card['card_id'])
+        if self.events.enabled:
+            self.events.emit(DamageChanged(self.name, card.name, amount, playable_card['damage']))
+        if card.willpower is not None and playable_card['damage'] >= self.stats.willpower(playable_card):
+            self.banish(playable_card)
+
+    def remove_damage(self, playable_card: PlayableCard, amount: int) -> int:
+        """
+        Removes up to amount damage from one of this player's cards in play.
+
+        Returns:
+            The damage actually removed.
+        """
+        removed = min(amount, playable_card['damage'])
+        if removed <= 0 or playable_card not in self.play_area:
+            return 0
+        play_key = self.zobrist_keys.play_key
+        self.zobrist -= play_key(playable_card)
+        playable_card['damage'] -= removed
+        self.zobrist = (self.zobrist + play_key(playable_card)) & MASK64
+        self.undo_log.append((self._undo_damage, playable_card, -removed))
+        self.board_version += 1
+        if self.events.enabled:
+            self.events.emit(DamageChanged(self.name, self.card(playable_card['card_id']).name, -removed,
+                                           playable_card['damage']))
+        return removed
+
 
     def quest(self, playable_card: PlayableCard) -> bool:
         """
@@ -174,31 +488,39 @@ class Player:
         Returns:
             True if questing was successful, False otherwise.
         """
+        card = self.card(playable_card['card_id'])
         if playable_card not in self.play_area:
-             print(f"{self.name} Error: Card '{playable_card['card'].name}' (UUID: {playable_card.get('uuid', 'N/A')}) not found in play area.")
+             self._reject("not_in_play", card)
              return False
 
-        card = playable_card['card']
         if card.type != "Character":
-             print(f"{self.name} Error: Cannot quest with non-character '{card.name}'.")
+             self._reject("not_a_character", card)
              return False
         if playable_card['exerted']:
-             print(f"{self.name} Error: Cannot quest with exerted character '{card.name}'.")
+             self._reject("exerted", card)
+             return False
+        if not playable_card['dry']:
+             self._reject("drying", card)
              return False
-        # TODO: Add check for summoning sickness if not implemented elsewhere
 
-        if card.lore is None or card.lore <= 0:
-             # Some cards might gain lore ability later, but base check is useful
-             print(f"{self.name}: Character '{card.name}' has no base lore value to quest for.")
-             return False # Or potentially allow questing for 0 if effects can grant lore? TBD
+        lore_gained = self.stats.lore(playable_card) # Printed lore plus static / "this turn" modifiers
+        if lore_gained <= 0:
+             self._reject("no_lore", card)
+             return False
 
         # Exert the character
+        play_key = self.zobrist_keys.play_key
+        self.zobrist -= play_key(playable_card)
         playable_card['exerted'] = True
+        self.zobrist = (self.zobrist + play_key(playable_card)) & MASK64
         # Gain lore
-        lore_gained = card.lore
         self.lore += lore_gained
-        print(f"{self.name}: Quested with '{card.name}' for {lore_gained} lore. "
-              f"Total lore: {self.lore}.")
+        self.undo_log.append((self._undo_quest, playable_card, lore_gained))
+        self.board_version += 1
+        if self.events.enabled:
+            self.events.emit(Quested(self.name, card.name, lore_gained, self.lore))
+        self.triggers.fire(TriggerCondition.ON_EXERT, SELF, playable_card)
+        self.triggers.fire(TriggerCondition.ON_QUEST, SELF, playable_card)
         return True
 
     def challenge(self, attacker_pc: PlayableCard, defender_pc: PlayableCard, opponent: 'Player') -> bool:
@@ -214,60 +536,76 @@ class Player:
             True if the challenge sequence was initiated, False otherwise (e.g., invalid target).
         """
         # --- Validation ---
+        attacker_card = self.card(attacker_pc['card_id'])
+        defender_card = opponent.card(defender_pc['card_id'])
+
         if attacker_pc not in self.play_area:
-            print(f"{self.name} Error: Attacker '{attacker_pc['card'].name}' not in play area.")
+            self._reject("not_in_play", attacker_card)
             return False
         if defender_pc not in opponent.play_area:
-             print(f"{self.name} Error: Defender '{defender_pc['card'].name}' not in opponent's play area.")
+             self._reject("defender_not_in_play", defender_card)
              return False
 
-        attacker_card = attacker_pc['card']
-        defender_card = defender_pc['card']
-
         if attacker_card.type != "Character":
-            print(f"{self.name} Error: Attacker '{attacker_card.name}' is not a character.")
+            self._reject("not_a_character", attacker_card)
             return False
         if defender_card.type != "Character":
-            print(f"{self.name} Error: Defender '{defender_card.name}' is not a character.")
+            self._reject("not_a_character", defender_card)
             return False
         if attacker_pc['exerted']:
-            print(f"{self.name} Error: Attacker '{attacker_card.name}' is already exerted.")
+            self._reject("exerted", attacker_card)
+            return False
+        if not defender_pc['exerted']:
+            # Only exerted characters can be challenged
+            self._reject("defender_ready", defender_card)
+            return False
+        if not attacker_pc['dry'] and not self.stats.keywords(attacker_pc) & _RUSH:
+            self._reject("drying", attacker_card)
             return False
-        # TODO: Add check for summoning sickness for the attacker
         # TODO: Add checks for keywords like Evasive, Ward, Bodyguard
 
-        print(f"{self.name}: '{attacker_card.name}' challenges '{defender_card.name}'!")
+        if self.events.enabled:
+            self.events.emit(ChallengeDeclared(self.name, attacker_card.name, defender_card.name))
 
         # --- Exert Attacker ---
+        play_key = self.zobrist_keys.play_key
+        self.zobrist -= play_key(attacker_pc)
+        opponent.zobrist -= play_key(defender_pc)
         attacker_pc['exerted'] = True
 
         # --- Damage Calculation ---
-        # Use strength, default to 0 if None (shouldn't happen for chars, but safety)
-        attacker_strength = attacker_card.strength or 0
-        defender_strength = defender_card.strength or 0
+        # Effective strength (printed plus modifiers, 0 if missing)
+        attacker_strength = self.stats.strength(attacker_pc)
+        defender_strength = opponent.stats.strength(defender_pc)
         # TODO: Factor in Challenger keyword bonus here
 
-        print(f"  > '{attacker_card.name}' ({attacker_strength} Str) deals {attacker_strength} damage.")
-        print(f"  > '{defender_card.name}' ({defender_strength} Str) deals {defender_strength} damage.")
-
         # --- Apply Damage ---
         # Note: Damage is applied simultaneously
         defender_pc['damage'] += attacker_strength
         attacker_pc['damage'] += defender_strength
+        self.zobrist = (self.zobrist + play_key(attacker_pc)) & MASK64
+        opponent.zobrist = (opponent.zobrist + play_key(defender_pc)) & MASK64
+        self.undo_log.append((self._undo_challenge, attacker_pc, defender_pc, opponent,
+                              attacker_strength, defender_strength))
+        self.board_version += 1
 
-        print(f"  > '{defender_card.name}' now has {defender_pc['damage']} damage (Willpower: {defender_card.willpower or 0}).")
-        print(f"  > '{attacker_card.name}' now has {attacker_pc['damage']} damage (Willpower: {attacker_card.willpower or 0}).")
+        if self.events.enabled:
+            self.events.emit(ChallengeDamage(
+                    attacker_card.name, attacker_strength, attacker_pc['damage'], self.stats.willpower(attacker_pc),
+                    defender_card.name, defender_strength, defender_pc['damage'], opponent.stats.willpower(defender_pc)))
+
+        self.triggers.fire(TriggerCondition.ON_EXERT, SELF, attacker_pc)
+        self.triggers.fire(TriggerCondition.ON_CHALLENGE, SELF, attacker_pc)
+        opponent.triggers.fire(TriggerCondition.ON_BEING_CHALLENGED, SELF, defender_pc)
 
         # --- Check for Banishment ---
-        # Check defender first
-        if defender_pc['damage'] >= (defender_card.willpower or 0):
-            print(f"  > '{defender_card.name}' is banished!")
+        # Check defender first (trigger effects may have banished either card already)
+        if defender_pc in opponent.play_area and defender_pc['damage'] >= opponent.stats.willpower(defender_pc):
             opponent.banish(defender_pc) # Opponent handles their banishment
 
         # Check attacker (only if not already banished by the defender check, though simultaneous)
         # Need to refetch from play_area in case it was banished
-        if attacker_pc in self.play_area and attacker_pc['damage'] >= (attacker_card.willpower or 0):
-            print(f"  > '{attacker_card.name}' is banished!")
+        if attacker_pc in self.play_area and attacker_pc['damage'] >= self.stats.willpower(attacker_pc):
             self.banish(attacker_pc) # Self handles own banishment
 
         return True
@@ -281,32 +619,63 @@ class Player:
             playable_card: The dictionary representing the card to be banished.
         """
         if playable_card in self.play_area:
-             self.play_area.remove(playable_card)
-             self.discard_pile.append(playable_card['card'])
-             print(f"{self.name}: '{playable_card['card'].name}' moved from play to discard.")
-             # TODO: Trigger any "On Banish" effects here later
+             index = self.play_area.index(playable_card)
+             del self.play_area[index]
+             self.discard_pile.append(playable_card['card_id'])
+             keys = self.zobrist_keys
+             self.zobrist = (self.zobrist - keys.play_key(playable_card)
+                             + keys.discard[playable_card['card_id']]) & MASK64
+             self.undo_log.append((self._undo_banish, playable_card, index))
+             self.board_version += 1
+             if self.events.enabled:
+                 self.events.emit(CardBanished(self.name, self.card(playable_card['card_id']).name))
+             # "When this is banished" resolves from the discard pile; then the card stops listening
+             self.triggers.fire(TriggerCondition.ON_BANISH, SELF, playable_card)
+             self.triggers.unsubscribe(playable_card)
+             self.stats.forget(playable_card)
+             self._statics_left(playable_card, self.catalog.effect_engine.plan(playable_card['card_id']))
+             if self.card(playable_card['card_id']).type == "Character":
+                 self.triggers.fire(TriggerCondition.ON_CHARACTER_LEAVES_PLAY, OWN)
+                 if self.opponent is not None:
+                     self.opponent.triggers.fire(TriggerCondition.ON_CHARACTER_LEAVES_PLAY, OPPONENT)
         else:
              # This might happen if multiple effects try to banish the same card
-             print(f"{self.name} Info: Tried to banish '{playable_card['card'].name}', but it was already removed.")
+             self._reject("already_removed", self.card(playable_card['card_id']))
 
 
     # --- Turn Phase Methods ---
 
     def turn_start_ready_phase(self):
         """Performs start-of-turn readying actions."""
-        print(f"\n--- {self.name}'s Turn Start (Ready Phase) ---")
+        if self.events.enabled:
+            self.events.emit(PhaseStarted(self.name, "Ready"))
+        self.undo_log.append((self._undo_ready_phase, [(p['exerted'], p['dry']) for p in self.play_area],
+                              self.ready_ink, self.exerted_ink, self.has_drawn_this_turn, self.has_inked_this_turn))
+        self.board_version += 1
         # 1. Ready all cards in play
-        readied_count = 0
+        readied: List[PlayableCard] = []
+        play_key = self.zobrist_keys.play_key
         for p_card in self.play_area:
+            if p_card['dry'] and not p_card['exerted']:
+                continue # Already ready and dry, nothing changes (or needs rehashing)
+            self.zobrist -= play_key(p_card)
+            p_card['dry'] = True # Anything played last turn is now dry
             if p_card['exerted']:
                  p_card['exerted'] = False
-                 readied_count += 1
-        if readied_count > 0: print(f"{self.name}: Readied {readied_count} card(s) in play.")
+                 readied.append(p_card)
+            self.zobrist += play_key(p_card)
+        self.zobrist &= MASK64
+        if readied and self.events.enabled:
+            self.events.emit(CardsReadied(self.name, len(readied)))
+        if self.triggers.listens(TriggerCondition.ON_READY, SELF):
+            for p_card in readied:
+                self.triggers.fire(TriggerCondition.ON_READY, SELF, p_card)
 
         # 2. Ready ink
         self.ready_ink = self.total_ink
         self.exerted_ink = 0
-        print(f"{self.name}: Readied {self.ready_ink} ink.")
+        if self.events.enabled:
+            self.events.emit(InkReadied(self.name, self.ready_ink))
 
         # 3. Reset turn flags
         self.has_drawn_this_turn = False
@@ -317,39 +686,47 @@ class Player:
         Performs start-of-turn 'Set' phase actions (Check win, effects).
         Called by GameState *before* Ready phase usually.
         """
-        # Currently empty, win check is in GameState.next_turn
-        # TODO: Add any "start of turn" effects triggering here later
-        pass
+        # Win check is in GameState.next_turn
+        self.triggers.fire(TriggerCondition.START_OF_TURN, OWN)
+
+    def turn_end_phase(self):
+        """Performs end-of-turn actions ("at the end of your turn" effects). Called by GameState.next_turn."""
+        self.triggers.fire(TriggerCondition.END_OF_TURN, OWN)
+        # "This turn" modifiers end (on either player's characters); lost willpower boosts can banish
+        for player in (self, self.opponent):
+            if player is not None and player.stats.expire_temporary():
+                player._banish_lethal()
 
 
     def turn_start_draw_phase(self):
         """Performs the start-of-turn draw."""
-        print(f"--- {self.name}'s Turn Start (Draw Phase) ---")
+        if self.events.enabled:
+            self.events.emit(PhaseStarted(self.name, "Draw"))
         if not self.has_drawn_this_turn:
-            # print(f"{self.name}: Drawing card for turn...") # Less verbose
             self.draw_card()
             self.has_drawn_this_turn = True
-        # else: # No need to print if already drawn
-            # print(f"{self.name}: Already drew this turn.")
+            self.undo_log.append((self._undo_draw_phase,))
 
 
     def display_state(self):
         """Prints a summary of the player's current state."""
         print(f"\n--- {self.name}'s State ---")
         print(f"Lore: {self.lore}")
-        print(f"Hand ({len(self.hand)} cards): {[card.name for card in self.hand]}")
+        print(f"Hand ({len(self.hand)} cards): {[self.card(card_id).name for card_id in self.hand]}")
         print(f"Inkwell ({self.total_ink} total): Ready={self.ready_ink}, Exerted={self.exerted_ink}")
         # print(f"  Ink Cards: {[card.name for card in self.inkwell]}") # Optional detail
         print(f"Play Area ({len(self.play_area)} cards):")
         for p_card in self.play_area:
             state = "Ready" if not p_card['exerted'] else "Exerted"
             damage = f" ({p_card['damage']} dmg)" if p_card['damage'] > 0 else ""
+            card = self.card(p_card['card_id'])
             stats = ""
-            if p_card['card'].type == 'Character':
-                 stats = f" [{p_card['card'].strength or '?'}/{p_card['card'].willpower or '?'}|{p_card['card'].lore or '?'}]"
-            print(f"  - {p_card['card'].name}{stats} [{state}]{damage} (UUID: {p_card.get('uuid', 'N/A')})")
+            if card.type == 'Character':
+                 strength, willpower, lore, _ = self.stats.effective(p_card)
+                 stats = f" [{strength}/{willpower}|{lore}]"
+            print(f"  - {card.name}{stats} [{state}]{damage} (UUID: {p_card.get('uuid', 'N/A')})")
         print(f"Deck: {len(self.deck)} cards remaining")
-        print(f"Discard ({len(self.discard_pile)} cards): {[card.name for card in self.discard_pile]}")
+        print(f"Discard ({len(self.discard_pile)} cards): {[self.card(card_id).name for card_id in self.discard_pile]}")
         if self.lost_game: print("!! Player has lost the game (decked out) !!")
         print("--------------------")
 
@@ -358,8 +735,8 @@ class Player:
 if __name__ == "__main__":
     # We need Cards and a Deck to test the Player
     try:
-        from dataFetcher import fetch_lorcana_data
-        from card import parse_card_data # Use the 3-map version
+        from catalog import load_card_maps
+        from card import parse_card_data
         from deck import Deck, load_deck_identifiers_from_file
     except ImportError:
         print("Could not import required modules for Player example. Exiting.")
@@ -367,34 +744,27 @@ if __name__ == "__main__":
 
     # 1. Load Card Data
     print("Loading card data...")
-    raw_card_data = fetch_lorcana_data()
-    if not raw_card_data: exit("Failed to load card data.")
-    all_cards_by_id, all_cards_by_name, all_cards_by_lowercase_name = parse_card_data(raw_card_data)
+    all_cards_by_id, all_cards_by_name, all_cards_by_lowercase_name = load_card_maps()
     if not all_cards_by_name: exit("Card name map is empty.")
     combined_name_map = {**all_cards_by_name, **all_cards_by_lowercase_name}
 
 
     # 2. Load a Deck (using dummy data for simplicity here)
-    # Create some dummy cards for testing challenge
+    # Create some dummy cards for testing challenge (parsed so they get card ids)
     dummy_card_data = [
-        Card({'Name': 'Basic Attacker', 'Cost': 1, 'Inkable': True, 'Type': 'Character', 'Strength': 2, 'Willpower': 2, 'Lore': 1}),
-        Card({'Name': 'Basic Defender', 'Cost': 1, 'Inkable': True, 'Type': 'Character', 'Strength': 1, 'Willpower': 3, 'Lore': 1}),
-        Card({'Name': 'Big Guy', 'Cost': 3, 'Inkable': True, 'Type': 'Character', 'Strength': 4, 'Willpower': 4, 'Lore': 2}),
-        Card({'Name': 'Ink Fodder', 'Cost': 1, 'Inkable': True, 'Type': 'Action'}), # Action to test play
+        {'Name': 'Basic Attacker', 'Cost': 1, 'Inkable': True, 'Type': 'Character', 'Strength': 2, 'Willpower': 2, 'Lore': 1},
+        {'Name': 'Basic Defender', 'Cost': 1, 'Inkable': True, 'Type': 'Character', 'Strength': 1, 'Willpower': 3, 'Lore': 1},
+        {'Name': 'Big Guy', 'Cost': 3, 'Inkable': True, 'Type': 'Character', 'Strength': 4, 'Willpower': 4, 'Lore': 2},
+        {'Name': 'Ink Fodder', 'Cost': 1, 'Inkable': True, 'Type': 'Action'}, # Action to test play
     ]
+    _, dummy_cards_by_name, _ = parse_card_data(dummy_card_data)
     # Create a simple deck list from these dummies
-    test_deck_cards = []
-    for c in dummy_card_data:
-        test_deck_cards.extend([c] * 4) # 4 copies of each
-    random.shuffle(test_deck_cards)
-    # Create a dummy Deck object directly (bypassing file load for this example)
-    class SimpleDeck:
-        def __init__(self, cards): self.cards = list(cards)
-        def draw(self): return self.cards.pop(0) if self.cards else None
-        def __len__(self): return len(self.cards)
-
-    player1_deck = SimpleDeck(test_deck_cards[:]) # Give copies
-    player2_deck = SimpleDeck(test_deck_cards[:])
+    test_deck_names = []
+    for name in dummy_cards_by_name:
+        test_deck_names.extend([name] * 4) # 4 copies of each
+    # Create the Deck objects directly (bypassing file load for this example)
+    player1_deck = Deck(test_deck_names, dummy_cards_by_name)
+    player2_deck = Deck(test_deck_names, dummy_cards_by_name)
 
     # 3. Create Player instances
     player1 = Player(name="Player 1", deck=player1_deck, player_id=0)
@@ -406,18 +776,18 @@ if __name__ == "__main__":
     player2.ready_ink = 5
 
     # Player 1 plays an attacker
-    attacker_card_obj = next((c for c in dummy_card_data if c.name == 'Basic Attacker'), None)
+    attacker_card_obj = dummy_cards_by_name.get('Basic Attacker')
     if attacker_card_obj:
-        player1.hand.append(attacker_card_obj) # Add to hand first
-        attacker_pc = player1.play_card(attacker_card_obj)
-        if attacker_pc: print(f"Player 1 has '{attacker_pc['card'].name}' in play.")
+        player1.hand.append(attacker_card_obj.card_id) # Add to hand first
+        attacker_pc = player1.play_card(attacker_card_obj.card_id)
+        if attacker_pc: print(f"Player 1 has '{player1.card(attacker_pc['card_id']).name}' in play.")
 
     # Player 2 plays a defender
-    defender_card_obj = next((c for c in dummy_card_data if c.name == 'Basic Defender'), None)
+    defender_card_obj = dummy_cards_by_name.get('Basic Defender')
     if defender_card_obj:
-        player2.hand.append(defender_card_obj)
-        defender_pc = player2.play_card(defender_card_obj)
-        if defender_pc: print(f"Player 2 has '{defender_pc['card'].name}' in play.")
+        player2.hand.append(defender_card_obj.card_id)
+        defender_pc = player2.play_card(defender_card_obj.card_id)
+        if defender_pc: print(f"Player 2 has '{player2.card(defender_pc['card_id']).name}' in play.")
 
     player1.display_state()
     player2.display_state()
@@ -425,8 +795,10 @@ if __name__ == "__main__":
     # 4. Simulate a challenge
     print("\n--- Simulating Challenge ---")
     if attacker_pc and defender_pc:
-        # Assume it's Player 1's turn and they choose to challenge
-        # TODO: Add summoning sickness check - for now assume attacker can challenge
+        # Player 1's next turn: the attacker's ink has dried, so it may challenge,
+        # and the defender is exerted (as if it had quested on Player 2's turn)
+        player1.turn_start_ready_phase()
+        defender_pc['exerted'] = True
         player1.challenge(attacker_pc, defender_pc, player2)
     else:
         print("Could not set up challenge scenario properly.")
@@ -0,0 +1,35 @@
+# rng.py
+
+import random
+
+import numpy as np
+
+'''
+Per-game random number streams.
+
+Every game owns a random.Random derived from (root_seed, game_index) with NumPy's
+SeedSequence spawn keys, which gives statistically independent streams and lets any single
+game of a batch be recreated directly from its index:
+
+    rng = game_rng(root_seed=42, game_index=123456)
+    deck = Deck(names, resolver, rng=rng)   # Player and GameState pick the stream up from the deck
+'''
+
+
+def game_seed(root_seed: int, game_index: int) -> int:
+    """Returns the 128-bit seed of game game_index in the batch rooted at root_seed."""
+    words = np.random.SeedSequence(root_seed, spawn_key=(game_index,)).generate_state(4, dtype=np.uint32)
+    return int.from_bytes(words.tobytes(), 'little')
+
+
+def game_rng(root_seed: int, game_index: int) -> random.Random:
+    """Returns a fresh random.Random for one game (same arguments, same stream)."""
+    return random.Random(game_seed(root_seed, game_index))
+
+
+# --- Example Usage ---
+if __name__ == "__main__":
+    first = [game_rng(42, index).random() for index in range(3)]
+    again = [game_rng(42, index).random() for index in range(3)]
+    print(f"Games 0-2 of root 42: {first}")
+    print(f"Reproducible: {first == again}")
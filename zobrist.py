@@ -0,0 +1,280 @@
+# zobrist.py
+
+from typing import TYPE_CHECKING, List, Optional, Tuple
+
+import numpy as np
+
+if TYPE_CHECKING:  # card_table.py builds the keys lazily, so only import for type checking
+    from card_table import CardTable
+    from game_state import GameState
+    from player import Player
+
+'''
+Zobrist hashing of game positions and a bounded transposition table.
+
+Every (zone, card) and (card in play, exerted/dry/damage state) has a random 64-bit key and a
+position's hash is the sum of the keys of everything in it (mod 2**64). Summing instead of
+XOR-ing keeps duplicate copies apart (two identical cards in hand do not cancel out), and the
+hash is order independent, so inking then questing reaches the same hash as questing then
+inking.
+
+Player keeps the zone part of its hash up to date on every action and undo (Player.zobrist);
+the small counters (lore, ready ink, turn flags) are folded in when the hash is read:
+
+    key = game_hash(game)
+    entry = table.probe(key)
+    if entry is None:
+        table.store(key, evaluate(game), depth)
+'''
+
+MASK64 = (1 << 64) - 1
+ZOBRIST_SEED = 0x10DC0A7A
+MAX_DAMAGE = 31  # Damage above this hashes like MAX_DAMAGE (characters are banished well before)
+MAX_COUNTER = 256  # Lore / ink / turn values above this wrap around
+
+
+def mix64(value: int) -> int:
+    """SplitMix64 finalizer: a fast, well-spread bijection on 64-bit ints."""
+    value = (value + 0x9E3779B97F4A7C15) & MASK64
+    value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & MASK64
+    value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & MASK64
+    return value ^ (value >> 31)
+
+
+class ZobristKeys:
+    """Random keys for every hashed feature of a catalog's cards (see CardTable.zobrist_keys)."""
+
+    def __init__(self, table: 'CardTable', seed: int = ZOBRIST_SEED):
+        """
+        Args:
+            table: The catalog whose card ids are hashed.
+            seed: Seed of the key generator (same seed and catalog, same keys).
+        """
+        rng = np.random.default_rng(seed)
+        size = len(table)
+
+        def keys(count: int) -> List[int]:
+            return rng.integers(0, MASK64, size=count, dtype=np.uint64, endpoint=True).tolist()
+
+        self.hand = keys(size)
+        self.inkwell = keys(size)
+        self.discard = keys(size)
+        self.play = keys(size)
+        # Indexed by play_state(); XOR-ed with the card's play key
+        self.play_state = keys(4 * (MAX_DAMAGE + 1))
+        self.lore = keys(MAX_COUNTER)
+        self.ready_ink = keys(MAX_COUNTER)
+        self.turn = keys(MAX_COUNTER)
+        self.has_inked = keys(2)
+        self.has_drawn = keys(2)
+        self.lost_game = keys(2)
+        self.active = keys(2)
+        self.game_over = keys(2)
+
+    def play_key(self, playable_card: dict) -> int:
+        """Key of a card in play in its current exerted / dry / damage state."""
+        damage = playable_card['damage']
+        state = (playable_card['exerted'] | playable_card['dry'] << 1
+                 | (damage if damage < MAX_DAMAGE else MAX_DAMAGE) << 2)
+        return self.play[playable_card['card_id']] ^ self.play_state[state]
+
+    def zone_hash(self, player: 'Player') -> int:
+        """Zone part of a player's hash computed from scratch (what Player.zobrist tracks)."""
+        total = sum(self.hand[card_id] for card_id in player.hand)
+        total += sum(self.inkwell[card_id] for card_id in player.inkwell)
+        total += sum(self.discard[card_id] for card_id in player.discard_pile)
+        total += sum(self.play_key(playable) for playable in player.play_area)
+        return total & MASK64
+
+    def player_hash(self, player: 'Player') -> int:
+        """Full hash of one player: tracked zones plus counters and turn flags."""
+        return (player.zobrist + self.lore[player.lore % MAX_COUNTER]
+                + self.ready_ink[player.ready_ink % MAX_COUNTER]
+                + self.has_inked[player.has_inked_this_turn] + self.has_drawn[player.has_drawn_this_turn]
+                + self.lost_game[player.lost_game]) & MASK64
+
+
+def game_hash(game: 'GameState') -> int:
+    """
+    64-bit hash of a game position (zones, play states, ink, lore, turn and active player).
+    O(1): both players' zone hashes are maintained incrementally.
+    """
+    first, second = game.players
+    keys = first.catalog.zobrist_keys
+    # Mixing the second player's hash keeps mirrored positions (A vs B, B vs A) apart
+    return (keys.player_hash(first) + mix64(keys.player_hash(second)) + keys.turn[game.turn % MAX_COUNTER]
+            + keys.active[game.active_player_index] + keys.game_over[game.game_over]) & MASK64
+
+
+class TranspositionTable:
+    """
+    Fixed-size table of position evaluations keyed by Zobrist hash.
+
+    Each hash maps to one slot (hash mod capacity). A new entry replaces the slot's entry when
+    the slot is empty, holds the same position, was written in an older generation (an earlier
+    search), or was searched no deeper than the new entry. Otherwise the new entry is dropped.
+    """
+
+    def __init__(self, capacity: int = 1 << 16):
+        """
+        Args:
+            capacity: Number of slots (entries kept at most).
+        """
+        if capacity <= 0:
+            raise ValueError("Transposition table capacity must be positive.")
+        self.capacity = capacity
+        self._keys: List[Optional[int]] = [None] * capacity
+        self._values: List[object] = [None] * capacity
+        self._depths: List[int] = [0] * capacity
+        self._generations: List[int] = [0] * capacity
+        self.generation = 0
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.replacements = 0
+        self.rejections = 0
+
+    def new_generation(self) -> None:
+        """Marks the start of a new search: entries from earlier searches become replaceable first."""
+        self.generation += 1
+
+    def probe(self, key: int) -> Optional[object]:
+        """Returns the stored value for a position hash, or None."""
+        slot = key % self.capacity
+        if self._keys[slot] == key:
+            self.hits += 1
+            return self._values[slot]
+        self.misses += 1
+        return None
+
+    def probe_entry(self, key: int) -> Optional[Tuple[object, int]]:
+        """Returns (value, depth) for a position hash, or None."""
+        slot = key % self.capacity
+        if self._keys[slot] == key:
+            self.hits += 1
+            return self._values[slot], self._depths[slot]
+        self.misses += 1
+        return None
+
+    def store(self, key: int, value: object, depth: int = 0) -> bool:
+        """
+        Stores a value for a position hash, subject to the replacement policy.
+
+        Args:
+            key: The position hash (see game_hash).
+            value: Any evaluation (a score, a (visits, total) pair, a best move, ...).
+            depth: How much search the value represents; deeper entries are kept over shallower ones.
+
+        Returns:
+            True if the value was stored.
+        """
+        slot = key % self.capacity
+        stored_key = self._keys[slot]
+        if stored_key is None:
+            self.size += 1
+        elif stored_key != key and self._generations[slot] == self.generation and self._depths[slot] > depth:
+            self.rejections += 1
+            return False
+        elif stored_key != key:
+            self.replacements += 1
+        self._keys[slot] = key
+        self._values[slot] = value
+        self._depths[slot] = depth
+        self._generations[slot] = self.generation
+        return True
+
+    def clear(self) -> None:
+        """Empties the table and resets its statistics."""
+        self.__init__(self.capacity)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __contains__(self, key: int) -> bool:
+        return self._keys[key % self.capacity] == key
+
+    def __repr__(self) -> str:
+        return (f"<TranspositionTable {self.size}/{self.capacity} entries, {self.hits} hits, {self.misses} misses, "
+                f"{self.replacements} replaced, {self.rejections} rejected>")
+
+
+# --- Example Usage ---
+if __name__ == "__main__":
+    from catalog import load_card_maps
+    from deck import Deck, load_deck_identifiers_from_file
+    from events import NULL_SINK
+    from game_state import GameState
+    from legal_actions import END_TURN_ACTION, LegalActionGenerator
+    from player import Player
+    from rng import game_rng
+
+    all_cards_by_id, _, _ = load_card_maps()
+    name_resolver = next(iter(all_cards_by_id.values())).table.name_resolver
+    names = load_deck_identifiers_from_file("Decks/BouncingBosses.txt")
+
+    # Incremental hashes must always equal the from-scratch hash, including after undo
+    steps, mismatches = 0, 0
+    table = TranspositionTable(1 << 14)
+    for game_index in range(100):
+        rng = game_rng(2, game_index)
+        game = GameState(Player("A", Deck(names, name_resolver, rng), 0, NULL_SINK),
+                         Player("B", Deck(names, name_resolver, rng), 1, NULL_SINK), NULL_SINK)
+        keys = game.players[0].catalog.zobrist_keys
+        generator = LegalActionGenerator(game)
+        start, start_hash = game.mark(), game_hash(game)
+        while not game.game_over and game.turn < 30:
+            mismatches += any(player.zobrist != keys.zone_hash(player) for player in game.players)
+            position = game_hash(game)
+            if table.probe(position) is None:
+                table.store(position, steps)
+            actions = generator.actions()
+            generator.apply(rng.choice(actions[:-1]) if len(actions) > 1 and rng.random() < 0.85 else END_TURN_ACTION)
+            steps += 1
+        game.undo_to(start)
+        mismatches += game_hash(game) != start_hash
+    print(f"\n{steps} positions, {mismatches} incremental/full hash mismatches")
+    print(table)
+
+    # Determinized search copies (hidden cards re-dealt by MCTSAgent) must hash the same way
+    from mcts_agent import MCTSAgent
+    agent = MCTSAgent()
+    steps, mismatches = 0, 0
+    for game_index in range(20):
+        rng = game_rng(2, game_index)
+        game = GameState(Player("A", Deck(names, name_resolver, rng), 0, NULL_SINK),
+                         Player("B", Deck(names, name_resolver, rng), 1, NULL_SINK), NULL_SINK)
+        generator = LegalActionGenerator(game)
+        while not game.game_over and game.turn < 6:
+            actions = generator.actions()
+            generator.apply(rng.choice(actions[:-1]) if len(actions) > 1 and rng.random() < 0.85 else END_TURN_ACTION)
+        search_game = agent._determinize(game)
+        keys = search_game.players[0].catalog.zobrist_keys
+        generator = LegalActionGenerator(search_game)
+        while not search_game.game_over and search_game.turn < 20:
+            mismatches += any(player.zobrist != keys.zone_hash(player) for player in search_game.players)
+            actions = generator.actions()
+            generator.apply(rng.choice(actions[:-1]) if len(actions) > 1 and rng.random() < 0.85 else END_TURN_ACTION)
+            steps += 1
+    print(f"{steps} positions in determinized copies, {mismatches} incremental/full hash mismatches")
+
+    # Two action orders, one position
+    rng = game_rng(2, 0)
+    game = GameState(Player("A", Deck(names, name_resolver, rng), 0, NULL_SINK),
+                     Player("B", Deck(names, name_resolver, rng), 1, NULL_SINK), NULL_SINK)
+    for _ in range(6):  # Get a dry character on the board for the active player
+        generator = LegalActionGenerator(game)
+        actions = generator.actions()
+        generator.apply(actions[len(actions) // 2] if len(actions) > 1 else END_TURN_ACTION)
+        game.next_turn()
+    player = game.active_player
+    inkable = next((card_id for card_id in player.hand if player.card(card_id).inkable), None)
+    quester = next((p for p in player.play_area if p['dry'] and not p['exerted'] and player.card(p['card_id']).lore), None)
+    if inkable is not None and quester is not None and not player.has_inked_this_turn:
+        mark = game.mark()
+        player.ink_card(inkable)
+        player.quest(quester)
+        ink_then_quest = game_hash(game)
+        game.undo_to(mark)
+        player.quest(quester)
+        player.ink_card(inkable)
+        print(f"Ink then quest == quest then ink: {ink_then_quest == game_hash(game)}")